@@ -5,7 +5,7 @@ from logging.config import fileConfig
 from pathlib import Path
 
 from alembic import context
-from sqlalchemy import engine_from_config, pool
+from sqlalchemy import engine_from_config, event, pool
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -19,6 +19,41 @@ logger = logging.getLogger("alembic.env")
 # we've opted to manage the schema manually, so there is no SQLAlchemy metadata.
 target_metadata = None
 
+# Per-connection pragmas applied when ``build_alembic_config(tune=True)`` is used.
+# journal_mode is persistent and handled separately so it is only switched once.
+_TUNING_PRAGMAS = (
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA mmap_size = 30000000000",
+    "PRAGMA cache_size = -262144",
+)
+
+
+def _tune_sqlite_connection(dbapi_connection, _connection_record) -> None:
+    """Apply WAL and write-friendly pragmas before migrations run."""
+
+    cursor = dbapi_connection.cursor()
+    try:
+        mode = cursor.execute("PRAGMA journal_mode").fetchone()
+        if not mode or str(mode[0]).lower() != "wal":
+            cursor.execute("PRAGMA journal_mode = WAL")
+        for statement in _TUNING_PRAGMAS:
+            cursor.execute(statement)
+    finally:
+        cursor.close()
+
+
+def _sync_user_version(connection) -> None:
+    """Mirror "at head" into PRAGMA user_version for the start-up fast path."""
+
+    from diskwatcher.db.migration import HEAD_REVISION, SCHEMA_VERSION
+
+    current = context.get_context().get_current_revision()
+    user_version = SCHEMA_VERSION if current == HEAD_REVISION else 0
+    connection.exec_driver_sql(f"PRAGMA user_version = {user_version}")
+    if connection.in_transaction():
+        connection.commit()
+
 
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode."""
@@ -42,11 +77,29 @@ def run_migrations_online() -> None:
         poolclass=pool.NullPool,
     )
 
-    with connectable.connect() as connection:
-        context.configure(connection=connection, target_metadata=target_metadata)
+    tune = bool(config.attributes.get("tune_sqlite")) and connectable.dialect.name == "sqlite"
+    if tune:
+        event.listen(connectable, "connect", _tune_sqlite_connection)
 
-        with context.begin_transaction():
-            context.run_migrations()
+    execution_options = config.attributes.get("execution_options")
+    if execution_options:
+        connectable = connectable.execution_options(**execution_options)
+
+    with connectable.connect() as connection:
+        try:
+            context.configure(connection=connection, target_metadata=target_metadata)
+
+            with context.begin_transaction():
+                context.run_migrations()
+
+            if connectable.dialect.name == "sqlite":
+                _sync_user_version(connection)
+        finally:
+            if tune:
+                try:
+                    connection.exec_driver_sql("PRAGMA optimize")
+                except Exception:  # pragma: no cover - best-effort planner refresh
+                    logger.debug("PRAGMA optimize failed after migrations", exc_info=True)
 
 
 if context.is_offline_mode():
@@ -17,9 +17,10 @@ _DEF_VOLUME_INDEX = "idx_jobs_volume"
 
 def upgrade() -> None:
     bind = op.get_bind()
-    inspector = sa.inspect(bind)
-    existing_tables = set(inspector.get_table_names())
-    if "jobs" in existing_tables:
+    existing = bind.exec_driver_sql(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'jobs'"
+    ).fetchone()
+    if existing is not None:
         # Catalogs created from the static schema already include the jobs
         # table and its indexes; skip creation in that case.
         return
@@ -0,0 +1,27 @@
+"""Track secondary indexes dropped while bulk archival scans run."""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "0007_deferred_indexes"
+down_revision = "0006_dashboard_summary_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE TABLE IF NOT EXISTS deferred_indexes (
+            name TEXT PRIMARY KEY,
+            tbl_name TEXT NOT NULL,
+            sql TEXT NOT NULL,
+            deferred_at TEXT NOT NULL
+        )
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE IF EXISTS deferred_indexes")
@@ -0,0 +1,36 @@
+"""Replace single-column recency indexes with covering composites."""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "0008_recent_activity_indexes"
+down_revision = "0007_deferred_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_files_last_event_timestamp")
+    op.execute("DROP INDEX IF EXISTS idx_volumes_last_event_timestamp")
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_files_recent "
+        "ON files (last_event_timestamp DESC, volume_id, path)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_volumes_recent "
+        "ON volumes (last_event_timestamp DESC, volume_id)"
+    )
+    # Refresh sqlite_stat1 so the planner sees the new indexes' selectivity.
+    op.execute("ANALYZE")
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_volumes_recent")
+    op.execute("DROP INDEX IF EXISTS idx_files_recent")
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_files_last_event_timestamp ON files (last_event_timestamp)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_volumes_last_event_timestamp ON volumes (last_event_timestamp)"
+    )
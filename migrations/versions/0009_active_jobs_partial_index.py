@@ -0,0 +1,23 @@
+"""Index only in-flight jobs instead of every historical status."""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "0009_active_jobs_partial_index"
+down_revision = "0008_recent_activity_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_jobs_status")
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_jobs_active "
+        "ON jobs (job_type, started_at) WHERE completed_at IS NULL"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_jobs_active")
+    op.execute("CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs (status)")
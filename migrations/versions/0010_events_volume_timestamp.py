@@ -0,0 +1,24 @@
+"""Index per-volume event timelines by recency."""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "0010_events_volume_timestamp"
+down_revision = "0009_active_jobs_partial_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_events_volume_ts ON events (volume_id, timestamp DESC)"
+    )
+    # volume_id is the leading column of the new index, so the single-column
+    # index only adds write amplification.
+    op.execute("DROP INDEX IF EXISTS idx_events_volume")
+
+
+def downgrade() -> None:
+    op.execute("CREATE INDEX IF NOT EXISTS idx_events_volume ON events (volume_id)")
+    op.execute("DROP INDEX IF EXISTS idx_events_volume_ts")
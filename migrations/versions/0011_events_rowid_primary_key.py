@@ -0,0 +1,67 @@
+"""Drop AUTOINCREMENT from events so inserts skip sqlite_sequence."""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "0011_events_rowid_primary_key"
+down_revision = "0010_events_volume_timestamp"
+branch_labels = None
+depends_on = None
+
+
+_EVENT_COLUMNS = "id, timestamp, event_type, path, directory, volume_id, process_id"
+
+
+def _rewrite_events(*, autoincrement: bool) -> None:
+    """Rebuild ``events`` with or without AUTOINCREMENT in one transaction."""
+
+    bind = op.get_bind()
+    table_sql = bind.exec_driver_sql(
+        "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'events'"
+    ).scalar()
+    if table_sql is None or ("AUTOINCREMENT" in table_sql.upper()) == autoincrement:
+        return
+
+    index_sql = [
+        row[0]
+        for row in bind.exec_driver_sql(
+            "SELECT sql FROM sqlite_master "
+            "WHERE type = 'index' AND tbl_name = 'events' AND sql IS NOT NULL"
+        )
+    ]
+    has_sequence = bind.exec_driver_sql(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_sequence'"
+    ).scalar()
+
+    primary_key = "INTEGER PRIMARY KEY AUTOINCREMENT" if autoincrement else "INTEGER PRIMARY KEY"
+    statements = [
+        "BEGIN;",
+        f"""
+        CREATE TABLE events_new (
+            id {primary_key},
+            timestamp TEXT NOT NULL,
+            event_type TEXT NOT NULL,
+            path TEXT NOT NULL,
+            directory TEXT NOT NULL,
+            volume_id TEXT NOT NULL,
+            process_id TEXT
+        );""",
+        f"INSERT INTO events_new ({_EVENT_COLUMNS}) SELECT {_EVENT_COLUMNS} FROM events;",
+        "DROP TABLE events;",
+        "ALTER TABLE events_new RENAME TO events;",
+    ]
+    statements.extend(f"{sql};" for sql in index_sql)
+    if has_sequence and not autoincrement:
+        statements.append("DELETE FROM sqlite_sequence WHERE name = 'events';")
+    statements.append("COMMIT;")
+
+    bind.connection.driver_connection.executescript("\n".join(statements))
+
+
+def upgrade() -> None:
+    _rewrite_events(autoincrement=False)
+
+
+def downgrade() -> None:
+    _rewrite_events(autoincrement=True)
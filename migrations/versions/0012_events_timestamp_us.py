@@ -0,0 +1,40 @@
+"""Add an integer epoch-microsecond timestamp to events."""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0012_events_timestamp_us"
+down_revision = "0011_events_rowid_primary_key"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("events", sa.Column("timestamp_us", sa.Integer(), nullable=True))
+    # julianday() is only precise to roughly a millisecond, so round there.
+    op.execute(
+        """
+        UPDATE events
+        SET timestamp_us =
+            CAST(ROUND((julianday(timestamp) - 2440587.5) * 86400000.0) AS INTEGER) * 1000
+        WHERE timestamp_us IS NULL
+        """
+    )
+    op.execute("DROP INDEX IF EXISTS idx_events_timestamp")
+    op.execute("DROP INDEX IF EXISTS idx_events_volume_ts")
+    op.execute("CREATE INDEX IF NOT EXISTS idx_events_timestamp_us ON events (timestamp_us)")
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_events_volume_ts ON events (volume_id, timestamp_us DESC)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_events_volume_ts")
+    op.execute("DROP INDEX IF EXISTS idx_events_timestamp_us")
+    op.execute("CREATE INDEX IF NOT EXISTS idx_events_timestamp ON events (timestamp)")
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_events_volume_ts ON events (volume_id, timestamp DESC)"
+    )
+    op.drop_column("events", "timestamp_us")
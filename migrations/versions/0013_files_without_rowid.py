@@ -0,0 +1,67 @@
+"""Cluster files on its (volume_id, path) key as a WITHOUT ROWID table."""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "0013_files_without_rowid"
+down_revision = "0012_events_timestamp_us"
+branch_labels = None
+depends_on = None
+
+
+_FILE_COLUMNS = (
+    "volume_id, path, directory, size_bytes, modified_time, created_time, "
+    "last_event_timestamp, last_event_type, is_deleted"
+)
+
+
+def _rewrite_files(*, without_rowid: bool) -> None:
+    """Rebuild ``files`` with or without rowid storage in one transaction."""
+
+    bind = op.get_bind()
+    table_sql = bind.exec_driver_sql(
+        "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'files'"
+    ).scalar()
+    if table_sql is None or ("WITHOUT ROWID" in table_sql.upper()) == without_rowid:
+        return
+
+    index_sql = [
+        row[0]
+        for row in bind.exec_driver_sql(
+            "SELECT sql FROM sqlite_master "
+            "WHERE type = 'index' AND tbl_name = 'files' AND sql IS NOT NULL"
+        )
+    ]
+    suffix = " WITHOUT ROWID" if without_rowid else ""
+    statements = [
+        "BEGIN;",
+        f"""
+        CREATE TABLE files_new (
+            volume_id TEXT NOT NULL,
+            path TEXT NOT NULL,
+            directory TEXT NOT NULL,
+            size_bytes INTEGER,
+            modified_time TEXT,
+            created_time TEXT,
+            last_event_timestamp TEXT,
+            last_event_type TEXT,
+            is_deleted INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (volume_id, path)
+        ){suffix};""",
+        f"INSERT INTO files_new ({_FILE_COLUMNS}) SELECT {_FILE_COLUMNS} FROM files;",
+        "DROP TABLE files;",
+        "ALTER TABLE files_new RENAME TO files;",
+    ]
+    statements.extend(f"{sql};" for sql in index_sql)
+    statements.append("COMMIT;")
+
+    bind.connection.driver_connection.executescript("\n".join(statements))
+
+
+def upgrade() -> None:
+    _rewrite_files(without_rowid=True)
+
+
+def downgrade() -> None:
+    _rewrite_files(without_rowid=False)
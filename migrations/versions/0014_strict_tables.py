@@ -0,0 +1,122 @@
+"""Declare the catalog tables STRICT so column types are enforced on write."""
+
+import logging
+import re
+import sqlite3
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "0014_strict_tables"
+down_revision = "0013_files_without_rowid"
+branch_labels = None
+depends_on = None
+
+
+_STRICT_TABLES = ("events", "volumes", "files", "jobs")
+_STRICT_SUFFIX = re.compile(r"(,\s*|\s+)STRICT\s*$", re.IGNORECASE)
+_WITHOUT_ROWID_SUFFIX = re.compile(r"WITHOUT\s+ROWID\s*$", re.IGNORECASE)
+
+logger = logging.getLogger("alembic.env")
+
+
+def _strict_supported() -> bool:
+    return sqlite3.sqlite_version_info >= (3, 37, 0)
+
+
+def _table_definition(table_sql: str, table: str, *, strict: bool) -> str:
+    """Return ``table_sql`` renamed to ``<table>_new`` with STRICT toggled."""
+
+    sql = re.sub(
+        rf'^CREATE TABLE\s+("?){table}\1',
+        f"CREATE TABLE {table}_new",
+        table_sql.strip(),
+        count=1,
+    )
+    sql = _STRICT_SUFFIX.sub("", sql)
+    if strict:
+        sql += ", STRICT" if _WITHOUT_ROWID_SUFFIX.search(sql) else " STRICT"
+    return sql
+
+
+def _integer_value(bind, table: str, column: str, *, required: bool) -> str:
+    """Return the copy expression for INTEGER ``column`` of a loose table.
+
+    INTEGER affinity already stored anything numeric as an integer, so other
+    values (non-numeric text, fractional reals, blobs) have no lossless
+    integer form and STRICT would reject them. Nullable columns keep those
+    rows with NULL in place of the value and the count is logged; required
+    columns abort the upgrade instead of inventing a value.
+    """
+
+    bad = bind.exec_driver_sql(
+        f"SELECT COUNT(*) FROM {table} "
+        f"WHERE typeof({column}) NOT IN ('integer', 'null')"
+    ).scalar()
+    if not bad:
+        return column
+    if required:
+        raise RuntimeError(
+            f"{table}.{column} holds {bad} non-integer value(s) and cannot be "
+            "NULL; fix or delete those rows before upgrading to STRICT tables"
+        )
+    logger.warning(
+        "strict_rewrite_nulled table=%s column=%s rows=%d", table, column, bad
+    )
+    return f"CASE WHEN typeof({column}) = 'integer' THEN {column} END"
+
+
+def _rewrite_table(table: str, *, strict: bool) -> None:
+    """Rebuild ``table`` with or without STRICT typing in one transaction."""
+
+    bind = op.get_bind()
+    table_sql = bind.exec_driver_sql(
+        "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+    ).scalar()
+    if table_sql is None or bool(_STRICT_SUFFIX.search(table_sql)) == strict:
+        return
+
+    columns = bind.exec_driver_sql(f"PRAGMA table_info({table})").fetchall()
+    names = ", ".join(row[1] for row in columns)
+    # Loose tables may hold text in INTEGER columns, which STRICT rejects.
+    values = ", ".join(
+        _integer_value(bind, table, name, required=bool(notnull or pk))
+        if strict and decl.upper() == "INTEGER"
+        else name
+        for _, name, decl, notnull, _, pk in columns
+    )
+    index_sql = [
+        row[0]
+        for row in bind.exec_driver_sql(
+            "SELECT sql FROM sqlite_master "
+            "WHERE type = 'index' AND tbl_name = ? AND sql IS NOT NULL",
+            (table,),
+        )
+    ]
+    statements = [
+        "BEGIN;",
+        f"{_table_definition(table_sql, table, strict=strict)};",
+        f"INSERT INTO {table}_new ({names}) SELECT {values} FROM {table};",
+        f"DROP TABLE {table};",
+        f"ALTER TABLE {table}_new RENAME TO {table};",
+    ]
+    statements.extend(f"{sql};" for sql in index_sql)
+    statements.append("COMMIT;")
+
+    bind.connection.driver_connection.executescript("\n".join(statements))
+
+
+def upgrade() -> None:
+    # STRICT tables need SQLite 3.37+; older libraries keep the loose tables.
+    if not _strict_supported():
+        return
+    for table in _STRICT_TABLES:
+        _rewrite_table(table, strict=True)
+
+
+def downgrade() -> None:
+    if not _strict_supported():
+        return
+    for table in _STRICT_TABLES:
+        _rewrite_table(table, strict=False)
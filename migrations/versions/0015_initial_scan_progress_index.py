@@ -0,0 +1,23 @@
+"""Index initial_scan jobs for the live progress monitor."""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "0015_initial_scan_progress_index"
+down_revision = "0014_strict_tables"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_jobs_initial_scan_progress "
+        "ON jobs (job_type, started_at, owner_pid, completed_at, status) "
+        "WHERE job_type = 'initial_scan'"
+    )
+    op.execute("ANALYZE jobs")
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_jobs_initial_scan_progress")
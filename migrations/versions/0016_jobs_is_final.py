@@ -0,0 +1,27 @@
+"""Expose a virtual is_final flag on jobs for progress aggregates."""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "0016_jobs_is_final"
+down_revision = "0015_initial_scan_progress_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    rows = conn.exec_driver_sql("PRAGMA table_xinfo(jobs)").fetchall()
+    if any(row[1] == "is_final" for row in rows):
+        return
+    # VIRTUAL generated columns can be added in place and cost no storage.
+    op.execute(
+        "ALTER TABLE jobs ADD COLUMN is_final INTEGER GENERATED ALWAYS AS ("
+        "status IN ('complete', 'failed', 'interrupted', 'cancelled', "
+        "'removed', 'stopped', 'stale')) VIRTUAL"
+    )
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE jobs DROP COLUMN is_final")
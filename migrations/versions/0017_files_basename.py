@@ -0,0 +1,26 @@
+"""Expose a virtual basename column on files for name searches."""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "0017_files_basename"
+down_revision = "0016_jobs_is_final"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    rows = conn.exec_driver_sql("PRAGMA table_xinfo(files)").fetchall()
+    if any(row[1] == "basename" for row in rows):
+        return
+    # rtrim() strips the trailing non-slash run, leaving the parent prefix.
+    op.execute(
+        "ALTER TABLE files ADD COLUMN basename TEXT GENERATED ALWAYS AS ("
+        "substr(path, length(rtrim(path, replace(path, '/', ''))) + 1)) VIRTUAL"
+    )
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE files DROP COLUMN basename")
@@ -0,0 +1,26 @@
+"""Cache live mount lookups so status calls can skip lsblk/findmnt."""
+
+import sqlite3
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "0018_mount_cache"
+down_revision = "0017_files_basename"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    strict = " STRICT" if sqlite3.sqlite_version_info >= (3, 37, 0) else ""
+    op.execute(
+        "CREATE TABLE IF NOT EXISTS mount_cache ("
+        "directory TEXT PRIMARY KEY, "
+        "payload_json TEXT NOT NULL, "
+        f"refreshed_at REAL NOT NULL){strict}"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE IF EXISTS mount_cache")
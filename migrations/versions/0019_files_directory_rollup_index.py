@@ -0,0 +1,25 @@
+"""Cover directory search rollups with one files index."""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "0019_files_directory_rollup_index"
+down_revision = "0018_mount_cache"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Leads with directory, so it also serves every lookup the old
+    # single-column index did; keeping both would double the write cost.
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_files_directory_rollup "
+        "ON files (directory, volume_id, is_deleted, last_event_timestamp)"
+    )
+    op.execute("DROP INDEX IF EXISTS idx_files_directory")
+
+
+def downgrade() -> None:
+    op.execute("CREATE INDEX IF NOT EXISTS idx_files_directory ON files (directory)")
+    op.execute("DROP INDEX IF EXISTS idx_files_directory_rollup")
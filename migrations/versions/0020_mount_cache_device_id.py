@@ -0,0 +1,22 @@
+"""Record the st_dev of cached mount lookups so remounts invalidate them."""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "0020_mount_cache_device_id"
+down_revision = "0019_files_directory_rollup_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    rows = conn.exec_driver_sql("PRAGMA table_xinfo(mount_cache)").fetchall()
+    if any(row[1] == "device_id" for row in rows):
+        return
+    op.execute("ALTER TABLE mount_cache ADD COLUMN device_id INTEGER")
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE mount_cache DROP COLUMN device_id")
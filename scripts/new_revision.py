@@ -12,7 +12,7 @@ if str(ROOT) not in sys.path:
 
 from alembic import command
 
-from diskwatcher.db.migration import build_alembic_config
+from diskwatcher.db.migration import build_alembic_config, optimize_database
 
 
 def parse_args() -> argparse.Namespace:
@@ -40,7 +40,12 @@ def main() -> None:
     config = build_alembic_config(
         ini_path=args.ini,
         database_url=args.url,
+        tune=True,
+        execution_options={"compiled_cache": {}},
     )
+    if args.autogenerate:
+        # Autogenerate reflects the live catalog; fresh stats keep it quick.
+        optimize_database(args.url)
     command.revision(
         config,
         message=args.message,
@@ -1,20 +1,20 @@
+import atexit
 import json
 import logging
 import os
-import re
+import shutil
+import signal
 import sys
 import time
 import sqlite3
-from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from threading import Event, Lock, Thread
-from typing import Any, Dict, List, Optional
-from urllib.parse import urlparse, unquote
+from threading import Event, Thread, current_thread, main_thread
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
 import typer
 
-from diskwatcher.core.manager import DiskWatcherManager
-from diskwatcher.core.inspector import suggest_directories
 from diskwatcher.utils import config as config_utils
 from diskwatcher.utils.logging import (
     LOG_DIR,
@@ -27,7 +27,9 @@ from diskwatcher.utils.logging import (
 from diskwatcher.utils.devices import get_mount_info
 from diskwatcher.db import (
     init_db,
+    init_db_readonly,
     query_events,
+    read_snapshot,
     fetch_jobs,
     ensure_volume_label_indices,
 )
@@ -37,10 +39,16 @@ from diskwatcher.db.events import (
     summarize_files,
     query_events_since,
     fetch_volume_metadata,
+    fetch_volume_overview,
+    fetch_cached_mount_info,
+    store_mount_info,
 )
 from diskwatcher.db.jobs import cleanup_stale_jobs
-from diskwatcher.db.migration import upgrade as migrate_upgrade, build_alembic_config
-from diskwatcher.utils.labels import LABEL_EXPORT_COLUMNS, build_label_rows
+from diskwatcher.db.migration import (
+    upgrade as migrate_upgrade,
+    optimize_connection,
+)
+from diskwatcher.utils.paths import resolve_path
 
 
 _LOG_LEVEL_CHOICES = {
@@ -72,32 +80,110 @@ _VOLUME_IDENTITY_COLUMNS = (
     "identity_refreshed_at",
 )
 
-_LSBLK_COLUMN_MAP = {
-    "NAME": "lsblk_name",
-    "PATH": "lsblk_path",
-    "MODEL": "lsblk_model",
-    "SERIAL": "lsblk_serial",
-    "VENDOR": "lsblk_vendor",
-    "SIZE": "lsblk_size",
-    "FSVER": "lsblk_fsver",
-    "PTTYPE": "lsblk_pttype",
-    "PTUUID": "lsblk_ptuuid",
-    "PARTTYPE": "lsblk_parttype",
-    "PARTUUID": "lsblk_partuuid",
-    "PARTTYPENAME": "lsblk_parttypename",
-    "WWN": "lsblk_wwn",
-    "MAJ:MIN": "lsblk_maj_min",
-}
+# Stored volume counters and the aggregate aliases status/dashboard print.
+_VOLUME_COUNT_ALIASES = (
+    ("event_count", "total_events"),
+    ("created_count", "created"),
+    ("modified_count", "modified"),
+    ("deleted_count", "deleted"),
+)
+_VOLUME_USAGE_COLUMNS = (
+    "usage_total_bytes",
+    "usage_used_bytes",
+    "usage_free_bytes",
+    "usage_refreshed_at",
+)
 
-_INITIAL_SCAN_FINAL_STATUSES = {
-    "complete",
-    "failed",
-    "interrupted",
-    "cancelled",
-    "removed",
-    "stopped",
-    "stale",
-}
+_BYTE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+
+# Free-list pages `dev vacuum` releases per incremental run by default.
+_INCREMENTAL_VACUUM_PAGES = 200
+# Full rewrites are skipped while less of the file than this is free.
+_VACUUM_MIN_FREE_PCT = 5.0
+# Target of the dev maintenance commands when --url is omitted.
+_DEFAULT_DB_URL = f"sqlite:///{DB_PATH}"
+# Matches the busy_timeout every catalog connection is opened with.
+_MAINTENANCE_BUSY_TIMEOUT_MS = 10000
+_CHECK_FETCH_ROWS = 100
+
+# Live mount lookups shell out to lsblk/findmnt; status reuses them this long.
+_MOUNT_CACHE_TTL_SECONDS = 60.0
+_MOUNT_LOOKUP_WORKERS = 8
+
+# mount_metadata payload key -> stored volumes column.
+_MOUNT_SOURCE_KEYS = MappingProxyType(
+    {
+        "device": "mount_device",
+        "mount_point": "mount_point",
+        "uuid": "mount_uuid",
+        "label": "mount_label",
+        "volume_id": "mount_volume_id",
+    }
+)
+
+_LSBLK_COLUMN_MAP = MappingProxyType(
+    {
+        "NAME": "lsblk_name",
+        "PATH": "lsblk_path",
+        "MODEL": "lsblk_model",
+        "SERIAL": "lsblk_serial",
+        "VENDOR": "lsblk_vendor",
+        "SIZE": "lsblk_size",
+        "FSVER": "lsblk_fsver",
+        "PTTYPE": "lsblk_pttype",
+        "PTUUID": "lsblk_ptuuid",
+        "PARTTYPE": "lsblk_parttype",
+        "PARTUUID": "lsblk_partuuid",
+        "PARTTYPENAME": "lsblk_parttypename",
+        "WWN": "lsblk_wwn",
+        "MAJ:MIN": "lsblk_maj_min",
+    }
+)
+# Pre-split pairs for the per-row rebuilds in _extract_mount_metadata.
+_MOUNT_SOURCE_ITEMS = tuple(_MOUNT_SOURCE_KEYS.items())
+_LSBLK_COLUMN_ITEMS = tuple(_LSBLK_COLUMN_MAP.items())
+
+# Mirrors the jobs.is_final generated column (migration 0016).
+_INITIAL_SCAN_FINAL_STATUSES = frozenset(
+    {
+        "complete",
+        "failed",
+        "interrupted",
+        "cancelled",
+        "removed",
+        "stopped",
+        "stale",
+    }
+)
+
+# One aggregate round-trip per poll; malformed or non-numeric progress
+# payloads contribute nothing to files_scanned.
+_INITIAL_SCAN_PROGRESS_SQL = (
+    "SELECT COUNT(*), "
+    "COALESCE(SUM((completed_at IS NOT NULL AND completed_at != '') OR is_final), 0), "
+    "COALESCE(SUM(status = 'failed'), 0), "
+    "COALESCE(SUM(CASE WHEN json_valid(progress_json) "
+    "AND json_type(progress_json, '$.files_scanned') IN ('integer', 'real') "
+    "THEN MAX(0, CAST(json_extract(progress_json, '$.files_scanned') AS INTEGER)) "
+    "END), 0) "
+    "FROM jobs "
+    "WHERE job_type = 'initial_scan' "
+    "AND started_at >= ?"
+)
+_INITIAL_SCAN_FINGERPRINT_SQL = (
+    "SELECT MAX(updated_at), COUNT(*) FROM jobs "
+    "WHERE job_type = 'initial_scan' AND started_at >= ?"
+)
+_ACTIVE_BATCH_START_SQL = (
+    "SELECT MIN(started_at) FROM jobs "
+    "WHERE job_type = 'initial_scan' AND completed_at IS NULL"
+)
+# The monitor polls these repeatedly, so each owner-filtered variant is a
+# fixed string and stays in the connection's prepared-statement cache.
+_OWNER_FILTER = " AND owner_pid = ?"
+_INITIAL_SCAN_PROGRESS_BY_OWNER_SQL = _INITIAL_SCAN_PROGRESS_SQL + _OWNER_FILTER
+_INITIAL_SCAN_FINGERPRINT_BY_OWNER_SQL = _INITIAL_SCAN_FINGERPRINT_SQL + _OWNER_FILTER
+_ACTIVE_BATCH_START_BY_OWNER_SQL = _ACTIVE_BATCH_START_SQL + _OWNER_FILTER
 
 
 app = typer.Typer(help="DiskWatcher CLI - Monitor filesystem events.", no_args_is_help=True)
@@ -127,7 +213,7 @@ def _get_config_value(key: str) -> Any:
 
 
 def _collect_initial_scan_progress(
-    conn: sqlite3.Connection,
+    conn: Union[sqlite3.Connection, sqlite3.Cursor],
     started_at: str,
     *,
     owner_pid: Optional[str] = None,
@@ -135,42 +221,16 @@ def _collect_initial_scan_progress(
     """Aggregate initial scan progress for jobs created at/after started_at."""
 
     try:
-        query = (
-            "SELECT status, completed_at, progress_json "
-            "FROM jobs "
-            "WHERE job_type = 'initial_scan' "
-            "AND started_at >= ?"
-        )
-        params: list[Any] = [started_at]
-        if owner_pid is not None:
-            query += " AND owner_pid = ?"
-            params.append(owner_pid)
-
-        rows = conn.execute(query, tuple(params)).fetchall()
+        if owner_pid is None:
+            row = conn.execute(_INITIAL_SCAN_PROGRESS_SQL, (started_at,)).fetchone()
+        else:
+            row = conn.execute(
+                _INITIAL_SCAN_PROGRESS_BY_OWNER_SQL, (started_at, owner_pid)
+            ).fetchone()
     except sqlite3.Error:
         return {"total": 0, "completed": 0, "running": 0, "failed": 0, "files_scanned": 0}
 
-    total = len(rows)
-    completed = 0
-    failed = 0
-    files_scanned = 0
-
-    for status, completed_at, progress_json in rows:
-        if completed_at or status in _INITIAL_SCAN_FINAL_STATUSES:
-            completed += 1
-        if status == "failed":
-            failed += 1
-
-        if not progress_json:
-            continue
-        try:
-            payload = json.loads(progress_json)
-        except json.JSONDecodeError:
-            continue
-        files_value = payload.get("files_scanned")
-        if isinstance(files_value, (int, float)):
-            files_scanned += max(0, int(files_value))
-
+    total, completed, failed, files_scanned = row
     running = max(total - completed, 0)
     return {
         "total": total,
@@ -181,6 +241,31 @@ def _collect_initial_scan_progress(
     }
 
 
+def _initial_scan_fingerprint(
+    conn: Union[sqlite3.Connection, sqlite3.Cursor],
+    started_at: str,
+    *,
+    owner_pid: Optional[str] = None,
+) -> Optional[Tuple[str, Optional[str], int]]:
+    """Return a cheap change marker for the jobs `_collect_initial_scan_progress` reads."""
+
+    try:
+        if owner_pid is None:
+            row = conn.execute(_INITIAL_SCAN_FINGERPRINT_SQL, (started_at,)).fetchone()
+        else:
+            row = conn.execute(
+                _INITIAL_SCAN_FINGERPRINT_BY_OWNER_SQL, (started_at, owner_pid)
+            ).fetchone()
+    except sqlite3.Error:
+        return None
+    return (started_at, row[0], row[1])
+
+
+_SPINNER = "|/-\\"
+_BAR_WIDTH = 24
+_BARS = tuple("#" * filled + "-" * (_BAR_WIDTH - filled) for filled in range(_BAR_WIDTH + 1))
+
+
 def _render_initial_scan_line(progress: Dict[str, int], tick: int) -> str:
     total = progress["total"]
     completed = progress["completed"]
@@ -188,46 +273,159 @@ def _render_initial_scan_line(progress: Dict[str, int], tick: int) -> str:
     failed = progress["failed"]
     files_scanned = progress["files_scanned"]
 
+    spinner = _SPINNER[tick & 3]
     if total <= 0:
-        spinner = "|/-\\"[tick % 4]
         return f"initial scan {spinner} preparing jobs..."
 
-    width = 24
     ratio = completed / total if total else 0.0
-    filled = min(width, max(0, int(width * ratio)))
-    bar = "#" * filled + "-" * (width - filled)
-    spinner = "|/-\\"[tick % 4]
+    filled = min(_BAR_WIDTH, max(0, int(_BAR_WIDTH * ratio)))
+    bar = _BARS[filled]
     return (
         f"initial scan {spinner} [{bar}] {completed}/{total} drives"
         f" | files={files_scanned:,} | active={running} | failed={failed}"
     )
 
 
-def _monitor_initial_scan_progress(
-    conn: sqlite3.Connection,
-    started_at: str,
-    stop_event: Event,
-    conn_lock: Optional[Lock] = None,
-    *,
-    interval: float = 0.5,
-    owner_pid: Optional[str] = None,
-) -> None:
-    """Render a lightweight live progress line while initial scans are running."""
+def _line_buffered(stream: Any) -> Any:
+    """Return ``stream`` or a line-buffered view of its descriptor.
 
-    stream = sys.stderr
-    interactive = stream.isatty()
-    last_progress: Optional[Dict[str, int]] = None
-    next_non_tty_emit = time.monotonic()
+    Progress lines written to redirected output then reach the file once per
+    line without an explicit flush after every write.
+    """
+
+    if getattr(stream, "line_buffering", False):
+        return stream
+    try:
+        fd = stream.fileno()
+    except (AttributeError, OSError, ValueError):
+        reconfigure = getattr(stream, "reconfigure", None)
+        if reconfigure is not None:
+            reconfigure(line_buffering=True)
+        return stream
+    stream.flush()
+    return os.fdopen(fd, "w", buffering=1, encoding=getattr(stream, "encoding", None), closefd=False)
 
-    last_len = 0
-    tick = 0
 
-    tqdm_bar = None
-    if interactive:
+@lru_cache(maxsize=1)
+def _get_tqdm() -> Any:
+    """Return the tqdm bar class, or None when tqdm is unavailable."""
+
+    try:
+        from tqdm import tqdm  # type: ignore
+    except Exception:
+        return None
+    return tqdm
+
+
+@lru_cache(maxsize=1)
+def _get_orjson() -> Any:
+    """Return the orjson module, or None when it is not installed."""
+
+    try:
+        import orjson  # type: ignore[import-not-found]
+    except ImportError:
+        return None
+    return orjson
+
+
+# Reused encoders for the stdlib fallback. Raw UTF-8 and compact separators
+# keep the bytes identical to orjson's output.
+_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+_JSON_ENCODER_PRETTY = json.JSONEncoder(ensure_ascii=False, indent=2)
+
+
+def _json_bytes(payload: Any, *, indent: bool = True) -> bytes:
+    """Encode ``payload`` as UTF-8 JSON, using orjson's C encoder when present."""
+
+    orjson = _get_orjson()
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
         try:
-            from tqdm import tqdm  # type: ignore
+            return orjson.dumps(payload, option=option)
+        except TypeError:
+            # Integers beyond 64 bits and similar edge cases; defer to json.
+            pass
+    encoder = _JSON_ENCODER_PRETTY if indent else _JSON_ENCODER
+    return encoder.encode(payload).encode("utf-8")
+
+
+def _emit_json(payload: Any, *, indent: Optional[bool] = None) -> None:
+    """Write ``payload`` to stdout as one JSON document plus a newline.
+
+    With ``indent`` left as None the document is pretty-printed only when
+    stdout is a terminal; pipes and files get compact JSON.
+    """
+
+    if indent is None:
+        indent = _stdout_is_tty()
+    _write_stdout_bytes(_json_bytes(payload, indent=indent) + b"\n")
+
+
+def _stdout_is_tty() -> bool:
+    isatty = getattr(sys.stdout, "isatty", None)
+    return bool(isatty and isatty())
+
+
+def _emit_json_lines(
+    payloads: Iterable[Any], *, buffer: Optional[bytearray] = None
+) -> None:
+    """Write ``payloads`` as NDJSON with a single write and flush.
 
-            tqdm_bar = tqdm(
+    Pass a ``buffer`` to reuse one allocation across repeated batches; it is
+    cleared before encoding.
+    """
+
+    if buffer is None:
+        buffer = bytearray()
+    else:
+        buffer.clear()
+    for payload in payloads:
+        buffer += _json_bytes(payload, indent=False)
+        buffer += b"\n"
+    if buffer:
+        _write_stdout_bytes(buffer)
+
+
+def _write_stdout_bytes(data: Union[bytes, bytearray]) -> None:
+    stream = sys.stdout
+    buffer = getattr(stream, "buffer", None)
+    if buffer is None:
+        stream.write(data.decode("utf-8"))
+        stream.flush()
+        return
+    stream.flush()
+    buffer.write(data)
+    buffer.flush()
+
+
+class _InitialScanProgressRenderer:
+    """Draw initial scan progress as a tqdm bar, a redrawn line, or log lines."""
+
+    def __init__(self, stream: Any, *, interactive: bool) -> None:
+        self.stream = stream
+        self.interactive = interactive
+        self.last_progress: Optional[Dict[str, int]] = None
+        self.tick = 0
+        self._last_len = 0
+        self._next_plain_emit = time.monotonic()
+        self._bar: Any = None
+
+    @property
+    def spinning(self) -> bool:
+        """True when only the hand-drawn spinner line needs redrawing."""
+
+        return self.last_progress is not None and self.interactive and self._bar is None
+
+    def open_bar(self) -> None:
+        if self._bar is not None or not self.interactive:
+            return
+        tqdm = _get_tqdm()
+        if tqdm is None:
+            return
+        try:
+            self._bar = tqdm(
                 total=0,
                 desc="initial scan",
                 unit="drive",
@@ -235,213 +433,163 @@ def _monitor_initial_scan_progress(
                 leave=True,
             )
         except Exception:
-            tqdm_bar = None
+            self._bar = None
+
+    def close_bar(self) -> None:
+        if self._bar is not None:
+            self._bar.close()
+            self._bar = None
 
-    def _snapshot() -> Dict[str, int]:
-        if conn_lock:
-            with conn_lock:
-                return _collect_initial_scan_progress(conn, started_at, owner_pid=owner_pid)
-        return _collect_initial_scan_progress(conn, started_at, owner_pid=owner_pid)
+    def reset(self) -> None:
+        self.last_progress = None
+        self.tick = 0
+        self._last_len = 0
 
-    def _emit(progress: Dict[str, int], *, final: bool = False) -> None:
-        nonlocal last_len, next_non_tty_emit
-        nonlocal tqdm_bar
+    def emit(self, progress: Dict[str, int], *, final: bool = False) -> None:
+        previous = self.last_progress
+        self.last_progress = progress
 
-        if tqdm_bar is not None:
+        bar = self._bar
+        if bar is not None:
             total = progress["total"]
             completed = progress["completed"]
-            if tqdm_bar.total != total:
-                tqdm_bar.total = total
-            if completed < tqdm_bar.n:
-                tqdm_bar.n = completed
+            if bar.total != total:
+                bar.total = total
+            if completed < bar.n:
+                bar.n = completed
             else:
-                tqdm_bar.update(completed - tqdm_bar.n)
-            tqdm_bar.set_postfix(
+                bar.update(completed - bar.n)
+            bar.set_postfix(
                 files=f"{progress['files_scanned']:,}",
                 active=progress["running"],
                 failed=progress["failed"],
                 refresh=False,
             )
-            tqdm_bar.refresh()
+            bar.refresh()
             if final:
-                tqdm_bar.close()
+                self.close_bar()
             return
 
-        line = _render_initial_scan_line(progress, tick)
-        if interactive:
-            padded = line + (" " * max(last_len - len(line), 0))
+        line = _render_initial_scan_line(progress, self.tick)
+        if self.interactive:
+            padded = line + (" " * max(self._last_len - len(line), 0))
             suffix = "\n" if final else ""
-            stream.write(f"\r{padded}{suffix}")
-            stream.flush()
-            last_len = len(line)
+            self.stream.write(f"\r{padded}{suffix}")
+            self.stream.flush()
+            self._last_len = len(line)
             return
 
         now = time.monotonic()
-        should_emit = final or progress != last_progress or now >= next_non_tty_emit
-        if should_emit:
-            stream.write(f"{line}\n")
-            stream.flush()
-            next_non_tty_emit = now + 2.0
-
-    # Render immediately so users see feedback even on short scans.
-    initial = _snapshot()
-    _emit(initial)
-    last_progress = initial
-
-    while not stop_event.wait(interval):
-        progress = _snapshot()
-        _emit(progress)
-        last_progress = progress
-        tick += 1
-
-    final_progress = _snapshot()
-    _emit(final_progress, final=True)
+        changed = progress is not previous and progress != previous
+        if final or changed or now >= self._next_plain_emit:
+            # Line-buffered, so the newline itself pushes the write out.
+            self.stream.write(f"{line}\n")
+            self._next_plain_emit = now + 2.0
 
 
 def _monitor_initial_scan_batches(
-    conn: sqlite3.Connection,
+    database_path: Path,
     stop_event: Event,
-    conn_lock: Optional[Lock] = None,
     *,
     owner_pid: Optional[str] = None,
     interval: float = 0.5,
+    job_state_changed: Optional[Event] = None,
+    refresh_interval: float = 2.0,
+    abort_event: Optional[Event] = None,
 ) -> None:
     """Watch for initial_scan jobs and render progress for each batch.
 
     Auto-discovery can trigger new initial scans after the first startup scan,
     so this monitor runs for the duration of `diskwatcher run` and only emits
     output when scans are active.
+
+    With ``job_state_changed`` the catalog is only queried when the manager
+    signals a job transition or ``refresh_interval`` elapses (scan workers in
+    other processes cannot signal); the ``interval`` ticks in between merely
+    advance the spinner. Without it every tick queries the catalog.
+
+    Setting ``stop_event`` draws one final snapshot before returning; setting
+    ``abort_event`` as well (on Ctrl+C/SIGTERM) skips it so shutdown never
+    waits on the catalog.
     """
 
     stream = sys.stderr
     interactive = stream.isatty()
+    if not interactive:
+        stream = _line_buffered(stream)
+    renderer = _InitialScanProgressRenderer(stream, interactive=interactive)
+    # Autocommit: each poll is a lone SELECT, so the driver never wraps it in
+    # a BEGIN/COMMIT pair.
+    conn = init_db_readonly(database_path, isolation_level=None)
+    conn.execute("PRAGMA query_only = 1")
+    cursor = conn.cursor()
+    try:
+        current_batch_started_at: Optional[str] = None
+        last_fingerprint: Optional[Tuple[str, Optional[str], int]] = None
 
-    last_progress: Optional[Dict[str, int]] = None
-    next_non_tty_emit = time.monotonic()
-
-    current_batch_started_at: Optional[str] = None
-    tick = 0
-    last_len = 0
-
-    tqdm_bar = None
-
-    def _create_tqdm_bar() -> None:
-        nonlocal tqdm_bar
-        if tqdm_bar is not None or not interactive:
-            return
-        try:
-            from tqdm import tqdm  # type: ignore
-
-            tqdm_bar = tqdm(
-                total=0,
-                desc="initial scan",
-                unit="drive",
-                dynamic_ncols=True,
-                leave=True,
-            )
-        except Exception:
-            tqdm_bar = None
-
-    def _close_tqdm_bar() -> None:
-        nonlocal tqdm_bar
-        if tqdm_bar is not None:
-            tqdm_bar.close()
-            tqdm_bar = None
-
-    def _active_batch_start() -> Optional[str]:
-        query = (
-            "SELECT MIN(started_at) FROM jobs "
-            "WHERE job_type = 'initial_scan' "
-            "AND completed_at IS NULL"
-        )
-        params: list[Any] = []
-        if owner_pid is not None:
-            query += " AND owner_pid = ?"
-            params.append(owner_pid)
-
-        if conn_lock:
-            with conn_lock:
-                row = conn.execute(query, tuple(params)).fetchone()
-        else:
-            row = conn.execute(query, tuple(params)).fetchone()
-        if not row:
-            return None
-        return row[0]
-
-    def _snapshot(started_at: str) -> Dict[str, int]:
-        if conn_lock:
-            with conn_lock:
-                return _collect_initial_scan_progress(conn, started_at, owner_pid=owner_pid)
-        return _collect_initial_scan_progress(conn, started_at, owner_pid=owner_pid)
-
-    def _emit(progress: Dict[str, int], *, final: bool = False) -> None:
-        nonlocal last_len, next_non_tty_emit
-        nonlocal tqdm_bar
-        nonlocal tick
-
-        if tqdm_bar is not None:
-            total = progress["total"]
-            completed = progress["completed"]
-            if tqdm_bar.total != total:
-                tqdm_bar.total = total
-            if completed < tqdm_bar.n:
-                tqdm_bar.n = completed
+        def _active_batch_start() -> Optional[str]:
+            if owner_pid is None:
+                row = cursor.execute(_ACTIVE_BATCH_START_SQL).fetchone()
             else:
-                tqdm_bar.update(completed - tqdm_bar.n)
-            tqdm_bar.set_postfix(
-                files=f"{progress['files_scanned']:,}",
-                active=progress["running"],
-                failed=progress["failed"],
-                refresh=False,
-            )
-            tqdm_bar.refresh()
-            if final:
-                _close_tqdm_bar()
-            return
-
-        line = _render_initial_scan_line(progress, tick)
-        if interactive:
-            padded = line + (" " * max(last_len - len(line), 0))
-            suffix = "\n" if final else ""
-            stream.write(f"\r{padded}{suffix}")
-            stream.flush()
-            last_len = len(line)
-            return
-
-        now = time.monotonic()
-        should_emit = final or progress != last_progress or now >= next_non_tty_emit
-        if should_emit:
-            stream.write(f"{line}\n")
-            stream.flush()
-            next_non_tty_emit = now + 2.0
-
-    while not stop_event.wait(interval):
-        active_start = _active_batch_start()
-
-        if active_start is None:
-            if current_batch_started_at is not None:
-                final_progress = _snapshot(current_batch_started_at)
-                _emit(final_progress, final=True)
-                current_batch_started_at = None
-                last_progress = None
-                tick = 0
-                last_len = 0
-            continue
-
-        if current_batch_started_at is None:
-            current_batch_started_at = active_start
-            _create_tqdm_bar()
-
-        progress = _snapshot(current_batch_started_at)
-        _emit(progress)
-        last_progress = progress
-        tick += 1
-
-    if current_batch_started_at is not None:
-        final_progress = _snapshot(current_batch_started_at)
-        _emit(final_progress, final=True)
-    else:
-        _close_tqdm_bar()
+                row = cursor.execute(_ACTIVE_BATCH_START_BY_OWNER_SQL, (owner_pid,)).fetchone()
+            if not row:
+                return None
+            return row[0]
+
+        def _snapshot(started_at: str) -> Dict[str, int]:
+            nonlocal last_fingerprint
+            # Every job write bumps updated_at, so an unchanged fingerprint
+            # means the previous aggregate is still current.
+            fingerprint = _initial_scan_fingerprint(cursor, started_at, owner_pid=owner_pid)
+            if (
+                fingerprint is not None
+                and fingerprint == last_fingerprint
+                and renderer.last_progress is not None
+            ):
+                return renderer.last_progress
+            last_fingerprint = fingerprint
+            return _collect_initial_scan_progress(cursor, started_at, owner_pid=owner_pid)
+
+        next_refresh = time.monotonic()
+
+        while not stop_event.wait(interval):
+            if job_state_changed is not None:
+                now = time.monotonic()
+                if job_state_changed.is_set():
+                    job_state_changed.clear()
+                elif now < next_refresh:
+                    if renderer.spinning:
+                        renderer.tick += 1
+                        renderer.emit(renderer.last_progress)
+                    continue
+                next_refresh = now + refresh_interval
+
+            active_start = _active_batch_start()
+
+            if active_start is None:
+                if current_batch_started_at is not None:
+                    renderer.emit(_snapshot(current_batch_started_at), final=True)
+                    current_batch_started_at = None
+                    renderer.reset()
+                continue
+
+            if current_batch_started_at is None:
+                current_batch_started_at = active_start
+                renderer.open_bar()
+
+            renderer.emit(_snapshot(current_batch_started_at))
+            renderer.tick += 1
+
+        if abort_event is not None and abort_event.is_set():
+            renderer.close_bar()
+        elif current_batch_started_at is not None:
+            renderer.emit(_snapshot(current_batch_started_at), final=True)
+        else:
+            renderer.close_bar()
+    finally:
+        conn.close()
+        if stream is not sys.stderr:
+            stream.close()
 
 
 def _render_initial_scan_target_line(entry: Dict[str, Any]) -> str:
@@ -491,6 +639,30 @@ def configure_logging(
     setup_logging(level=_LOG_LEVEL_CHOICES[candidate])
 
 
+_HEARTBEAT_INTERVAL_SECONDS = 10.0
+
+
+def _install_shutdown_handlers(shutdown: Event) -> Dict[int, Any]:
+    """Route SIGINT/SIGTERM to ``shutdown`` and return the previous handlers."""
+
+    previous: Dict[int, Any] = {}
+    if current_thread() is not main_thread():
+        # Signal handlers can only be installed from the main thread.
+        return previous
+
+    def _handle(signum, _frame) -> None:
+        shutdown.set()
+
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        previous[signum] = signal.signal(signum, _handle)
+    return previous
+
+
+def _restore_signal_handlers(previous: Dict[int, Any]) -> None:
+    for signum, handler in previous.items():
+        signal.signal(signum, handler)
+
+
 @app.command()
 def run(
     directories: Optional[List[Path]] = typer.Argument(
@@ -542,21 +714,17 @@ def run(
     elif scan is not None:
         perform_scan = scan
 
-    def _resolve_path(candidate: Path) -> Path:
-        try:
-            return candidate.resolve()
-        except FileNotFoundError:
-            return candidate
-
     config_roots = _get_config_value("run.auto_discover_roots")
     configured_auto_roots = [Path(root).expanduser() for root in config_roots]
 
+    # Typer already resolves --discover-root and positional directories
+    # (resolve_path=True); only config-sourced roots need resolving here.
     if discover_roots:
-        auto_roots = [_resolve_path(Path(root)) for root in discover_roots]
+        auto_roots = list(discover_roots)
     elif configured_auto_roots:
-        auto_roots = [_resolve_path(root) for root in configured_auto_roots]
+        auto_roots = [resolve_path(root) for root in configured_auto_roots]
     elif directories:
-        auto_roots = [_resolve_path(Path(directory)) for directory in directories]
+        auto_roots = list(directories)
     else:
         auto_roots = []
 
@@ -572,6 +740,10 @@ def run(
     else:
         exclude_patterns = list(exclude_patterns_cfg) if exclude_patterns_cfg else []
 
+    from diskwatcher.core.inspector import suggest_directories
+    from diskwatcher.core.manager import DiskWatcherManager  # Pulls in watchdog.
+    from diskwatcher.db.maintenance import drop_hot_indexes, rebuild_hot_indexes
+
     manager = DiskWatcherManager(
         polling_interval=effective_polling_interval,
         exclude_patterns=exclude_patterns,
@@ -583,9 +755,15 @@ def run(
     except Exception:
         logger.debug("stale_job_cleanup_failed", exc_info=True)
 
+    if not perform_scan:
+        # Restore indexes left deferred by a scan that never finished.
+        try:
+            rebuild_hot_indexes(manager.conn, lock=manager.conn_lock)
+        except Exception:
+            logger.warning("deferred_index_rebuild_failed", exc_info=True)
+
     if directories:
-        for directory in directories:
-            manager.add_directory(Path(directory).resolve())
+        manager.add_directories_bulk((directory, None) for directory in directories)
     else:
         if auto_roots:
             logger.info(
@@ -608,7 +786,9 @@ def run(
                         "volume_id": suggestion.volume_id,
                     },
                 )
-                manager.add_directory(suggestion.path, uuid=suggestion.volume_id)
+            manager.add_directories_bulk(
+                (suggestion.path, suggestion.volume_id) for suggestion in suggestions
+            )
 
     max_scan_workers = _get_config_value("run.max_scan_workers")
 
@@ -630,12 +810,24 @@ def run(
         manager.start_auto_discovery_thread()
 
     progress_stop = Event()
+    progress_abort = Event()
     progress_thread: Optional[Thread] = None
-    if perform_scan:
+    database_path = manager.database_path
+    # Batch --scan-only runs with redirected stderr already get the per-drive
+    # summary at the end, so the live monitor would only add log noise.
+    show_progress = perform_scan and (sys.stderr.isatty() or not scan_only)
+    if show_progress and database_path is not None:
+        # The monitor reads through its own read-only connection so its polls
+        # never queue behind ingest writes on manager.conn_lock.
         progress_thread = Thread(
             target=_monitor_initial_scan_batches,
-            args=(manager.conn, progress_stop, manager.conn_lock),
-            kwargs={"owner_pid": str(os.getpid())},
+            args=(database_path, progress_stop),
+            kwargs={
+                "owner_pid": str(os.getpid()),
+                "interval": 0.25,
+                "job_state_changed": manager.job_state_changed,
+                "abort_event": progress_abort,
+            },
             daemon=True,
         )
         progress_thread.start()
@@ -669,10 +861,19 @@ def run(
                 },
             )
         scan_results: List[Dict[str, Any]] = []
+        # Bulk inserts are cheaper without secondary index maintenance; the
+        # indexes are rebuilt once the sweep finishes (or on the next start).
+        try:
+            drop_hot_indexes(manager.conn, lock=manager.conn_lock)
+        except Exception:
+            logger.warning("deferred_index_drop_failed", exc_info=True)
         try:
             scan_results = manager.run_initial_scans(parallel=parallel, max_workers=max_scan_workers)
         finally:
-            pass
+            try:
+                rebuild_hot_indexes(manager.conn, lock=manager.conn_lock)
+            except Exception:
+                logger.warning("deferred_index_rebuild_failed", exc_info=True)
         if scan_results:
             typer.echo("Initial scan results:")
             for result in scan_results:
@@ -695,67 +896,31 @@ def run(
         manager.start_auto_discovery_thread()
 
     logger.info("Running... Press Ctrl+C to stop.")
-    counter = 0
+    shutdown = Event()
+    previous_handlers = _install_shutdown_handlers(shutdown)
+    started = time.monotonic()
     try:
-        while True:
-            time.sleep(1)
-            counter += 1
-            if counter % 10 == 0:
-                status_snapshot = manager.status()
-                logger.debug(
-                    "watcher_heartbeat",
-                    extra={"status": status_snapshot, "uptime_seconds": counter},
-                )
+        # Block until a signal arrives; wake only for the periodic heartbeat.
+        while not shutdown.wait(_HEARTBEAT_INTERVAL_SECONDS):
+            status_snapshot = manager.status()
+            logger.debug(
+                "watcher_heartbeat",
+                extra={
+                    "status": status_snapshot,
+                    "uptime_seconds": int(time.monotonic() - started),
+                },
+            )
     except KeyboardInterrupt:
         pass
     finally:
+        _restore_signal_handlers(previous_handlers)
+        # Only a signal ends the loop, so skip the monitor's final snapshot.
+        progress_abort.set()
         progress_stop.set()
         if progress_thread is not None:
             progress_thread.join(timeout=2.0)
         manager.stop_all()
 
-    # watches = []
-    # for d in directories:
-    #     try:
-    #         info = get_mount_info(d)
-    #         vol_id = info["uuid"] or info["label"] or info["device"]
-    #     except Exception as e:
-    #         logger.warning(f"Could not resolve ID for {d}: {e}")
-    #         vol_id = str(d)
-    #     watches.append((d, vol_id))
-    # logger.info(f"Watching {len(watches)} directories")
-
-    # threads = []
-    # for directory, vol_id in watches:
-    #     logger.info(f"Watching {vol_id} : {directory}")
-    #     watcher = DiskWatcher(directory, uuid=vol_id)
-    #     threads.append(watcher)
-    #     watcher.start()
-    #     threads.append(watcher)
-
-    # try:
-    #     while True:
-    #         time.sleep(1)
-    # except KeyboardInterrupt:
-    #     logger.info("Stopping all watchers...")
-    # finally:
-    #     for t in threads:
-    #         t.stop()
-    #     for t in threads:
-    #         t.join()
-
-    # uuid = None
-    # try:
-    #     info = get_mount_info(directory)
-    #     uuid = info["uuid"] or info["label"] or info["device"]
-    # except Exception as e:
-    #     logger.warning(f"Could not resolve volume UUID: {e}")
-    #     uuid = directory
-
-    # logger.info(f"Starting DiskWatcher on {directory}")
-    # watcher = DiskWatcher(directory, uuid=uuid)
-    # watcher.start()
-
 
 @app.command()
 def web(
@@ -785,6 +950,9 @@ def web(
 @config_app.command("show")
 def config_show(
     as_json: bool = typer.Option(False, "--json", help="Emit configuration as JSON."),
+    compact: bool = typer.Option(
+        False, "--compact", help="Emit compact JSON even when stdout is a terminal."
+    ),
 ) -> None:
     """Display the effective configuration values and their defaults."""
 
@@ -809,23 +977,26 @@ def config_show(
 
     if as_json:
         payload = {"options": data, "paths": storage_paths}
-        typer.echo(json.dumps(payload, indent=2))
+        _emit_json(payload, indent=False if compact else None)
         return
 
-    for key in sorted(data):
-        info = data[key]
-        typer.echo(key)
-        typer.echo(f"  value   : {_render_config_value(info['value'])} ({info['source']})")
-        typer.echo(f"  default : {_render_config_value(info['default'])}")
-        typer.echo(f"  type    : {info['type']}")
-        if info["choices"]:
-            typer.echo(f"  choices : {', '.join(info['choices'])}")
-        typer.echo(f"  desc    : {info['description']}")
-        typer.echo("")
-
-    typer.echo("Storage paths:")
+    lines: List[str] = []
+    echo = lines.append
+    for key, info in sorted(data.items()):
+        echo(
+            f"{key}\n"
+            f"  value   : {_render_config_value(info['value'])} ({info['source']})\n"
+            f"  default : {_render_config_value(info['default'])}\n"
+            f"  type    : {info['type']}"
+        )
+        if choices := info["choices"]:
+            echo(f"  choices : {', '.join(choices)}")
+        echo(f"  desc    : {info['description']}\n")
+
+    echo("Storage paths:")
     for label, value in storage_paths.items():
-        typer.echo(f"  {label.replace('_', ' '):<13} : {value}")
+        echo(f"  {label.replace('_', ' '):<13} : {value}")
+    typer.echo("\n".join(lines))
 
 
 @config_app.command("set")
@@ -859,8 +1030,40 @@ def config_path_cmd() -> None:
     typer.echo(str(config_utils.config_path()))
 
 
+_LOG_TAIL_BLOCK_SIZE = 64 * 1024
+
+
+def _read_log_tail(handle, lines: int) -> bytes:
+    """Return the last ``lines`` lines of a binary file handle.
+
+    Blocks are read backwards from the end of the file, so memory stays
+    bounded by the tail window rather than the size of the log.
+    """
+
+    handle.seek(0, os.SEEK_END)
+    position = handle.tell()
+    data = b""
+    # One extra newline accounts for the terminator on the final line.
+    while position > 0 and data.count(b"\n") <= lines:
+        step = min(_LOG_TAIL_BLOCK_SIZE, position)
+        position -= step
+        handle.seek(position)
+        data = handle.read(step) + data
+
+    tail = data.splitlines(keepends=True)[-lines:]
+    return b"".join(tail)
+
+
 @app.command()
-def log() -> None:
+def log(
+    tail: int = typer.Option(
+        200,
+        "--tail",
+        "-n",
+        min=0,
+        help="Number of trailing lines to show (0 prints the whole file).",
+    ),
+) -> None:
     """Show recent log entries"""
 
     candidates = []
@@ -873,7 +1076,13 @@ def log() -> None:
     for candidate in candidates:
         try:
             if candidate.exists():
-                typer.echo(candidate.read_text())
+                stdout = typer.get_binary_stream("stdout")
+                with candidate.open("rb") as handle:
+                    if tail == 0:
+                        shutil.copyfileobj(handle, stdout)
+                    else:
+                        stdout.write(_read_log_tail(handle, tail))
+                stdout.flush()
                 return
         except OSError as exc:
             typer.echo(f"Unable to read log file {candidate}: {exc}", err=True)
@@ -881,17 +1090,19 @@ def log() -> None:
     typer.echo("No logs found.")
 
 
-def _write_labels_csv(path: Path, columns: List[str], rows: List[Dict[str, Any]]) -> None:
+def _write_labels_csv(path: Path, columns: List[str], rows: Iterable[Dict[str, Any]]) -> None:
     import csv
 
     with path.open("w", newline="", encoding="utf-8") as handle:
         writer = csv.writer(handle)
         writer.writerow(columns)
-        for row in rows:
-            writer.writerow([row.get(column, "") for column in columns])
+        writer.writerows([row.get(column, "") for column in columns] for row in rows)
+
 
+@lru_cache(maxsize=1)
+def _get_openpyxl_workbook() -> Any:
+    """Return openpyxl's ``Workbook`` class, importing it on first use."""
 
-def _write_labels_xlsx(path: Path, columns: List[str], rows: List[Dict[str, Any]]) -> None:
     try:
         from openpyxl import Workbook  # type: ignore[import-not-found]
     except ImportError as exc:  # pragma: no cover - defensive guard
@@ -899,10 +1110,15 @@ def _write_labels_xlsx(path: Path, columns: List[str], rows: List[Dict[str, Any]
             "openpyxl is required for XLSX export; install it with "
             "'python -m pip install openpyxl' or use --format csv."
         ) from exc
+    return Workbook
+
 
-    workbook = Workbook()
-    sheet = workbook.active
-    sheet.title = "Volumes"
+def _write_labels_xlsx(path: Path, columns: List[str], rows: Iterable[Dict[str, Any]]) -> None:
+    Workbook = _get_openpyxl_workbook()
+
+    # Write-only workbooks stream rows to disk instead of holding the sheet.
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet("Volumes")
     sheet.append(columns)
     for row in rows:
         sheet.append([row.get(column, "") for column in columns])
@@ -928,6 +1144,8 @@ def labels(
 ) -> None:
     """Export tracked volumes to a spreadsheet suitable for label printers."""
 
+    from diskwatcher.utils.labels import LABEL_EXPORT_COLUMNS, iter_label_rows
+
     try:
         with init_db() as conn:
             ensure_volume_label_indices(conn)
@@ -940,7 +1158,7 @@ def labels(
         typer.echo("No volumes recorded yet.")
         raise typer.Exit(code=0)
 
-    rows = build_label_rows(records)
+    rows = iter_label_rows(records)
     remaining_columns = [column for column in LABEL_EXPORT_COLUMNS if column != "mount_label"]
     columns = ["label_index", "mount_label", "human_id"] + remaining_columns
 
@@ -967,45 +1185,51 @@ def labels(
         typer.echo(str(exc), err=True)
         raise typer.Exit(code=1)
 
-    typer.echo(f"Wrote {len(rows)} volume labels to {output_path} ({target_format}).")
+    typer.echo(f"Wrote {len(records)} volume labels to {output_path} ({target_format}).")
 
 
 @app.command()
 def status(
     limit: int = typer.Option(10, help="Number of recent events to display."),
     as_json: bool = typer.Option(False, "--json", help="Emit JSON instead of text."),
+    compact: bool = typer.Option(
+        False, "--compact", help="Emit compact JSON even when stdout is a terminal."
+    ),
 ) -> None:
     """Show a snapshot of recent catalog activity."""
     try:
         with init_db() as conn:
             cleanup_stale_jobs(conn)
-            events = query_events(conn, limit=limit)
-            aggregates = summarize_by_volume(conn)
-            volume_meta = fetch_volume_metadata(conn)
-            jobs = fetch_jobs(conn)
+            with read_snapshot(conn):
+                events = query_events(conn, limit=limit)
+                overview = fetch_volume_overview(conn)
+                jobs = fetch_jobs(conn)
+            combined_volumes = _combine_volume_data(overview)
+            combined_volumes = _attach_mount_details(combined_volumes, conn=conn)
     except sqlite3.OperationalError:
         typer.echo("Catalog is empty. Run `diskwatcher run` to start logging events.")
         return
 
-    combined_volumes = _combine_volume_data(aggregates, volume_meta)
-    combined_volumes = _attach_mount_details(combined_volumes)
-
     if as_json:
         payload = {"events": events, "volumes": combined_volumes, "jobs": jobs}
-        typer.echo(json.dumps(payload, indent=2))
+        _emit_json(payload, indent=False if compact else None)
         return
 
+    # Render into one buffer so the terminal sees a single write.
+    lines: List[str] = []
+    echo = lines.append
+
     if not events:
-        typer.echo("No events recorded yet.")
+        echo("No events recorded yet.")
     else:
-        typer.echo("Recent events:")
+        echo("Recent events:")
         for event in events:
-            typer.echo(
+            echo(
                 f"{event['timestamp']} | {event['event_type']:>8} | {event['volume_id']} | {event['path']}"
             )
 
     if jobs:
-        typer.echo("\nActive jobs:")
+        echo("\nActive jobs:")
         for job in jobs:
             progress = job.get("progress_json")
             if progress:
@@ -1019,133 +1243,53 @@ def status(
                 f"{job['job_id'][:8]} {job['job_type']} {job.get('status','')}"
                 f" {job.get('path') or job.get('volume_id','')}"
             )
-            typer.echo(job_line)
+            echo(job_line)
             if progress_data:
                 progress_fragments = ", ".join(
                     f"{key}={value}" for key, value in progress_data.items() if key not in {"uuid", "path"}
                 )
                 if progress_fragments:
-                    typer.echo(f"    progress: {progress_fragments}")
+                    echo(f"    progress: {progress_fragments}")
 
     if combined_volumes:
-        typer.echo("\nBy volume:")
+        echo("\nBy volume:")
         for agg in combined_volumes:
             total = agg.get("total_events", agg.get("event_count", 0))
-            typer.echo(
+            echo(
                 f"{agg['volume_id']} @ {agg['directory']} => total={total}"
                 f" (created={agg['created']}, modified={agg['modified']}, deleted={agg['deleted']})"
             )
 
-        typer.echo("\nVolume metadata:")
+        echo("\nVolume metadata:")
         for meta in combined_volumes:
-            typer.echo(f"{meta['volume_id']} @ {meta['directory']}")
-            typer.echo(
+            echo(f"{meta['volume_id']} @ {meta['directory']}")
+            echo(
                 "  events : "
                 f"stored={meta['event_count']} created={meta['created_count']} "
                 f"modified={meta['modified_count']} deleted={meta['deleted_count']}"
             )
-            typer.echo(f"  usage  : {_format_usage_line(meta)}")
-            mount = meta.get("mount_metadata") or {}
-            mount_line = _format_details_line(
-                "  mount  : ",
-                {
-                    "device": mount.get("device"),
-                    "mount": mount.get("mount_point"),
-                },
-            )
-            ids_line = _format_details_line(
-                "  ids    : ",
-                {
-                    "volume": mount.get("volume_id")
-                    if mount.get("volume_id") and mount.get("volume_id") != meta["volume_id"]
-                    else None,
-                    "uuid": mount.get("uuid"),
-                    "label": mount.get("label"),
-                },
-            )
-            lsblk = mount.get("lsblk") or {}
-            block_line = _format_details_line(
-                "  block  : ",
-                {
-                    "model": lsblk.get("MODEL"),
-                    "serial": lsblk.get("SERIAL"),
-                    "vendor": lsblk.get("VENDOR"),
-                    "size": lsblk.get("SIZE"),
-                    "fsver": lsblk.get("FSVER"),
-                },
-            )
-            layout_line = _format_details_line(
-                "  layout : ",
-                {
-                    "pttype": lsblk.get("PTTYPE"),
-                    "ptuuid": lsblk.get("PTUUID"),
-                    "parttype": lsblk.get("PARTTYPE"),
-                    "partuuid": lsblk.get("PARTUUID"),
-                    "wwn": lsblk.get("WWN"),
-                },
-            )
-            partname_line = _format_details_line(
-                "  part   : ",
-                {"name": lsblk.get("PARTTYPENAME")},
-            )
-            identity_line = _format_details_line(
-                "  identity: ",
-                {
-                    "refreshed": mount.get("identity_refreshed_at"),
-                    "source": mount.get("source"),
-                },
+            echo(f"  usage  : {_format_usage_line(meta)}")
+            lines.extend(
+                _mount_detail_lines(
+                    meta.get("mount_metadata") or {}, volume_id=meta["volume_id"]
+                )
             )
-            for detail in (
-                mount_line,
-                ids_line,
-                block_line,
-                layout_line,
-                partname_line,
-                identity_line,
-            ):
-                if detail:
-                    typer.echo(detail)
 
+    typer.echo("\n".join(lines))
 
-def _combine_volume_data(
-    aggregates: List[Dict[str, Any]],
-    metadata: List[Dict[str, Any]],
-) -> List[Dict[str, Any]]:
-    meta_by_id = {row["volume_id"]: row for row in metadata}
-    combined: List[Dict[str, Any]] = []
-    seen: set[str] = set()
-
-    for agg in aggregates:
-        meta = meta_by_id.get(agg["volume_id"])
-        combined.append(_merge_volume_row(agg, meta))
-        seen.add(agg["volume_id"])
-
-    for meta in metadata:
-        if meta["volume_id"] not in seen:
-            combined.append(
-                _merge_volume_row(
-                    {
-                        "volume_id": meta["volume_id"],
-                        "directory": meta["directory"],
-                        "total_events": meta["event_count"],
-                        "created": meta["created_count"],
-                        "modified": meta["modified_count"],
-                        "deleted": meta["deleted_count"],
-                    },
-                    meta,
-                )
-            )
 
-    return combined
+def _combine_volume_data(overview: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    # fetch_volume_overview rows already carry their metadata; only legacy
+    # event-only aggregates (no event_count column) lack it.
+    return [
+        _merge_volume_row(row, row if "event_count" in row else None)
+        for row in overview
+    ]
 
 
 def _extract_mount_metadata(source: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-    mount_device = source.get("mount_device")
-    mount_point = source.get("mount_point")
-    mount_uuid = source.get("mount_uuid")
-    mount_label = source.get("mount_label")
-    volume_id_hint = source.get("mount_volume_id")
-    identity_refreshed = source.get("identity_refreshed_at")
+    get = source.get
+    mount: Dict[str, Any] = {key: get(column) for key, column in _MOUNT_SOURCE_ITEMS}
 
     lsblk_payload: Optional[Dict[str, Any]] = None
     lsblk_json_raw = source.get("lsblk_json")
@@ -1156,80 +1300,118 @@ def _extract_mount_metadata(source: Dict[str, Any]) -> Optional[Dict[str, Any]]:
             lsblk_payload = None
 
     if lsblk_payload is None:
-        lsblk_payload = {}
-        for key, column in _LSBLK_COLUMN_MAP.items():
-            value = source.get(column)
-            if value is not None:
-                lsblk_payload[key] = value
-        if not lsblk_payload:
-            lsblk_payload = None
+        lsblk_payload = {
+            key: value
+            for key, column in _LSBLK_COLUMN_ITEMS
+            if (value := get(column)) is not None
+        } or None
 
-    if not any([mount_device, mount_point, mount_uuid, mount_label, volume_id_hint, lsblk_payload]):
+    if not lsblk_payload and not any(mount.values()):
         return None
 
-    return {
-        "device": mount_device,
-        "mount_point": mount_point,
-        "uuid": mount_uuid,
-        "label": mount_label,
-        "volume_id": volume_id_hint,
-        "lsblk": lsblk_payload,
-        "identity_refreshed_at": identity_refreshed,
-        "source": source.get("mount_metadata_source", "stored"),
-    }
+    mount["lsblk"] = lsblk_payload
+    mount["identity_refreshed_at"] = source.get("identity_refreshed_at")
+    mount["source"] = source.get("mount_metadata_source", "stored")
+    return mount
+
+
+def _safe_mount_info(directory: str) -> Optional[dict]:
+    try:
+        return get_mount_info(directory)
+    except Exception as exc:  # pragma: no cover - defensive logging
+        get_logger(__name__).debug(
+            "mount_info_lookup_failed",
+            extra={"directory": directory, "error": str(exc)},
+        )
+        return None
+
+
+def _device_id(directory: str) -> Optional[int]:
+    """Return ``st_dev`` for ``directory``, or None when it cannot be stat'ed."""
+
+    try:
+        return os.stat(directory).st_dev
+    except OSError:
+        return None
 
 
-def _attach_mount_details(volumes: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+def _lookup_mount_infos(
+    directories: Iterable[str],
+    *,
+    conn: Optional[sqlite3.Connection] = None,
+) -> Dict[str, Optional[dict]]:
+    """Resolve mount info for each directory, preferring fresh cached copies.
+
+    Cache misses shell out to lsblk/findmnt, so they run on a small thread
+    pool; catalog reads and writes stay on the calling thread.
+    """
+
+    results: Dict[str, Optional[dict]] = {}
+    pending: List[str] = []
+    device_ids: Dict[str, Optional[int]] = {}
+    for directory in directories:
+        cached = None
+        if conn is not None:
+            device_ids[directory] = device_id = _device_id(directory)
+            cached = fetch_cached_mount_info(
+                conn,
+                directory,
+                max_age=_MOUNT_CACHE_TTL_SECONDS,
+                device_id=device_id,
+            )
+        if cached is not None:
+            results[directory] = cached
+        else:
+            pending.append(directory)
+
+    if len(pending) > 1:
+        # Most status calls hit the cache, so the pool module is loaded lazily.
+        from concurrent.futures import ThreadPoolExecutor
+
+        workers = min(_MOUNT_LOOKUP_WORKERS, len(pending))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            outcomes = list(executor.map(_safe_mount_info, pending))
+    else:
+        outcomes = [_safe_mount_info(directory) for directory in pending]
+
+    for directory, mount_info in zip(pending, outcomes):
+        results[directory] = mount_info
+        if conn is not None and mount_info:
+            try:
+                store_mount_info(
+                    conn, directory, mount_info, device_id=device_ids.get(directory)
+                )
+            except sqlite3.Error as exc:  # pragma: no cover - cache is best effort
+                get_logger(__name__).debug(
+                    "mount_cache_store_failed",
+                    extra={"directory": directory, "error": str(exc)},
+                )
+    return results
+
+
+def _attach_mount_details(
+    volumes: List[Dict[str, Any]],
+    *,
+    conn: Optional[sqlite3.Connection] = None,
+) -> List[Dict[str, Any]]:
     if not volumes:
         return volumes
 
-    logger = get_logger(__name__)
-    cache: Dict[str, Optional[dict]] = {}
+    # Rows with stored identity columns never need a live lookup.
+    directories = dict.fromkeys(
+        str(row["directory"])
+        for row in volumes
+        if row.get("directory") and not row.get("mount_metadata")
+    )
+    cache = _lookup_mount_infos(directories, conn=conn)
     enriched: List[Dict[str, Any]] = []
 
     for row in volumes:
-        directory = row.get("directory")
-        mount_info: Optional[dict] = None
-        if directory:
-            directory_str = str(directory)
-            if directory_str in cache:
-                mount_info = cache[directory_str]
-            else:
-                try:
-                    mount_info = get_mount_info(directory_str)
-                except Exception as exc:  # pragma: no cover - defensive logging
-                    logger.debug(
-                        "mount_info_lookup_failed",
-                        extra={"directory": directory_str, "error": str(exc)},
-                    )
-                    mount_info = None
-                cache[directory_str] = mount_info
-
         updated = dict(row)
+        directory = row.get("directory")
         mount_info = updated.get("mount_metadata")
-        if not mount_info:
-            if directory:
-                directory_str = str(directory)
-                if directory_str in cache:
-                    mount_info = cache[directory_str]
-                else:
-                    try:
-                        mount_info = get_mount_info(directory_str)
-                        if mount_info:
-                            mount_info["source"] = "live"
-                            mount_info.setdefault(
-                                "identity_refreshed_at",
-                                datetime.now(timezone.utc).isoformat(),
-                            )
-                    except Exception as exc:  # pragma: no cover - defensive logging
-                        logger.debug(
-                            "mount_info_lookup_failed",
-                            extra={"directory": directory_str, "error": str(exc)},
-                        )
-                        mount_info = None
-                    cache[directory_str] = mount_info
-        elif directory:
-            cache[str(directory)] = mount_info
+        if not mount_info and directory:
+            mount_info = cache.get(str(directory))
 
         if mount_info:
             updated["mount_metadata"] = mount_info
@@ -1247,9 +1429,9 @@ def _search_files(
     include_deleted: bool,
     limit: int,
     basename: bool,
-) -> List[Dict[str, Any]]:
+) -> List[sqlite3.Row]:
     params: List[Any] = []
-    column = "dw_basename(path)" if basename else "path"
+    column = "basename" if basename else "path"
     clause = _build_search_clause(
         column,
         pattern,
@@ -1266,13 +1448,13 @@ def _search_files(
         "SELECT path, volume_id, directory, last_event_timestamp, last_event_type, size_bytes, is_deleted "
         "FROM files "
         f"WHERE {' AND '.join(where_parts)} "
-        "ORDER BY (last_event_timestamp IS NULL), last_event_timestamp DESC, path "
+        "ORDER BY last_event_timestamp DESC, volume_id, path "
         "LIMIT ?"
     )
 
     params.append(limit)
-    rows = conn.execute(sql, params).fetchall()
-    return [dict(row) for row in rows]
+    # sqlite3.Row already supports key access; callers convert only for JSON.
+    return conn.execute(sql, params).fetchall()
 
 
 def _search_directories(
@@ -1283,7 +1465,7 @@ def _search_directories(
     case_sensitive: bool,
     include_deleted: bool,
     limit: int,
-) -> List[Dict[str, Any]]:
+) -> List[sqlite3.Row]:
     params: List[Any] = []
     clause = _build_search_clause("directory", pattern, regex=regex, case_sensitive=case_sensitive, params=params)
 
@@ -1306,8 +1488,7 @@ def _search_directories(
     )
 
     params.append(limit)
-    rows = conn.execute(sql, params).fetchall()
-    return [dict(row) for row in rows]
+    return conn.execute(sql, params).fetchall()
 
 
 def _build_search_clause(
@@ -1318,54 +1499,95 @@ def _build_search_clause(
     case_sensitive: bool,
     params: List[Any],
 ) -> str:
-    # Matching is delegated to the dw_match_pattern SQLite function,
-    # which is configured per-search with the chosen substring/regex
-    # semantics and case-sensitivity. The params list is unused here
-    # but kept for signature compatibility.
-    return f"dw_match_pattern({column})"
+    # Substring matches stay inside SQLite: instr() is case-sensitive and LIKE
+    # folds ASCII case (the search command routes non-ASCII case-insensitive
+    # patterns through REGEXP). Regexes go through the REGEXP operator, which
+    # the search command binds to a pre-compiled pattern.
+    if regex:
+        params.append(pattern)
+        return f"{column} REGEXP ?"
+    if case_sensitive:
+        params.append(pattern)
+        return f"instr({column}, ?) > 0"
+    params.append(_build_like_pattern(pattern))
+    return f"{column} LIKE ? ESCAPE '\\'"
+
+
+def _is_literal_pattern(pattern: str, *, case_sensitive: bool) -> bool:
+    """Return True when a --regex pattern is really a plain substring."""
+
+    import re
+
+    # LIKE only folds ASCII case, so non-ASCII case-insensitive patterns
+    # keep the regex path to preserve re.IGNORECASE semantics.
+    return re.escape(pattern) == pattern and (case_sensitive or pattern.isascii())
+
+
+@lru_cache(maxsize=1)
+def _get_re2() -> Any:
+    """Return the RE2 bindings (google-re2), or None when unavailable."""
+
+    try:
+        import re2  # type: ignore[import-not-found]
+    except ImportError:
+        return None
+    return re2
+
+
+def _compile_search_regex(pattern: str, *, case_sensitive: bool) -> Any:
+    """Return a ``search`` callable for ``pattern``, preferring RE2.
+
+    The pattern is always validated with :mod:`re` so error messages stay the
+    same. RE2 matches in linear time without backtracking; patterns it cannot
+    express (backreferences, lookarounds) fall back to :mod:`re`.
+    """
+
+    import re
+
+    compiled = re.compile(pattern, 0 if case_sensitive else re.IGNORECASE)
+    re2 = _get_re2()
+    if re2 is not None:
+        try:
+            return re2.compile(pattern if case_sensitive else f"(?i){pattern}").search
+        except Exception:
+            pass
+    return compiled.search
+
+
+# Escapes LIKE metacharacters in one pass for the ESCAPE '\' clause.
+_LIKE_ESCAPE = str.maketrans({"\\": "\\\\", "%": "\\%", "_": "\\_"})
 
 
 def _build_like_pattern(pattern: str) -> str:
-    escaped = pattern.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
-    return f"%{escaped}%"
+    return f"%{pattern.translate(_LIKE_ESCAPE)}%"
 
 
 def _merge_volume_row(agg: Dict[str, Any], meta: Optional[Dict[str, Any]]) -> Dict[str, Any]:
-    row = dict(agg)
+    source = meta or agg
+    row = {
+        **agg,
+        **{
+            column: source.get(column, agg.get(alias, 0))
+            for column, alias in _VOLUME_COUNT_ALIASES
+        },
+        **{column: source.get(column) for column in _VOLUME_USAGE_COLUMNS},
+    }
     if meta:
         row.setdefault("directory", meta["directory"])
-        row["event_count"] = meta.get("event_count", row.get("total_events", 0))
-        row["created_count"] = meta.get("created_count", row.get("created", 0))
-        row["modified_count"] = meta.get("modified_count", row.get("modified", 0))
-        row["deleted_count"] = meta.get("deleted_count", row.get("deleted", 0))
-        row["usage_total_bytes"] = meta.get("usage_total_bytes")
-        row["usage_used_bytes"] = meta.get("usage_used_bytes")
-        row["usage_free_bytes"] = meta.get("usage_free_bytes")
-        row["usage_refreshed_at"] = meta.get("usage_refreshed_at")
         row.setdefault("last_event_timestamp", meta.get("last_event_timestamp"))
-        for column in _VOLUME_IDENTITY_COLUMNS:
-            if column in meta and meta[column] is not None:
-                row[column] = meta[column]
-    else:
-        row.setdefault("event_count", row.get("total_events", 0))
-        row.setdefault("created_count", row.get("created", 0))
-        row.setdefault("modified_count", row.get("modified", 0))
-        row.setdefault("deleted_count", row.get("deleted", 0))
-        row.setdefault("usage_total_bytes", None)
-        row.setdefault("usage_used_bytes", None)
-        row.setdefault("usage_free_bytes", None)
-        row.setdefault("usage_refreshed_at", None)
-
-    for column in _VOLUME_IDENTITY_COLUMNS:
-        row.setdefault(column, None)
-
-    identity_source = meta if meta else row
-    row["mount_metadata"] = _extract_mount_metadata(identity_source)
-
-    row.setdefault("total_events", row.get("event_count", 0))
-    row.setdefault("created", row.get("created_count", 0))
-    row.setdefault("modified", row.get("modified_count", 0))
-    row.setdefault("deleted", row.get("deleted_count", 0))
+    # Stored identity wins when present; otherwise keep (or null) the agg value.
+    row.update(
+        {
+            column: meta[column]
+            if meta and meta.get(column) is not None
+            else agg.get(column)
+            for column in _VOLUME_IDENTITY_COLUMNS
+        }
+    )
+    row["mount_metadata"] = _extract_mount_metadata(meta or row)
+    row.update(
+        {alias: row.get(alias, row[column]) for column, alias in _VOLUME_COUNT_ALIASES}
+    )
     return row
 
 
@@ -1385,36 +1607,102 @@ def _format_usage_line(meta: Dict[str, Any]) -> str:
     )
 
 
-def _format_details_line(prefix: str, pairs: Dict[str, Optional[str]]) -> Optional[str]:
-    values = [f"{key}={value}" for key, value in pairs.items() if value]
-    if not values:
-        return None
-    return f"{prefix}{' '.join(values)}"
+def _mount_detail_lines(
+    mount: Dict[str, Any], *, volume_id: Optional[str] = None
+) -> List[str]:
+    """Return the non-empty mount/ids/block/layout/part/identity lines.
+
+    Each line's fields are fixed, so they are spelled out rather than built
+    as throwaway dicts per volume. A mount ``volume_id`` equal to
+    ``volume_id`` is omitted as redundant.
+    """
+
+    get = mount.get
+    lsblk = (get("lsblk") or {}).get
+    lines: List[str] = []
+
+    bits = []
+    if v := get("device"):
+        bits.append(f"device={v}")
+    if v := get("mount_point"):
+        bits.append(f"mount={v}")
+    if bits:
+        lines.append("  mount  : " + " ".join(bits))
+
+    bits = []
+    if (v := get("volume_id")) and v != volume_id:
+        bits.append(f"volume={v}")
+    if v := get("uuid"):
+        bits.append(f"uuid={v}")
+    if v := get("label"):
+        bits.append(f"label={v}")
+    if bits:
+        lines.append("  ids    : " + " ".join(bits))
+
+    bits = []
+    if v := lsblk("MODEL"):
+        bits.append(f"model={v}")
+    if v := lsblk("SERIAL"):
+        bits.append(f"serial={v}")
+    if v := lsblk("VENDOR"):
+        bits.append(f"vendor={v}")
+    if v := lsblk("SIZE"):
+        bits.append(f"size={v}")
+    if v := lsblk("FSVER"):
+        bits.append(f"fsver={v}")
+    if bits:
+        lines.append("  block  : " + " ".join(bits))
+
+    bits = []
+    if v := lsblk("PTTYPE"):
+        bits.append(f"pttype={v}")
+    if v := lsblk("PTUUID"):
+        bits.append(f"ptuuid={v}")
+    if v := lsblk("PARTTYPE"):
+        bits.append(f"parttype={v}")
+    if v := lsblk("PARTUUID"):
+        bits.append(f"partuuid={v}")
+    if v := lsblk("WWN"):
+        bits.append(f"wwn={v}")
+    if bits:
+        lines.append("  layout : " + " ".join(bits))
+
+    if v := lsblk("PARTTYPENAME"):
+        lines.append(f"  part   : name={v}")
+
+    bits = []
+    if v := get("identity_refreshed_at"):
+        bits.append(f"refreshed={v}")
+    if v := get("source"):
+        bits.append(f"source={v}")
+    if bits:
+        lines.append("  identity: " + " ".join(bits))
+
+    return lines
 
 
 def _format_bytes(value: Optional[int]) -> str:
     if value is None:
         return "-"
-    units = ["B", "KB", "MB", "GB", "TB", "PB"]
-    amount = float(value)
-    idx = 0
-    while amount >= 1024 and idx < len(units) - 1:
-        amount /= 1024
-        idx += 1
-    if idx == 0:
-        return f"{int(amount)} {units[idx]}"
-    return f"{amount:.1f} {units[idx]}"
+    if value < 1024:
+        return f"{int(value)} B"
+    # Each unit is 2**10 of the previous one, so the bit length picks it.
+    idx = min((int(value).bit_length() - 1) // 10, len(_BYTE_UNITS) - 1)
+    return f"{value / (1 << (10 * idx)):.1f} {_BYTE_UNITS[idx]}"
 
 
 @app.command()
 def dashboard(
     limit: int = typer.Option(20, help="Number of files to display ordered by recent activity."),
     as_json: bool = typer.Option(False, "--json", help="Emit JSON payload instead of text."),
+    compact: bool = typer.Option(
+        False, "--compact", help="Emit compact JSON even when stdout is a terminal."
+    ),
 ) -> None:
     """Show a compact summary of cataloged files and volumes."""
 
     try:
-        with init_db() as conn:
+        with init_db(query_only=True) as conn, read_snapshot(conn):
             files = summarize_files(conn, limit=limit)
             volumes = summarize_by_volume(conn)
     except sqlite3.OperationalError:
@@ -1423,14 +1711,17 @@ def dashboard(
 
     if as_json:
         payload = {"files": files, "volumes": volumes}
-        typer.echo(json.dumps(payload, indent=2))
+        _emit_json(payload, indent=False if compact else None)
         return
 
     if not files:
         typer.echo("No file activity recorded yet.")
         return
 
-    typer.echo("Recent files:")
+    lines: List[str] = []
+    echo = lines.append
+
+    echo("Recent files:")
     for row in files:
         volume = row.get("volume_id") or "-"
         last_event = row.get("last_event_type") or "unknown"
@@ -1439,24 +1730,29 @@ def dashboard(
         path = row.get("path") or ""
         directory = row.get("directory") or ""
 
-        typer.echo(
+        echo(
             f"- {path}\n"
             f"  volume={volume} directory={directory}\n"
             f"  last_event={last_event} at {last_seen} (events={total})"
         )
 
     if volumes:
-        typer.echo("\nBy volume:")
+        echo("\nBy volume:")
         for agg in volumes:
-            typer.echo(
+            echo(
                 f"{agg['volume_id']} @ {agg['directory']} => total={agg['total_events']}"
                 f" (created={agg['created']}, modified={agg['modified']}, deleted={agg['deleted']})"
             )
 
+    typer.echo("\n".join(lines))
+
 
 @app.command()
 def volumes(
     as_json: bool = typer.Option(False, "--json", help="Emit JSON payload instead of text."),
+    compact: bool = typer.Option(
+        False, "--compact", help="Emit compact JSON even when stdout is a terminal."
+    ),
     raw: bool = typer.Option(
         False,
         "--raw",
@@ -1466,7 +1762,7 @@ def volumes(
     """Show stored volume snapshots and identity metadata."""
 
     try:
-        with init_db() as conn:
+        with init_db(query_only=True) as conn:
             records = fetch_volume_metadata(conn)
     except sqlite3.OperationalError:
         typer.echo("Catalog is empty. Run `diskwatcher run` to start logging events.")
@@ -1484,82 +1780,29 @@ def volumes(
             if not raw:
                 record.pop("lsblk_json", None)
             payload.append(record)
-        typer.echo(json.dumps(payload, indent=2))
+        _emit_json(payload, indent=False if compact else None)
         return
 
+    lines: List[str] = []
+    echo = lines.append
+
     for row in records:
-        typer.echo(f"{row['volume_id']} @ {row['directory']}")
-        typer.echo(
+        echo(f"{row['volume_id']} @ {row['directory']}")
+        echo(
             "  events : "
             f"total={row['event_count']} created={row['created_count']} "
             f"modified={row['modified_count']} deleted={row['deleted_count']}"
         )
-        typer.echo(f"  usage  : {_format_usage_line(row)}")
-
-        mount = _extract_mount_metadata(row) or {}
-        mount_line = _format_details_line(
-            "  mount  : ",
-            {
-                "device": mount.get("device"),
-                "mount": mount.get("mount_point"),
-            },
-        )
-        ids_line = _format_details_line(
-            "  ids    : ",
-            {
-                "volume": mount.get("volume_id"),
-                "uuid": mount.get("uuid"),
-                "label": mount.get("label"),
-            },
-        )
-        lsblk = mount.get("lsblk") or {}
-        block_line = _format_details_line(
-            "  block  : ",
-            {
-                "model": lsblk.get("MODEL"),
-                "serial": lsblk.get("SERIAL"),
-                "vendor": lsblk.get("VENDOR"),
-                "size": lsblk.get("SIZE"),
-                "fsver": lsblk.get("FSVER"),
-            },
-        )
-        layout_line = _format_details_line(
-            "  layout : ",
-            {
-                "pttype": lsblk.get("PTTYPE"),
-                "ptuuid": lsblk.get("PTUUID"),
-                "parttype": lsblk.get("PARTTYPE"),
-                "partuuid": lsblk.get("PARTUUID"),
-                "wwn": lsblk.get("WWN"),
-            },
-        )
-        partname_line = _format_details_line(
-            "  part   : ",
-            {"name": lsblk.get("PARTTYPENAME")},
-        )
-        identity_line = _format_details_line(
-            "  identity: ",
-            {
-                "refreshed": mount.get("identity_refreshed_at"),
-                "source": mount.get("source"),
-            },
-        )
+        echo(f"  usage  : {_format_usage_line(row)}")
 
-        for detail in (
-            mount_line,
-            ids_line,
-            block_line,
-            layout_line,
-            partname_line,
-            identity_line,
-        ):
-            if detail:
-                typer.echo(detail)
+        lines.extend(_mount_detail_lines(_extract_mount_metadata(row) or {}))
 
         if raw and row.get("lsblk_json"):
-            typer.echo(f"  lsblk_json: {row['lsblk_json']}")
+            echo(f"  lsblk_json: {row['lsblk_json']}")
+
+        echo("")
 
-        typer.echo("")
+    typer.echo("\n".join(lines))
 
 
 @app.command()
@@ -1596,6 +1839,9 @@ def search(
     include_deleted: bool = typer.Option(False, "--include-deleted", help="Include deleted files in results."),
     limit: int = typer.Option(50, help="Maximum rows per section."),
     as_json: bool = typer.Option(False, "--json", help="Emit JSON payload instead of text."),
+    compact: bool = typer.Option(
+        False, "--compact", help="Emit compact JSON even when stdout is a terminal."
+    ),
 ) -> None:
     """Search the catalog for files and/or directories."""
 
@@ -1612,42 +1858,32 @@ def search(
         basename = False
 
     try:
-        with init_db() as conn:
+        with init_db(query_only=True) as conn:
             conn.row_factory = sqlite3.Row
 
+            if regex and _is_literal_pattern(pattern, case_sensitive=case_sensitive):
+                # No metacharacters: instr()/LIKE give the same matches natively.
+                regex = False
+            elif not regex and not case_sensitive and not pattern.isascii():
+                import re
+
+                # LIKE only folds ASCII case; match non-ASCII substrings with
+                # an escaped pattern through REGEXP (re.IGNORECASE) instead.
+                pattern = re.escape(pattern)
+                regex = True
+
             if regex:
-                flags = 0 if case_sensitive else re.IGNORECASE
+                import re
+
                 try:
-                    compiled_re = re.compile(pattern, flags)
+                    regex_search = _compile_search_regex(pattern, case_sensitive=case_sensitive)
                 except re.error as exc:
                     raise typer.BadParameter(f"Invalid regular expression: {exc}") from exc
 
-                def _match(value: Optional[str]) -> int:
-                    return int(bool(value and compiled_re.search(value)))
-            else:
-                if case_sensitive:
-
-                    def _match(value: Optional[str]) -> int:
-                        return int(bool(value and pattern in value))
-                else:
-                    lowered = pattern.lower()
-
-                    def _match(value: Optional[str]) -> int:
-                        return int(bool(value and lowered in value.lower()))
-
-            conn.create_function("dw_match_pattern", 1, _match)
+                def _regexp(_pattern: str, value: Optional[str]) -> int:
+                    return int(bool(value and regex_search(value)))
 
-            if basename:
-
-                def _basename(value: Optional[str]) -> Optional[str]:
-                    if value is None:
-                        return None
-                    try:
-                        return Path(value).name
-                    except Exception:
-                        return value
-
-                conn.create_function("dw_basename", 1, _basename)
+                conn.create_function("regexp", 2, _regexp, deterministic=True)
 
             file_results = []
             dir_results = []
@@ -1679,17 +1915,17 @@ def search(
     if as_json:
         payload: Dict[str, Any] = {}
         if files:
-            payload["files"] = file_results
+            payload["files"] = [dict(row) for row in file_results]
         if directories:
-            payload["directories"] = dir_results
-        typer.echo(json.dumps(payload, indent=2))
+            payload["directories"] = [dict(row) for row in dir_results]
+        _emit_json(payload, indent=False if compact else None)
         return
 
     if files:
         if file_results:
             typer.echo("Files:")
             for row in file_results:
-                deleted = "yes" if row.get("is_deleted") else "no"
+                deleted = "yes" if row["is_deleted"] else "no"
                 typer.echo(
                     f"- {row['path']}\n"
                     f"  volume={row['volume_id']} directory={row['directory']}\n"
@@ -1715,13 +1951,26 @@ def search(
         typer.echo("\nNo matches found.")
 
 
+def _data_version(conn: sqlite3.Connection) -> int:
+    return conn.execute("PRAGMA data_version").fetchone()[0]
+
+
 @app.command()
 def stream(
     limit: int = typer.Option(100, help="Maximum events to read per poll."),
-    interval: float = typer.Option(1.0, help="Seconds to wait between polls."),
+    interval: float = typer.Option(
+        1.0, help="Seconds between polls; idle polls skip the events query."
+    ),
     max_iterations: int = typer.Option(0, hidden=True, help="Internal: stop after N polls."),
 ) -> None:
-    """Emit new catalog events as NDJSON for piping into tools like VisiData."""
+    """Emit new catalog events as NDJSON for piping into tools like VisiData.
+
+    The catalog is checked once per ``interval``. Each check first reads
+    ``PRAGMA data_version``, which changes whenever another connection (the
+    watchers write from their own) commits, and re-runs the events query only
+    when it moved. An idle catalog therefore costs one header read per
+    interval, never more often than a plain fixed-interval poll.
+    """
 
     if limit <= 0:
         raise typer.BadParameter("limit must be greater than zero")
@@ -1732,18 +1981,29 @@ def stream(
         with init_db(check_same_thread=False) as conn:
             last_rowid = 0
             iterations = 0
+            buffer = bytearray()
+
+            seen_version: Optional[int] = None
+            backlog = False
 
             while True:
-                events = query_events_since(conn, last_rowid=last_rowid, limit=limit)
-                if events:
-                    for event in events:
-                        typer.echo(json.dumps(event))
-                    sys.stdout.flush()
-                    last_rowid = events[-1]["rowid"]
+                version = _data_version(conn)
+                if backlog or version != seen_version:
+                    seen_version = version
+                    events = query_events_since(
+                        conn, last_rowid=last_rowid, limit=limit
+                    )
+                    if events:
+                        _emit_json_lines(events, buffer=buffer)
+                        last_rowid = events[-1]["rowid"]
+                    backlog = len(events) >= limit
 
                 iterations += 1
                 if max_iterations and iterations >= max_iterations:
                     break
+                if backlog:
+                    # Still catching up on a backlog; poll again right away.
+                    continue
 
                 try:
                     time.sleep(interval)
@@ -1758,6 +2018,7 @@ def stream(
 @app.command()
 def suggest() -> None:
     """Inspect system and suggest directories to monitor."""
+
     from diskwatcher.core.inspector import suggest_directories
 
     suggested_dirs = suggest_directories()
@@ -1790,14 +2051,26 @@ def dev_revision(
 ) -> None:
     """Create a new Alembic revision script."""
 
-    config = build_alembic_config(ini_path=ini, database_url=url)
+    from diskwatcher.db.migration import build_alembic_config, optimize_database
+
+    config = build_alembic_config(
+        ini_path=ini,
+        database_url=url,
+        tune=True,
+        execution_options={"compiled_cache": {}},
+    )
+    if autogenerate:
+        optimize_database(url)
     from alembic import command as alembic_command  # Local import to keep CLI fast when unused.
 
     alembic_command.revision(config, message=message, autogenerate=autogenerate)
     typer.echo("Created new Alembic revision")
 
 
+@lru_cache(maxsize=32)
 def _sqlite_url_to_path(url: str) -> Path:
+    from urllib.parse import unquote, urlparse
+
     parsed = urlparse(url)
     if parsed.scheme != "sqlite":
         raise typer.BadParameter("Only sqlite URLs are supported for this command.")
@@ -1810,38 +2083,307 @@ def _sqlite_url_to_path(url: str) -> Path:
     return Path(path)
 
 
+def _open_tuned(db_file: Path) -> sqlite3.Connection:
+    """Open ``db_file`` for maintenance with the catalog's runtime pragmas.
+
+    WAL, ``synchronous=NORMAL``, a 64 MiB cache, mmap and in-memory temp
+    storage cut fsyncs during VACUUM and page re-reads during checks. The
+    connection is autocommit, as VACUUM refuses to run inside a transaction,
+    and skips the migration check so the file's schema is left alone.
+    """
+
+    return init_db(db_file, isolation_level=None, ensure_schema=False)
+
+
+_MAINTENANCE_CONNECTIONS: Dict[Path, sqlite3.Connection] = {}
+
+
+def _maintenance_connection(
+    db_file: Path, *, timeout_ms: Optional[int] = None
+) -> sqlite3.Connection:
+    """Return the tuned connection for ``db_file``, opening it once per process.
+
+    Chained maintenance calls (``dev maintenance``, scripted loops over the
+    app) then share one file open and a warm page cache. Connections are
+    closed at interpreter exit. ``timeout_ms`` resets SQLite's busy handler
+    so a watcher holding the catalog makes this call wait rather than fail.
+    """
+
+    key = db_file.expanduser().resolve()
+    conn = _MAINTENANCE_CONNECTIONS.get(key)
+    if conn is None:
+        conn = _open_tuned(key)
+        _MAINTENANCE_CONNECTIONS[key] = conn
+        atexit.register(conn.close)
+    elif conn.in_transaction:
+        # VACUUM refuses to run inside a transaction; never inherit one.
+        conn.rollback()
+    if timeout_ms is not None:
+        conn.execute(f"PRAGMA busy_timeout = {int(timeout_ms)}")
+    return conn
+
+
+def _checkpoint_before_vacuum(conn: sqlite3.Connection) -> None:
+    """Checkpoint and truncate the WAL, waiting out writers, before a VACUUM."""
+
+    conn.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchall()
+
+
+def _echo_check(conn: sqlite3.Connection, check: str) -> bool:
+    """Echo every row of ``PRAGMA <check>``; return True for a healthy catalog.
+
+    SQLite answers a single ``ok`` row, or one row per problem found; those
+    are streamed in batches so a badly damaged file never sits in memory.
+    """
+
+    cursor = conn.execute(f"PRAGMA {check}")
+    batch = cursor.fetchmany(_CHECK_FETCH_ROWS)
+    if batch == [("ok",)]:
+        typer.echo(f"Catalog {check}: ok")
+        return True
+    if not batch:
+        typer.echo(f"Catalog {check}: unknown")
+        return False
+    typer.echo(f"Catalog {check}: problems found")
+    while batch:
+        typer.echo("\n".join(f"  {row[0]}" for row in batch))
+        batch = cursor.fetchmany(_CHECK_FETCH_ROWS)
+    return False
+
+
+def _vacuum_in_place(
+    conn: sqlite3.Connection,
+    *,
+    incremental: bool,
+    pages: int,
+    min_free_pct: float = 0.0,
+) -> Optional[str]:
+    """Compact the catalog behind ``conn`` and return a label for the mode used.
+
+    Full rewrites (``--full`` or the one-off conversion to incremental mode)
+    are skipped, returning None, while fewer than ``min_free_pct`` percent of
+    the pages sit on the free list.
+    """
+
+    convert = incremental and conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 0
+    if incremental and not convert:
+        # execute() steps a row-less statement once, which frees a single
+        # page; executescript() runs it to completion.
+        conn.executescript(f"PRAGMA incremental_vacuum({int(pages)});")
+        return "incremental"
+
+    page_count = _page_count(conn)
+    free_pages = conn.execute("PRAGMA freelist_count").fetchone()[0]
+    free_pct = 100.0 * free_pages / page_count if page_count else 0.0
+    if free_pct < min_free_pct:
+        typer.echo(
+            f"Skipping VACUUM: only {free_pct:.1f}% of pages are free "
+            f"(threshold {min_free_pct:g}%; pass --force to run anyway)"
+        )
+        return None
+
+    if convert:
+        conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+    _checkpoint_before_vacuum(conn)
+    conn.execute("VACUUM")
+    return "full, converted to auto_vacuum=INCREMENTAL" if convert else "full"
+
+
+def _page_count(conn: sqlite3.Connection) -> int:
+    return conn.execute("PRAGMA page_count").fetchone()[0]
+
+
+def _echo_reclaimed(conn: sqlite3.Connection, pages_before: int) -> None:
+    """Echo how much the file shrank since ``pages_before`` was read."""
+
+    pages = pages_before - _page_count(conn)
+    page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+    typer.echo(f"Reclaimed {_format_bytes(pages * page_size)} ({pages} pages)")
+
+
+def _finish_maintenance(conn: sqlite3.Connection) -> None:
+    """Refresh planner statistics, then checkpoint what that wrote."""
+
+    optimize_connection(conn)
+    conn.execute("PRAGMA wal_checkpoint(PASSIVE)").fetchall()
+
+
 @dev_app.command("vacuum")
 def dev_vacuum(
     url: Optional[str] = typer.Option(None, "--url", help="Database URL to vacuum."),
+    incremental: bool = typer.Option(
+        True,
+        "--incremental/--full",
+        help="Release free-list pages only, or rewrite the whole file with VACUUM.",
+    ),
+    pages: int = typer.Option(
+        _INCREMENTAL_VACUUM_PAGES,
+        "--pages",
+        help="Free-list pages to release per incremental run (0 releases all).",
+    ),
+    min_free_pct: float = typer.Option(
+        _VACUUM_MIN_FREE_PCT,
+        "--min-free-pct",
+        help="Skip full rewrites while fewer than this percent of pages are free.",
+    ),
+    force: bool = typer.Option(
+        False, "--force", help="Rewrite the file even below --min-free-pct."
+    ),
+    into: Optional[Path] = typer.Option(
+        None,
+        "--into",
+        help="Write a compacted copy to PATH with VACUUM INTO instead.",
+    ),
+    timeout_ms: int = typer.Option(
+        _MAINTENANCE_BUSY_TIMEOUT_MS,
+        "--timeout-ms",
+        help="Milliseconds to wait for locks held by a running watcher.",
+    ),
 ) -> None:
-    """Run VACUUM on the catalog to reclaim space."""
+    """Reclaim free space in the catalog.
+
+    Incremental runs need ``auto_vacuum=INCREMENTAL``, which SQLite only
+    adopts through a rebuild, so a catalog still in ``auto_vacuum=NONE`` gets
+    one full VACUUM to convert it; later runs trim ``--pages`` at a time.
+    ``--into`` skips the in-place rewrite entirely: the source only needs a
+    read lock and no second copy of the catalog is built next to it.
+    """
+
+    if pages < 0:
+        raise typer.BadParameter("pages cannot be negative")
+    if min_free_pct < 0:
+        raise typer.BadParameter("min-free-pct cannot be negative")
+    if timeout_ms < 0:
+        raise typer.BadParameter("timeout-ms cannot be negative")
+    if into is not None and into.exists():
+        raise typer.BadParameter(f"{into} already exists")
 
-    target = url or f"sqlite:///{DB_PATH}"
+    target = url or _DEFAULT_DB_URL
     db_file = _sqlite_url_to_path(target)
-    conn = sqlite3.connect(str(db_file))
-    try:
-        conn.execute("VACUUM")
-    finally:
-        conn.close()
-    typer.echo(f"Vacuumed catalog at {db_file}")
+    conn = _maintenance_connection(db_file, timeout_ms=timeout_ms)
+    if into is not None:
+        conn.execute("VACUUM INTO ?", (str(into),))
+        typer.echo(f"Vacuumed catalog at {db_file} into {into}")
+        return
+
+    pages_before = _page_count(conn)
+    mode = _vacuum_in_place(
+        conn,
+        incremental=incremental,
+        pages=pages,
+        min_free_pct=0.0 if force else min_free_pct,
+    )
+    if mode is None:
+        return
+    _finish_maintenance(conn)
+    typer.echo(f"Vacuumed catalog at {db_file} ({mode})")
+    _echo_reclaimed(conn, pages_before)
 
 
 @dev_app.command("integrity")
 def dev_integrity(
     url: Optional[str] = typer.Option(None, "--url", help="Database URL to check."),
+    quick: bool = typer.Option(
+        True,
+        "--quick/--full",
+        help=(
+            "quick_check skips the index/table cross-check; use --full "
+            "(integrity_check) before taking backups."
+        ),
+    ),
+    timeout_ms: int = typer.Option(
+        _MAINTENANCE_BUSY_TIMEOUT_MS,
+        "--timeout-ms",
+        help="Milliseconds to wait for locks held by a running watcher.",
+    ),
 ) -> None:
-    """Run sqlite integrity_check and report the result."""
+    """Run sqlite quick_check (or integrity_check) and report the result."""
 
-    target = url or f"sqlite:///{DB_PATH}"
+    if timeout_ms < 0:
+        raise typer.BadParameter("timeout-ms cannot be negative")
+
+    check = "quick_check" if quick else "integrity_check"
+    target = url or _DEFAULT_DB_URL
     db_file = _sqlite_url_to_path(target)
-    conn = sqlite3.connect(str(db_file))
-    try:
-        result = conn.execute("PRAGMA integrity_check").fetchone()
-    finally:
-        conn.close()
+    conn = _maintenance_connection(db_file, timeout_ms=timeout_ms)
+    if not _echo_check(conn, check):
+        raise typer.Exit(code=1)
+    # The check just pulled every page through the cache; refreshing stale
+    # planner statistics now is cheap.
+    optimize_connection(conn)
+
+
+@dev_app.command("optimize")
+def dev_optimize(
+    url: Optional[str] = typer.Option(None, "--url", help="Database URL to optimize."),
+) -> None:
+    """Run a bounded PRAGMA optimize to refresh stale planner statistics."""
+
+    target = url or _DEFAULT_DB_URL
+    db_file = _sqlite_url_to_path(target)
+    optimize_connection(_maintenance_connection(db_file))
+    typer.echo(f"Optimized catalog at {db_file}")
+
+
+@dev_app.command("maintenance")
+def dev_maintenance(
+    url: Optional[str] = typer.Option(None, "--url", help="Database URL to maintain."),
+    incremental: bool = typer.Option(
+        True,
+        "--incremental/--full",
+        help="Release free-list pages only, or rewrite the whole file with VACUUM.",
+    ),
+    pages: int = typer.Option(
+        _INCREMENTAL_VACUUM_PAGES,
+        "--pages",
+        help="Free-list pages to release per incremental run (0 releases all).",
+    ),
+    min_free_pct: float = typer.Option(
+        _VACUUM_MIN_FREE_PCT,
+        "--min-free-pct",
+        help="Skip full rewrites while fewer than this percent of pages are free.",
+    ),
+    force: bool = typer.Option(
+        False, "--force", help="Rewrite the file even below --min-free-pct."
+    ),
+    timeout_ms: int = typer.Option(
+        _MAINTENANCE_BUSY_TIMEOUT_MS,
+        "--timeout-ms",
+        help="Milliseconds to wait for locks held by a running watcher.",
+    ),
+) -> None:
+    """Run quick_check, vacuum and optimize in one session on one connection.
+
+    The vacuum is skipped when quick_check reports a problem, since
+    rewriting a damaged file can make recovery harder.
+    """
 
-    status = result[0] if result else "unknown"
-    typer.echo(f"Catalog integrity_check: {status}")
+    if pages < 0:
+        raise typer.BadParameter("pages cannot be negative")
+    if min_free_pct < 0:
+        raise typer.BadParameter("min-free-pct cannot be negative")
+    if timeout_ms < 0:
+        raise typer.BadParameter("timeout-ms cannot be negative")
+
+    target = url or _DEFAULT_DB_URL
+    db_file = _sqlite_url_to_path(target)
+    conn = _maintenance_connection(db_file, timeout_ms=timeout_ms)
+    if not _echo_check(conn, "quick_check"):
+        raise typer.Exit(code=1)
+
+    pages_before = _page_count(conn)
+    mode = _vacuum_in_place(
+        conn,
+        incremental=incremental,
+        pages=pages,
+        min_free_pct=0.0 if force else min_free_pct,
+    )
+    _finish_maintenance(conn)
+    if mode is None:
+        typer.echo(f"Optimized catalog at {db_file}")
+        return
+    typer.echo(f"Vacuumed and optimized catalog at {db_file} ({mode})")
+    _echo_reclaimed(conn, pages_before)
 
 
 def main() -> None:
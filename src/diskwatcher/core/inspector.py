@@ -2,8 +2,9 @@ import os
 import platform
 import logging
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import List
+from typing import List, Tuple
 
 from diskwatcher.utils.devices import get_mount_info
 
@@ -78,8 +79,14 @@ def get_mount_points() -> List[Path]:
         return []
 
 
-def suggest_directories() -> List[DirectorySuggestion]:
-    """Suggest directories to monitor along with unique volume identifiers."""
+@lru_cache(maxsize=1)
+def suggest_directories() -> Tuple[DirectorySuggestion, ...]:
+    """Suggest directories to monitor along with unique volume identifiers.
+
+    The result is memoised for the life of the process (CLI invocations are
+    short-lived, so mounts do not go stale); call
+    ``suggest_directories.cache_clear()`` to force a fresh probe.
+    """
     mounts = get_mount_points()
     if mounts:
         candidates = mounts
@@ -96,7 +103,7 @@ def suggest_directories() -> List[DirectorySuggestion]:
             suggestions.append(DirectorySuggestion(path=resolved, volume_id=volume_id))
         except PermissionError as e:
             logger.warning(f"Permission error for {volume_id}")
-    return suggestions
+    return tuple(suggestions)
 
 
 if __name__ == "__main__":
@@ -9,6 +9,7 @@ from concurrent.futures import ProcessPoolExecutor, as_completed
 from diskwatcher.core.watcher import DiskWatcher, DiskWatcherThread
 from diskwatcher.utils.devices import get_mount_info
 from diskwatcher.utils.logging import get_logger
+from diskwatcher.utils.paths import clear_resolve_cache, resolve_path
 from diskwatcher.db import init_db
 from diskwatcher.db.jobs import JobHandle
 
@@ -43,14 +44,44 @@ class DiskWatcherManager:
         self._auto_discovery: Optional[_AutoDiscoveryThread] = None
         self._polling_interval = polling_interval
         self._exclude_patterns = list(exclude_patterns) if exclude_patterns else []
+        # Set whenever an initial_scan job is created or changes state so
+        # progress monitors can refresh without polling the catalog.
+        self.job_state_changed = Event()
 
     def add_directory(self, path: Path, uuid: Optional[str] = None):
-        path = path.resolve()
+        path = resolve_path(path)
         with self._threads_lock:
             for existing in self.threads:
                 if existing.path == path:
                     return existing
 
+        watcher_thread = self._build_thread(path, uuid)
+        with self._threads_lock:
+            self.threads.append(watcher_thread)
+        return watcher_thread
+
+    def add_directories_bulk(
+        self, entries: Iterable[Tuple[Path, Optional[str]]]
+    ) -> List[DiskWatcherThread]:
+        """Register several ``(path, uuid)`` entries with one pass over the thread list."""
+
+        with self._threads_lock:
+            known = {thread.path: thread for thread in self.threads}
+        added: List[DiskWatcherThread] = []
+        result: List[DiskWatcherThread] = []
+        for path, uuid in entries:
+            path = resolve_path(path)
+            thread = known.get(path)
+            if thread is None:
+                thread = self._build_thread(path, uuid)
+                known[path] = thread
+                added.append(thread)
+            result.append(thread)
+        with self._threads_lock:
+            self.threads.extend(added)
+        return result
+
+    def _build_thread(self, path: Path, uuid: Optional[str]) -> DiskWatcherThread:
         if uuid is None:
             try:
                 info = get_mount_info(path)
@@ -73,10 +104,14 @@ class DiskWatcherManager:
             polling_interval=self._polling_interval,
             exclude_patterns=self._exclude_patterns,
         )
-        with self._threads_lock:
-            self.threads.append(watcher_thread)
         return watcher_thread
 
+    @property
+    def database_path(self) -> Optional[Path]:
+        """On-disk catalog path, or None for in-memory connections."""
+
+        return self._database_path()
+
     def _database_path(self) -> Optional[Path]:
         if not self.conn:
             return None
@@ -115,7 +150,6 @@ class DiskWatcherManager:
         if not target_threads:
             return []
 
-        scan_jobs: Dict[DiskWatcherThread, JobHandle] = {}
         queued_at = datetime.now(timezone.utc).isoformat()
         for thread in target_threads:
             thread.watcher.scan_stats = {
@@ -124,14 +158,16 @@ class DiskWatcherManager:
                 "uuid": thread.uuid,
                 "path": str(thread.path),
             }
-            scan_jobs[thread] = JobHandle.start(
-                self.conn,
-                job_type="initial_scan",
-                path=str(thread.path),
-                volume_id=thread.uuid,
-                status="queued",
-                lock=self.conn_lock,
-            )
+        # Queue every scan job in one transaction rather than one commit each.
+        handles = JobHandle.start_many(
+            self.conn,
+            job_type="initial_scan",
+            targets=[(str(thread.path), thread.uuid) for thread in target_threads],
+            status="queued",
+            lock=self.conn_lock,
+        )
+        scan_jobs: Dict[DiskWatcherThread, JobHandle] = dict(zip(target_threads, handles))
+        self.job_state_changed.set()
 
         if not parallel:
             targets = ", ".join(f"{thread.path} (volume={thread.uuid})" for thread in target_threads)
@@ -148,15 +184,18 @@ class DiskWatcherManager:
             for thread in target_threads:
                 job_handle = scan_jobs[thread]
                 job_handle.update(status="running")
+                self.job_state_changed.set()
                 try:
                     stats = thread.watcher.archive_existing_files(job_tracker=job_handle)
                 except Exception as exc:  # pragma: no cover - defensive guard
                     job_handle.fail(error=str(exc))
+                    self.job_state_changed.set()
                     raise
                 stats.setdefault("uuid", thread.uuid)
                 stats.setdefault("path", str(thread.path))
                 final_status = stats.get("status", "complete")
                 job_handle.complete(status=final_status, progress=stats)
+                self.job_state_changed.set()
                 results.append(stats)
             return results
 
@@ -245,6 +284,7 @@ class DiskWatcherManager:
                     final_status = stats.get("status", "complete")
                     job_handle.complete(status=final_status, progress=stats)
                     results.append(stats)
+                self.job_state_changed.set()
 
         return results
 
@@ -252,18 +292,17 @@ class DiskWatcherManager:
     def start_all(self):
         self._running = True
         threads = self._snapshot_threads()
+        unassigned = [t for t in threads if t.watch_job is None]
+        handles = JobHandle.start_many(
+            self.conn,
+            job_type="watcher",
+            targets=[(str(t.path), t.uuid) for t in unassigned],
+            status="starting",
+            lock=self.conn_lock,
+        )
+        for t, handle in zip(unassigned, handles):
+            t.set_watcher_job(handle)
         for t in threads:
-            if t.watch_job is None:
-                t.set_watcher_job(
-                    JobHandle.start(
-                        self.conn,
-                        job_type="watcher",
-                        path=str(t.path),
-                        volume_id=t.uuid,
-                        status="starting",
-                        lock=self.conn_lock,
-                    )
-                )
             if not t.is_alive():
                 t.start()
         logger.info(f"Started {len(threads)} watcher threads")
@@ -332,7 +371,7 @@ class DiskWatcherManager:
             )
 
     def remove_directory(self, path: Path) -> bool:
-        resolved = path.resolve()
+        resolved = resolve_path(path)
         with self._threads_lock:
             for idx, thread in enumerate(self.threads):
                 if thread.path == resolved:
@@ -361,16 +400,9 @@ class DiskWatcherManager:
         interval: float = 5.0,
         start_thread: bool = True,
     ) -> None:
-        def _resolve(candidate: Path) -> Path:
-            try:
-                return candidate.resolve()
-            except FileNotFoundError:
-                return candidate
-
-        normalized: List[Path] = []
-        for root in roots:
-            candidate = Path(root).expanduser()
-            normalized.append(_resolve(candidate))
+        # Roots may be symlinks retargeted since they were last resolved.
+        clear_resolve_cache()
+        normalized = [resolve_path(root) for root in roots]
 
         unique_roots = []
         seen: Set[Path] = set()
@@ -546,7 +578,9 @@ def _archive_directory_in_process(
 ) -> Dict[str, Any]:
     conn: Optional[sqlite3.Connection] = None
     try:
-        conn = init_db(path=Path(database_path), check_same_thread=False)
+        # The parent process migrated the catalog before fanning out, so each
+        # worker can skip the Alembic round-trip.
+        conn = init_db(path=Path(database_path), check_same_thread=False, ensure_schema=False)
         watcher = DiskWatcher(path, uuid=uuid, conn=conn)
         job_handle = JobHandle.attach(conn, job_id)
         job_handle.update(status="running")
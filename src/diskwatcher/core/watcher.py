@@ -11,16 +11,21 @@ from pathlib import Path
 from threading import Event, Lock
 from typing import Any, Optional, Iterable
 
-from diskwatcher.db import init_db, log_event
+from diskwatcher.db import init_db, log_event, log_events
 from diskwatcher.db.jobs import JobHandle
 from diskwatcher.utils.devices import get_mount_info
 from diskwatcher.utils.logging import get_logger
+from diskwatcher.utils.paths import resolve_path
 
 # logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(message)s")
 logger = get_logger(__name__)
 
 MOUNT_METADATA_INITIAL_REFRESH_SECONDS = 300
 MOUNT_METADATA_MAX_REFRESH_SECONDS = 3600
+# Archival scans commit this many "existing" events per transaction.
+ARCHIVE_BATCH_SIZE = 500
+# Live watch jobs bump their catalog row this often; stopping wakes at once.
+WATCH_HEARTBEAT_SECONDS = 10.0
 
 # Design notes (watch scaling, intentionally deferred):
 # A) Use non-recursive observers plus our own os.walk to apply exclude_patterns before scheduling per-directory watches.
@@ -134,6 +139,26 @@ class DiskWatcher(FileSystemEventHandler):
                     mount_metadata=metadata_payload,
                 )
 
+    def log_event_batch(self, events: list[tuple[str, str, Optional[str]]]) -> None:
+        """Persist ``(event_type, path, timestamp)`` rows in a single transaction."""
+
+        if not events:
+            return
+        mount_metadata = self._refresh_mount_metadata()
+        metadata_payload = dict(mount_metadata) if mount_metadata else None
+        if metadata_payload is not None:
+            metadata_payload.setdefault("source", "watcher")
+        args = (str(self.path), self.uuid, str(os.getpid()), metadata_payload)
+        if self.conn:
+            if self.conn_lock:
+                with self.conn_lock:
+                    log_events(self.conn, events, *args)
+            else:
+                log_events(self.conn, events, *args)
+        else:
+            with init_db() as conn:
+                log_events(conn, events, *args)
+
     def _is_excluded(self, path: str) -> bool:
         if not self.exclude_patterns:
             return False
@@ -197,12 +222,14 @@ class DiskWatcher(FileSystemEventHandler):
         if job_tracker:
             job_tracker.update(status="running", progress={"path": str(self.path)})
 
+        waiter = stop_event if stop_event is not None else Event()
+        timeout = 1.0 if run_once else WATCH_HEARTBEAT_SECONDS
         try:
             while True:
-                time.sleep(1)
+                stopped = waiter.wait(timeout)
                 if job_tracker:
                     job_tracker.heartbeat()
-                if run_once or (stop_event and stop_event.is_set()):
+                if run_once or stopped:
                     break
         finally:
             if observer is not None:
@@ -290,8 +317,16 @@ class DiskWatcher(FileSystemEventHandler):
             },
         )
 
+        pending: list[tuple[str, str, Optional[str]]] = []
+
+        def _flush() -> None:
+            if pending:
+                self.log_event_batch(pending)
+            pending.clear()
+
         for root, dirs, files in os.walk(self.path):
             if interruptible and self.stop_event.is_set():
+                _flush()
                 logger.info(
                     "initial_scan_interrupted root=%s volume_id=%s files=%d dirs=%d",
                     str(self.path),
@@ -329,13 +364,17 @@ class DiskWatcher(FileSystemEventHandler):
                 continue
 
             directories_seen += 1
+            # One listing, one timestamp: every file os.walk returned for
+            # this directory was seen at the same moment.
+            seen_at = datetime.now(timezone.utc).isoformat()
             for fname in files:
                 full = Path(root) / fname
                 if self._is_excluded(full):
                     continue
-                self.log_event("existing", str(full))
+                pending.append(("existing", str(full), seen_at))
                 files_scanned += 1
-                if files_scanned % 500 == 0:
+                if files_scanned % ARCHIVE_BATCH_SIZE == 0:
+                    _flush()
                     self.scan_stats.update(
                         {
                             "status": "running",
@@ -354,6 +393,7 @@ class DiskWatcher(FileSystemEventHandler):
                     if job_tracker:
                         job_tracker.heartbeat(progress=dict(self.scan_stats))
 
+        _flush()
         elapsed = time.time() - started_at
         logger.info(
             "initial_scan_complete root=%s volume_id=%s files=%d dirs=%d elapsed=%.2fs",
@@ -414,7 +454,7 @@ class DiskWatcherThread(threading.Thread):
         exclude_patterns: Optional[Iterable[str]] = None,
     ):
         super().__init__(daemon=True)
-        self.path = path.resolve()
+        self.path = resolve_path(path)
         self.uuid = uuid
         self.stop_event = threading.Event()
         self.conn = conn
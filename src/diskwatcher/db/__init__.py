@@ -1,8 +1,12 @@
-from .connection import init_db, init_db_readonly, create_schema
+from .connection import init_db, init_db_readonly, create_schema, read_snapshot
 from .events import (
     log_event,
+    log_events,
     query_events,
     fetch_volume_metadata,
+    fetch_volume_overview,
+    fetch_cached_mount_info,
+    store_mount_info,
     summarize_by_volume,
     summarize_files,
     query_events_since,
@@ -11,6 +15,7 @@ from .events import (
 from .jobs import (
     JobHandle,
     create_job,
+    create_jobs,
     update_job,
     complete_job,
     fail_job,
@@ -22,15 +27,21 @@ __all__ = [
     "init_db",
     "init_db_readonly",
     "create_schema",
+    "read_snapshot",
     "log_event",
+    "log_events",
     "query_events",
     "fetch_volume_metadata",
+    "fetch_volume_overview",
+    "fetch_cached_mount_info",
+    "store_mount_info",
     "summarize_by_volume",
     "summarize_files",
     "query_events_since",
     "ensure_volume_label_indices",
     "JobHandle",
     "create_job",
+    "create_jobs",
     "update_job",
     "complete_job",
     "fail_job",
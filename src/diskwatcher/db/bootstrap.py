@@ -0,0 +1,68 @@
+"""Fast-path schema bootstrap for freshly created catalogs."""
+
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+
+from diskwatcher.db.connection import SCHEMA_PATH, load_schema_sql
+
+_ALEMBIC_VERSION_DDL = (
+    "CREATE TABLE IF NOT EXISTS alembic_version ("
+    "version_num VARCHAR(32) NOT NULL, "
+    "CONSTRAINT alembic_version_pkc PRIMARY KEY (version_num))"
+)
+
+
+def build_bootstrap_script(
+    revision: str,
+    schema_path: Path = SCHEMA_PATH,
+    *,
+    user_version: int = 0,
+) -> str:
+    """Return one script that creates the head schema and stamps ``revision``."""
+
+    schema = load_schema_sql(schema_path)
+    return "\n".join(
+        (
+            "BEGIN;",
+            schema,
+            f"{_ALEMBIC_VERSION_DDL};",
+            "INSERT INTO alembic_version (version_num) "
+            f"SELECT '{revision}' WHERE NOT EXISTS (SELECT 1 FROM alembic_version);",
+            f"PRAGMA user_version = {int(user_version)};",
+            "COMMIT;",
+        )
+    )
+
+
+def is_empty_database(conn: sqlite3.Connection) -> bool:
+    """Return True when the connected database has no tables yet."""
+
+    row = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' LIMIT 1"
+    ).fetchone()
+    return row is None
+
+
+def bootstrap_if_empty(db_path: Path, revision: str, *, user_version: int = 0) -> bool:
+    """Apply the consolidated schema to an empty catalog in a single batch.
+
+    Fresh catalogs skip the per-revision Alembic walk: ``schema.sql`` already
+    mirrors the head revision, so it is applied with one ``executescript`` call
+    (one parse, one commit) and stamped with ``revision``. Returns False when
+    the database already has tables so callers fall back to regular upgrades.
+    """
+
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(db_path), timeout=30.0)
+    try:
+        if not is_empty_database(conn):
+            return False
+        conn.executescript(build_bootstrap_script(revision, user_version=user_version))
+        return True
+    finally:
+        conn.close()
+
+
+__all__ = ["build_bootstrap_script", "bootstrap_if_empty", "is_empty_database"]
@@ -1,12 +1,19 @@
+import re
 import sqlite3
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 from diskwatcher.utils import config as config_utils
 
 DB_DIR = config_utils.config_dir()
 DB_PATH = DB_DIR / "diskwatcher.db"
 SCHEMA_PATH = Path(__file__).resolve().parent.parent / "sql" / "schema.sql"
+STRICT_TABLES_SUPPORTED = sqlite3.sqlite_version_info >= (3, 37, 0)
+_STRICT_CLAUSE = re.compile(r"(,\s*|\s+)STRICT(?=\s*;)", re.IGNORECASE)
+# Prepared statements kept per connection; long-lived pollers (monitor,
+# stream, web server) reissue identical SQL and should never re-parse it.
+STATEMENT_CACHE_SIZE = 128
 
 
 def init_db(
@@ -14,8 +21,16 @@ def init_db(
     *,
     check_same_thread: bool = False,
     isolation_level: Optional[str] = None,
+    ensure_schema: bool = True,
+    query_only: bool = False,
 ) -> sqlite3.Connection:
-    """Initialize the SQLite catalog at the given path, creating schema if needed."""
+    """Initialize the SQLite catalog at the given path, creating schema if needed.
+
+    Pass ``ensure_schema=False`` when the caller knows the catalog is already
+    at head (for example scan workers spawned after the parent opened it) to
+    skip the migration check. ``query_only=True`` rejects writes once the
+    schema is in place, for CLI commands that only report.
+    """
     target_path = Path(path) if path is not None else DB_PATH
     target_dir = target_path.parent
     target_dir.mkdir(parents=True, exist_ok=True)
@@ -24,9 +39,13 @@ def init_db(
         check_same_thread=check_same_thread,
         isolation_level=isolation_level,
         timeout=30.0,
+        cached_statements=STATEMENT_CACHE_SIZE,
     )
     _configure_connection(conn, writable=True)
-    create_schema(conn)
+    if ensure_schema:
+        create_schema(conn)
+    if query_only:
+        conn.execute("PRAGMA query_only = ON")
     return conn
 
 
@@ -51,11 +70,42 @@ def init_db_readonly(
         check_same_thread=check_same_thread,
         isolation_level=isolation_level,
         timeout=30.0,
+        cached_statements=STATEMENT_CACHE_SIZE,
     )
     _configure_connection(conn, writable=False)
     return conn
 
 
+@contextmanager
+def read_snapshot(conn: sqlite3.Connection) -> Iterator[sqlite3.Connection]:
+    """Run the enclosed reads in one transaction on an autocommit connection.
+
+    The read lock is taken once instead of per statement, and every query
+    sees the same committed state even while a watcher keeps writing. The
+    block must only read. A connection already inside a transaction is used
+    as is.
+    """
+
+    if conn.in_transaction:
+        yield conn
+        return
+    conn.execute("BEGIN")
+    try:
+        yield conn
+    finally:
+        if conn.in_transaction:
+            conn.execute("COMMIT")
+
+
+def load_schema_sql(schema_path: Path = SCHEMA_PATH) -> str:
+    """Return the static schema, dropping STRICT where SQLite lacks it."""
+
+    schema = schema_path.read_text()
+    if not STRICT_TABLES_SUPPORTED:
+        schema = _STRICT_CLAUSE.sub("", schema)
+    return schema
+
+
 def create_schema(conn: sqlite3.Connection, schema_path: Path = SCHEMA_PATH) -> None:
     """Ensure the catalog schema exists on the provided connection."""
 
@@ -75,7 +125,7 @@ def create_schema(conn: sqlite3.Connection, schema_path: Path = SCHEMA_PATH) ->
     # In-memory databases (primarily for tests) fall back to the static schema.
     from diskwatcher.db.migration import BASELINE_REVISION  # Local import avoids cycles
 
-    schema = schema_path.read_text()
+    schema = load_schema_sql(schema_path)
     with conn:
         conn.executescript(schema)
         conn.execute(
@@ -93,9 +143,19 @@ def _configure_connection(conn: sqlite3.Connection, *, writable: bool) -> None:
 
     conn.execute("PRAGMA foreign_keys = ON")
     conn.execute("PRAGMA busy_timeout = 10000")
+    # 64 MiB page cache, 256 MiB memory map and in-memory temp b-trees keep
+    # dashboard aggregations and progress polls off the disk.
+    conn.execute("PRAGMA cache_size = -65536")
+    conn.execute("PRAGMA mmap_size = 268435456")
+    conn.execute("PRAGMA temp_store = MEMORY")
     if writable:
         try:
             conn.execute("PRAGMA journal_mode = WAL")
         except sqlite3.OperationalError:
             # WAL is not supported for in-memory databases; ignore quietly.
             pass
+        # WAL stays consistent with NORMAL; only the last commits before a
+        # power loss may be rolled back.
+        conn.execute("PRAGMA synchronous = NORMAL")
+        # Let bursty scans grow the WAL before checkpointing (per connection).
+        conn.execute("PRAGMA wal_autocheckpoint = 10000")
@@ -7,9 +7,11 @@ import logging
 import shutil
 import sqlite3
 import time
-from datetime import datetime, timezone
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
 
 
 logger = logging.getLogger(__name__)
@@ -20,7 +22,48 @@ _FILE_IGNORE_SUFFIXES = {".lock", ".tmp", ".swp", ".swx", "~"}
 _FILE_IGNORE_NAMES = {".DS_Store", "Thumbs.db"}
 _DB_MAX_RETRIES = 3
 _DB_RETRY_DELAY_BASE = 0.05
-
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+_VOLUME_METADATA_COLUMNS: Tuple[str, ...] = (
+    "volume_id",
+    "directory",
+    "label_index",
+    "event_count",
+    "created_count",
+    "modified_count",
+    "deleted_count",
+    "last_event_timestamp",
+    "usage_total_bytes",
+    "usage_used_bytes",
+    "usage_free_bytes",
+    "usage_refreshed_at",
+    "mount_device",
+    "mount_point",
+    "mount_uuid",
+    "mount_label",
+    "mount_volume_id",
+    "lsblk_name",
+    "lsblk_path",
+    "lsblk_model",
+    "lsblk_serial",
+    "lsblk_vendor",
+    "lsblk_size",
+    "lsblk_fsver",
+    "lsblk_pttype",
+    "lsblk_ptuuid",
+    "lsblk_parttype",
+    "lsblk_partuuid",
+    "lsblk_parttypename",
+    "lsblk_wwn",
+    "lsblk_maj_min",
+    "lsblk_json",
+    "identity_refreshed_at",
+)
+_VOLUME_METADATA_SELECT = ", ".join(_VOLUME_METADATA_COLUMNS)
+# One literal so every ``stream`` poll hits the connection's statement cache.
+_EVENTS_SINCE_SQL = (
+    "SELECT rowid AS rowid, * FROM events WHERE rowid > ? ORDER BY rowid ASC LIMIT ?"
+)
 
 
 def log_event(
@@ -35,88 +78,231 @@ def log_event(
 ) -> None:
     """Persist an event and refresh derived metadata."""
 
-    if timestamp is None:
-        timestamp = datetime.now(timezone.utc).isoformat()
-
     with conn:
-        _execute_with_retry(
+        _record_event(
             conn,
-            """
-            INSERT INTO events (timestamp, event_type, path, directory, volume_id, process_id)
-            VALUES (?, ?, ?, ?, ?, ?)
-            """,
-            (timestamp, event_type, path, directory, volume_id, process_id),
+            event_type,
+            path,
+            directory,
+            volume_id,
+            process_id,
+            timestamp,
+            mount_metadata,
         )
-        try:
-            _update_volume_metadata(
+
+
+def log_events(
+    conn: sqlite3.Connection,
+    events: Iterable[Tuple[str, str, Optional[str]]],
+    directory: str,
+    volume_id: str,
+    process_id: Optional[str] = None,
+    mount_metadata: Optional[Dict[str, Any]] = None,
+) -> int:
+    """Persist a batch of ``(event_type, path, timestamp)`` rows in one transaction.
+
+    Each row gets the same derived-metadata updates as ``log_event``; batching
+    only changes how often the catalog commits. Returns the number of rows.
+    """
+
+    count = 0
+    with _transaction(conn):
+        for event_type, path, timestamp in events:
+            _record_event(
                 conn,
-                volume_id,
-                directory,
                 event_type,
+                path,
+                directory,
+                volume_id,
+                process_id,
                 timestamp,
-                mount_metadata=mount_metadata,
+                mount_metadata,
             )
-        except Exception:  # pragma: no cover - defensive guard
-            logger.exception("Failed to update volume metadata", extra={"volume_id": volume_id})
-        try:
-            _update_file_metadata(conn, event_type, path, directory, volume_id, timestamp)
-        except Exception:  # pragma: no cover - defensive guard
-            logger.exception("Failed to update file metadata", extra={"path": path})
+            count += 1
+    return count
 
 
-def query_events(conn: sqlite3.Connection, limit: int = 100) -> List[Dict[str, Any]]:
+def _record_event(
+    conn: sqlite3.Connection,
+    event_type: str,
+    path: str,
+    directory: str,
+    volume_id: str,
+    process_id: Optional[str],
+    timestamp: Optional[str],
+    mount_metadata: Optional[Dict[str, Any]],
+) -> None:
+    if timestamp is None:
+        now = datetime.now(timezone.utc)
+        timestamp = now.isoformat()
+        timestamp_us = _datetime_to_us(now)
+    else:
+        timestamp_us = _timestamp_to_us(timestamp)
+
+    _execute_with_retry(
+        conn,
+        """
+        INSERT INTO events
+            (timestamp, event_type, path, directory, volume_id, process_id, timestamp_us)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+        """,
+        (timestamp, event_type, path, directory, volume_id, process_id, timestamp_us),
+    )
+    try:
+        _update_volume_metadata(
+            conn,
+            volume_id,
+            directory,
+            event_type,
+            timestamp,
+            mount_metadata=mount_metadata,
+        )
+    except Exception:  # pragma: no cover - defensive guard
+        logger.exception("Failed to update volume metadata", extra={"volume_id": volume_id})
+    try:
+        _update_file_metadata(conn, event_type, path, directory, volume_id, timestamp)
+    except Exception:  # pragma: no cover - defensive guard
+        logger.exception("Failed to update file metadata", extra={"path": path})
+
+
+@contextmanager
+def _transaction(conn: sqlite3.Connection) -> Iterator[None]:
+    """Group statements into one transaction, even on autocommit connections."""
+
+    if conn.isolation_level is not None or conn.in_transaction:
+        with conn:
+            yield
+        return
+
+    conn.execute("BEGIN")
+    try:
+        yield
+    except BaseException:
+        conn.rollback()
+        raise
+    else:
+        conn.commit()
+
+
+def query_events(
+    conn: sqlite3.Connection,
+    limit: int = 100,
+    *,
+    volume_id: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """Return the most recent events, optionally restricted to one volume."""
+
     conn.row_factory = sqlite3.Row
-    rows = conn.execute(
-        "SELECT * FROM events ORDER BY timestamp DESC LIMIT ?", (limit,)
-    ).fetchall()
-    return [dict(row) for row in rows]
+    if volume_id is None:
+        cursor = conn.execute(
+            "SELECT * FROM events ORDER BY timestamp_us DESC LIMIT ?", (limit,)
+        )
+    else:
+        # Served by idx_events_volume_ts as an ordered index walk.
+        cursor = conn.execute(
+            "SELECT * FROM events WHERE volume_id = ? ORDER BY timestamp_us DESC LIMIT ?",
+            (volume_id, limit),
+        )
+    # Iterating the cursor converts rows as they are stepped, so no list of
+    # sqlite3.Row objects is held alongside the dicts.
+    return [dict(row) for row in cursor]
 
 
 def fetch_volume_metadata(conn: sqlite3.Connection) -> List[Dict[str, Any]]:
     """Return raw metadata stored for each tracked volume."""
 
-    conn.row_factory = sqlite3.Row
-    rows = conn.execute(
-        """
-        SELECT
-            volume_id,
-            directory,
-            label_index,
-            event_count,
-            created_count,
-            modified_count,
-            deleted_count,
-            last_event_timestamp,
-            usage_total_bytes,
-            usage_used_bytes,
-            usage_free_bytes,
-            usage_refreshed_at,
-            mount_device,
-            mount_point,
-            mount_uuid,
-            mount_label,
-            mount_volume_id,
-            lsblk_name,
-            lsblk_path,
-            lsblk_model,
-            lsblk_serial,
-            lsblk_vendor,
-            lsblk_size,
-            lsblk_fsver,
-            lsblk_pttype,
-            lsblk_ptuuid,
-            lsblk_parttype,
-            lsblk_partuuid,
-            lsblk_parttypename,
-            lsblk_wwn,
-            lsblk_maj_min,
-            lsblk_json,
-            identity_refreshed_at
+    # The column list is fixed, so plain tuples zipped against it skip the
+    # per-row ``sqlite3.Row`` wrapper and its name lookups.
+    cursor = conn.cursor()
+    cursor.row_factory = None
+    cursor.execute(
+        f"""
+        SELECT {_VOLUME_METADATA_SELECT}
         FROM volumes
-        ORDER BY (last_event_timestamp IS NULL), last_event_timestamp DESC, volume_id
+        ORDER BY last_event_timestamp DESC, volume_id
         """
-    ).fetchall()
-    return [dict(row) for row in rows]
+    )
+    columns = _VOLUME_METADATA_COLUMNS
+    return [dict(zip(columns, row)) for row in cursor]
+
+
+def fetch_volume_overview(conn: sqlite3.Connection) -> List[Dict[str, Any]]:
+    """Return stored volume metadata together with its aggregate aliases.
+
+    One query replaces the ``summarize_by_volume`` plus
+    ``fetch_volume_metadata`` pair: rows carry every metadata column alongside
+    ``total_events``/``created``/``modified``/``deleted``/``last_seen``.
+    Legacy catalogs without volume rows fall back to event aggregates, which
+    have no metadata columns.
+    """
+
+    conn.row_factory = sqlite3.Row
+    try:
+        rows = conn.execute(
+            f"""
+            SELECT
+                {_VOLUME_METADATA_SELECT},
+                event_count AS total_events,
+                created_count AS created,
+                modified_count AS modified,
+                deleted_count AS deleted,
+                NULL AS first_seen,
+                last_event_timestamp AS last_seen
+            FROM volumes
+            ORDER BY last_event_timestamp DESC, volume_id
+            """
+        ).fetchall()
+    except sqlite3.OperationalError:
+        rows = []
+
+    if rows:
+        return [dict(row) for row in rows]
+    return _summarize_events_by_volume(conn)
+
+
+def fetch_cached_mount_info(
+    conn: sqlite3.Connection,
+    directory: str,
+    *,
+    max_age: float,
+    device_id: Optional[int] = None,
+) -> Optional[Dict[str, Any]]:
+    """Return the cached mount payload for ``directory`` if it is fresh enough.
+
+    When ``device_id`` (the directory's ``st_dev``) is given, an entry stored
+    for a different device is ignored, so swapping the media mounted at the
+    same path never serves the previous volume's identity.
+    """
+
+    row = conn.execute(
+        "SELECT payload_json, device_id FROM mount_cache "
+        "WHERE directory = ? AND refreshed_at > ?",
+        (directory, time.time() - max_age),
+    ).fetchone()
+    if row is None or (device_id is not None and row[1] != device_id):
+        return None
+    try:
+        payload = json.loads(row[0])
+    except ValueError:
+        return None
+    return payload if isinstance(payload, dict) else None
+
+
+def store_mount_info(
+    conn: sqlite3.Connection,
+    directory: str,
+    mount_info: Dict[str, Any],
+    *,
+    device_id: Optional[int] = None,
+) -> None:
+    """Remember a live ``get_mount_info`` payload for ``directory``."""
+
+    _execute_with_retry(
+        conn,
+        "INSERT OR REPLACE INTO mount_cache "
+        "(directory, payload_json, refreshed_at, device_id) VALUES (?, ?, ?, ?)",
+        (directory, json.dumps(mount_info), time.time(), device_id),
+    )
 
 
 def summarize_by_volume(conn: sqlite3.Connection) -> List[Dict[str, Any]]:
@@ -136,7 +322,7 @@ def summarize_by_volume(conn: sqlite3.Connection) -> List[Dict[str, Any]]:
                 NULL AS first_seen,
                 last_event_timestamp AS last_seen
             FROM volumes
-            ORDER BY (last_event_timestamp IS NULL), last_event_timestamp DESC, volume_id
+            ORDER BY last_event_timestamp DESC, volume_id
             """
         ).fetchall()
     except sqlite3.OperationalError:
@@ -144,8 +330,12 @@ def summarize_by_volume(conn: sqlite3.Connection) -> List[Dict[str, Any]]:
 
     if rows:
         return [dict(row) for row in rows]
+    return _summarize_events_by_volume(conn)
+
 
+def _summarize_events_by_volume(conn: sqlite3.Connection) -> List[Dict[str, Any]]:
     # Compatibility fallback for legacy catalogs that only have raw events.
+    conn.row_factory = sqlite3.Row
     rows = conn.execute(
         """
         SELECT
@@ -170,7 +360,7 @@ def summarize_files(conn: sqlite3.Connection, limit: int = 20) -> List[Dict[str,
 
     conn.row_factory = sqlite3.Row
     try:
-        rows = conn.execute(
+        cursor = conn.execute(
             """
             SELECT
                 f.path,
@@ -204,19 +394,20 @@ def summarize_files(conn: sqlite3.Connection, limit: int = 20) -> List[Dict[str,
                     )
                 ) AS last_event_type
             FROM files AS f
-            ORDER BY (f.last_event_timestamp IS NULL), f.last_event_timestamp DESC, f.path
+            ORDER BY f.last_event_timestamp DESC, f.volume_id, f.path
             LIMIT ?
             """,
             (limit,),
-        ).fetchall()
+        )
+        results = [dict(row) for row in cursor]
     except sqlite3.OperationalError:
-        rows = []
+        results = []
 
-    if rows:
-        return [dict(row) for row in rows]
+    if results:
+        return results
 
     # Compatibility fallback for legacy catalogs that only have raw events.
-    rows = conn.execute(
+    cursor = conn.execute(
         """
         SELECT
             e.path,
@@ -239,8 +430,8 @@ def summarize_files(conn: sqlite3.Connection, limit: int = 20) -> List[Dict[str,
         LIMIT ?
         """,
         (limit,),
-    ).fetchall()
-    return [dict(row) for row in rows]
+    )
+    return [dict(row) for row in cursor]
 
 
 def query_events_since(
@@ -251,11 +442,7 @@ def query_events_since(
     """Fetch events with a rowid greater than ``last_rowid``."""
 
     conn.row_factory = sqlite3.Row
-    rows = conn.execute(
-        "SELECT rowid AS rowid, * FROM events WHERE rowid > ? ORDER BY rowid ASC LIMIT ?",
-        (last_rowid, limit),
-    ).fetchall()
-    return [dict(row) for row in rows]
+    return [dict(row) for row in conn.execute(_EVENTS_SINCE_SQL, (last_rowid, limit))]
 
 
 def ensure_volume_label_indices(conn: sqlite3.Connection) -> None:
@@ -544,6 +731,22 @@ def _parse_iso(raw: Optional[str]) -> datetime:
         return datetime.fromtimestamp(0, tz=timezone.utc)
 
 
+def _datetime_to_us(value: datetime) -> int:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return (value - _EPOCH) // timedelta(microseconds=1)
+
+
+def _timestamp_to_us(raw: str) -> Optional[int]:
+    """Convert an ISO-8601 event timestamp to epoch microseconds (UTC)."""
+
+    candidate = raw[:-1] + "+00:00" if raw.endswith("Z") else raw
+    try:
+        return _datetime_to_us(datetime.fromisoformat(candidate))
+    except ValueError:
+        return None
+
+
 def _execute_with_retry(conn: sqlite3.Connection, sql: str, params: tuple[Any, ...]) -> None:
     for attempt in range(_DB_MAX_RETRIES):
         try:
@@ -556,19 +759,21 @@ def _execute_with_retry(conn: sqlite3.Connection, sql: str, params: tuple[Any, .
             if attempt == _DB_MAX_RETRIES - 1:
                 raise
             time.sleep(_DB_RETRY_DELAY_BASE * (2 ** attempt))
-_LSBLK_COLUMN_MAP: Dict[str, str] = {
-    "NAME": "lsblk_name",
-    "PATH": "lsblk_path",
-    "MODEL": "lsblk_model",
-    "SERIAL": "lsblk_serial",
-    "VENDOR": "lsblk_vendor",
-    "SIZE": "lsblk_size",
-    "FSVER": "lsblk_fsver",
-    "PTTYPE": "lsblk_pttype",
-    "PTUUID": "lsblk_ptuuid",
-    "PARTTYPE": "lsblk_parttype",
-    "PARTUUID": "lsblk_partuuid",
-    "PARTTYPENAME": "lsblk_parttypename",
-    "WWN": "lsblk_wwn",
-    "MAJ:MIN": "lsblk_maj_min",
-}
+_LSBLK_COLUMN_MAP: Mapping[str, str] = MappingProxyType(
+    {
+        "NAME": "lsblk_name",
+        "PATH": "lsblk_path",
+        "MODEL": "lsblk_model",
+        "SERIAL": "lsblk_serial",
+        "VENDOR": "lsblk_vendor",
+        "SIZE": "lsblk_size",
+        "FSVER": "lsblk_fsver",
+        "PTTYPE": "lsblk_pttype",
+        "PTUUID": "lsblk_ptuuid",
+        "PARTTYPE": "lsblk_parttype",
+        "PARTUUID": "lsblk_partuuid",
+        "PARTTYPENAME": "lsblk_parttypename",
+        "WWN": "lsblk_wwn",
+        "MAJ:MIN": "lsblk_maj_min",
+    }
+)
@@ -4,12 +4,17 @@ from __future__ import annotations
 
 import json
 import os
-import socket
 import sqlite3
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from threading import Lock
-from typing import Any, Dict, Iterable, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+def _hostname() -> str:
+    import socket  # Deferred: only job ownership needs it, not CLI start-up.
+
+    return socket.gethostname()
 
 
 def _iso_now() -> str:
@@ -47,7 +52,7 @@ def create_job(
 ) -> str:
     job_id = job_id or os.urandom(16).hex()
     owner_pid = owner_pid or str(os.getpid())
-    owner_host = owner_host or socket.gethostname()
+    owner_host = owner_host or _hostname()
     now = _iso_now()
     _execute(
         conn,
@@ -74,6 +79,42 @@ def create_job(
     return job_id
 
 
+def create_jobs(
+    conn: sqlite3.Connection,
+    *,
+    job_type: str,
+    targets: Iterable[Tuple[Optional[str], Optional[str]]],
+    status: str = "queued",
+    lock: Optional[Lock] = None,
+) -> List[str]:
+    """Insert one job per ``(path, volume_id)`` target in a single transaction."""
+
+    owner_pid = str(os.getpid())
+    owner_host = _hostname()
+    now = _iso_now()
+    rows = [
+        (os.urandom(16).hex(), job_type, path, volume_id, status, None, owner_pid, owner_host, now, now)
+        for path, volume_id in targets
+    ]
+    if not rows:
+        return []
+
+    statement = """
+        INSERT INTO jobs
+            (job_id, job_type, path, volume_id, status, progress_json,
+             owner_pid, owner_host, started_at, updated_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """
+    if lock:
+        with lock:
+            with conn:
+                conn.executemany(statement, rows)
+    else:
+        with conn:
+            conn.executemany(statement, rows)
+    return [row[0] for row in rows]
+
+
 def update_job(
     conn: sqlite3.Connection,
     job_id: str,
@@ -167,8 +208,7 @@ def fetch_jobs(
         query += " LIMIT ?"
         params = (*params, limit)
 
-    rows = conn.execute(query, params).fetchall()
-    return [dict(row) for row in rows]
+    return [dict(row) for row in conn.execute(query, params)]
 
 
 def cleanup_stale_jobs(
@@ -185,7 +225,7 @@ def cleanup_stale_jobs(
     Returns the number of jobs marked stale.
     """
 
-    hostname = socket.gethostname()
+    hostname = _hostname()
 
     conn.row_factory = sqlite3.Row
     rows = conn.execute(
@@ -268,6 +308,25 @@ class JobHandle:
         )
         return cls(conn=conn, job_id=created_id, lock=lock)
 
+    @classmethod
+    def start_many(
+        cls,
+        conn: sqlite3.Connection,
+        *,
+        job_type: str,
+        targets: Iterable[Tuple[Optional[str], Optional[str]]],
+        status: str = "queued",
+        lock: Optional[Lock] = None,
+    ) -> List["JobHandle"]:
+        created_ids = create_jobs(
+            conn,
+            job_type=job_type,
+            targets=targets,
+            status=status,
+            lock=lock,
+        )
+        return [cls(conn=conn, job_id=job_id, lock=lock) for job_id in created_ids]
+
     @classmethod
     def attach(
         cls,
@@ -317,6 +376,7 @@ class JobHandle:
 __all__ = [
     "JobHandle",
     "create_job",
+    "create_jobs",
     "update_job",
     "complete_job",
     "fail_job",
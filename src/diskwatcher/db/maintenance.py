@@ -0,0 +1,137 @@
+"""Index maintenance helpers for bulk archival scans."""
+
+from __future__ import annotations
+
+import re
+import sqlite3
+from datetime import datetime, timezone
+from threading import Lock
+from typing import Optional, Sequence
+
+from diskwatcher.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Tables written row-by-row during the archival sweep. Only their secondary
+# (named, non-unique) indexes are deferred; primary keys, autoindexes and
+# UNIQUE indexes stay in place so the upsert paths in ``events.log_event``
+# keep working.
+HOT_INDEX_TABLES: Sequence[str] = ("events", "files")
+DEFERRED_INDEX_MIN_ROWS = 1000
+_CREATE_INDEX = re.compile(
+    r"^\s*CREATE\s+(UNIQUE\s+)?INDEX\s+(?!IF\s+NOT\s+EXISTS\b)", re.IGNORECASE
+)
+
+
+def _has_min_rows(conn: sqlite3.Connection, table: str, min_rows: int) -> bool:
+    if min_rows <= 0:
+        return True
+    row = conn.execute(
+        f"SELECT 1 FROM {table} LIMIT 1 OFFSET ?", (min_rows - 1,)
+    ).fetchone()
+    return row is not None
+
+
+def drop_hot_indexes(
+    conn: sqlite3.Connection,
+    *,
+    min_rows: int = DEFERRED_INDEX_MIN_ROWS,
+    lock: Optional[Lock] = None,
+) -> list[str]:
+    """Drop secondary indexes on hot tables before a bulk load.
+
+    The index DDL is saved to ``deferred_indexes`` in the same transaction as
+    the drop so ``rebuild_hot_indexes`` can restore it even after a crash.
+    Catalogs with fewer than ``min_rows`` events keep their indexes because
+    incremental maintenance is cheaper than a rebuild at that size.
+    """
+
+    def _drop() -> list[str]:
+        if not _has_min_rows(conn, "events", min_rows):
+            return []
+        placeholders = ", ".join("?" for _ in HOT_INDEX_TABLES)
+        rows = conn.execute(
+            f"""
+            SELECT m.name, m.tbl_name, m.sql
+            FROM sqlite_master AS m
+            JOIN pragma_index_list(m.tbl_name) AS il ON il.name = m.name
+            WHERE m.type = 'index'
+              AND m.sql IS NOT NULL
+              AND m.tbl_name IN ({placeholders})
+              AND il."unique" = 0
+            ORDER BY m.name
+            """,
+            tuple(HOT_INDEX_TABLES),
+        ).fetchall()
+        if not rows:
+            return []
+
+        now = datetime.now(timezone.utc).isoformat()
+        with conn:
+            for name, tbl_name, sql in rows:
+                conn.execute(
+                    "INSERT OR REPLACE INTO deferred_indexes (name, tbl_name, sql, deferred_at) "
+                    "VALUES (?, ?, ?, ?)",
+                    (name, tbl_name, sql, now),
+                )
+                conn.execute(f'DROP INDEX IF EXISTS "{name}"')
+        return [row[0] for row in rows]
+
+    if lock:
+        with lock:
+            dropped = _drop()
+    else:
+        dropped = _drop()
+    if dropped:
+        logger.info("deferred_indexes_dropped", extra={"indexes": dropped})
+    return dropped
+
+
+def rebuild_hot_indexes(
+    conn: sqlite3.Connection,
+    *,
+    lock: Optional[Lock] = None,
+) -> list[str]:
+    """Recreate indexes recorded by ``drop_hot_indexes``.
+
+    Each index is rebuilt and removed from ``deferred_indexes`` in its own
+    transaction so writers are never blocked behind one giant rebuild.
+    """
+
+    def _pending() -> list[tuple[str, str]]:
+        return conn.execute(
+            "SELECT name, sql FROM deferred_indexes ORDER BY name"
+        ).fetchall()
+
+    if lock:
+        with lock:
+            pending = _pending()
+    else:
+        pending = _pending()
+
+    rebuilt: list[str] = []
+    for name, sql in pending:
+        statement = _CREATE_INDEX.sub(
+            lambda match: f"CREATE {match.group(1) or ''}INDEX IF NOT EXISTS ", sql, 1
+        )
+        if lock:
+            lock.acquire()
+        try:
+            with conn:
+                conn.execute(statement)
+                conn.execute("DELETE FROM deferred_indexes WHERE name = ?", (name,))
+        finally:
+            if lock:
+                lock.release()
+        rebuilt.append(name)
+    if rebuilt:
+        logger.info("deferred_indexes_rebuilt", extra={"indexes": rebuilt})
+    return rebuilt
+
+
+__all__ = [
+    "DEFERRED_INDEX_MIN_ROWS",
+    "HOT_INDEX_TABLES",
+    "drop_hot_indexes",
+    "rebuild_hot_indexes",
+]
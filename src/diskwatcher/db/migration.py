@@ -2,24 +2,54 @@
 
 from __future__ import annotations
 
+import sqlite3
+import time
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Dict, Iterator, Optional
 
-from alembic import command
-from alembic.config import Config
+try:  # pragma: no cover - platform dependent
+    import fcntl
+except ImportError:  # pragma: no cover - Windows has no flock
+    fcntl = None  # type: ignore[assignment]
 
 from diskwatcher.db.connection import DB_PATH
 
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from alembic.config import Config
+
+# Alembic (and SQLAlchemy underneath it) costs a few hundred milliseconds to
+# import, so it is loaded inside the helpers that actually need it rather than
+# on every CLI start-up.
+
 _DEFAULT_ALEMBIC_INI = Path(__file__).resolve().parent.parent.parent / "alembic.ini"
 BASELINE_REVISION = "0002_volume_and_file_metadata"
+# Keep in sync with the newest file in migrations/versions and sql/schema.sql.
+HEAD_REVISION = "0020_mount_cache_device_id"
+# Mirrored into PRAGMA user_version once a catalog reaches HEAD_REVISION so
+# start-up can skip Alembic with a single header read.
+SCHEMA_VERSION = int(HEAD_REVISION.split("_", 1)[0])
+
+_MIGRATION_LOCK_TIMEOUT = 120.0
+_MIGRATION_LOCK_INITIAL_DELAY = 0.05
+_MIGRATION_LOCK_MAX_DELAY = 2.0
 
 
 def build_alembic_config(
     *,
     ini_path: Optional[Path] = None,
     database_url: Optional[str] = None,
+    tune: bool = False,
+    execution_options: Optional[Dict[str, Any]] = None,
 ) -> Config:
-    """Return an Alembic ``Config`` primed for the current workspace."""
+    """Return an Alembic ``Config`` primed for the current workspace.
+
+    When ``tune`` is set the migration environment switches the connection to
+    WAL with relaxed ``synchronous``/in-memory temp storage before running
+    revisions, and issues ``PRAGMA optimize`` once they finish.
+    ``execution_options`` are applied to the engine the environment creates
+    (for example a shared ``compiled_cache`` for autogenerate reflection).
+    """
     ini = ini_path or _DEFAULT_ALEMBIC_INI
     if not ini.exists():
         # Fallback for editable installs or sandbox runs where the default
@@ -29,6 +59,8 @@ def build_alembic_config(
         if candidate.exists():
             ini = candidate
 
+    from alembic.config import Config
+
     config = Config(str(ini))
     if database_url is None:
         database_url = f"sqlite:///{DB_PATH}"
@@ -42,6 +74,9 @@ def build_alembic_config(
             "script_location",
             str(Path(ini).parent / "migrations"),
         )
+    config.attributes["tune_sqlite"] = tune
+    if execution_options:
+        config.attributes["execution_options"] = dict(execution_options)
     return config
 
 
@@ -51,10 +86,120 @@ def upgrade(
     ini_path: Optional[Path] = None,
     database_url: Optional[str] = None,
 ) -> None:
-    """Upgrade the catalog schema to the requested revision."""
+    """Upgrade the catalog schema to the requested revision.
+
+    Catalogs whose ``PRAGMA user_version`` already equals ``SCHEMA_VERSION``
+    return immediately without loading Alembic. Empty file-backed catalogs
+    upgraded to head are bootstrapped from the consolidated schema in one
+    batch instead of replaying every revision.
+    """
+
+    to_head = revision in ("head", HEAD_REVISION)
+    db_path = _sqlite_file_path(database_url or f"sqlite:///{DB_PATH}")
+    if to_head and db_path is not None and _schema_is_current(db_path):
+        return
+
+    config = build_alembic_config(ini_path=ini_path, database_url=database_url, tune=True)
+    with _migration_lock(db_path):
+        if to_head and db_path is not None:
+            if _schema_is_current(db_path):
+                return
+
+            from diskwatcher.db.bootstrap import bootstrap_if_empty
+
+            if bootstrap_if_empty(db_path, HEAD_REVISION, user_version=SCHEMA_VERSION):
+                return
+        from alembic import command
+
+        command.upgrade(config, revision)
+
+
+def _schema_is_current(db_path: Path) -> bool:
+    """Return True when the catalog's ``user_version`` marks it as head."""
+
+    if not db_path.exists():
+        return False
+    try:
+        conn = sqlite3.connect(str(db_path), timeout=30.0)
+    except sqlite3.Error:
+        return False
+    try:
+        return conn.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
+    except sqlite3.Error:
+        return False
+    finally:
+        conn.close()
 
-    config = build_alembic_config(ini_path=ini_path, database_url=database_url)
-    command.upgrade(config, revision)
+
+@contextmanager
+def _migration_lock(db_path: Optional[Path]) -> Iterator[None]:
+    """Serialise schema upgrades across processes sharing one catalog.
+
+    Uses an advisory ``flock`` on ``<catalog>.migrate.lock``; a process that
+    loses the race backs off exponentially until the winner finishes, then
+    runs its own (by then no-op) upgrade. SQLite's own locks cannot be used
+    here because the batched migration scripts commit part-way through.
+    """
+
+    if db_path is None or fcntl is None:
+        yield
+        return
+
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    lock_path = db_path.with_name(db_path.name + ".migrate.lock")
+    with lock_path.open("a") as handle:
+        delay = _MIGRATION_LOCK_INITIAL_DELAY
+        deadline = time.monotonic() + _MIGRATION_LOCK_TIMEOUT
+        while True:
+            try:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                break
+            except BlockingIOError:
+                if time.monotonic() >= deadline:
+                    raise TimeoutError(f"Timed out waiting for migration lock {lock_path}")
+                time.sleep(delay)
+                delay = min(delay * 2, _MIGRATION_LOCK_MAX_DELAY)
+        try:
+            yield
+        finally:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+
+def _sqlite_file_path(url: Optional[str]) -> Optional[Path]:
+    """Return the on-disk path for a file-backed SQLite URL, else None."""
+
+    if not url:
+        return None
+    scheme, sep, remainder = url.partition("://")
+    if not sep or scheme.split("+", 1)[0] != "sqlite":
+        return None
+    # sqlite:///relative.db and sqlite:////abs/path.db (SQLAlchemy semantics).
+    database = remainder[1:] if remainder.startswith("/") else remainder
+    database = database.split("?", 1)[0]
+    if not database or database == ":memory:" or database.startswith("file:"):
+        return None
+    return Path(database)
+
+
+def optimize_database(database_url: Optional[str] = None) -> None:
+    """Refresh planner statistics with a bounded ``PRAGMA optimize`` pass."""
+
+    db_path = _sqlite_file_path(database_url or f"sqlite:///{DB_PATH}")
+    if db_path is None or not db_path.exists():
+        return
+    conn = sqlite3.connect(str(db_path), timeout=30.0)
+    try:
+        optimize_connection(conn)
+    finally:
+        conn.close()
+
+
+def optimize_connection(conn: sqlite3.Connection) -> None:
+    """Run a bounded ``PRAGMA optimize`` on an already open connection."""
+
+    # Cap the rows ANALYZE samples per index so large catalogs stay fast.
+    conn.execute("PRAGMA analysis_limit = 400")
+    conn.execute("PRAGMA optimize")
 
 
 def stamp(
@@ -66,4 +211,6 @@ def stamp(
     """Stamp the database with a specific revision without running migrations."""
 
     config = build_alembic_config(ini_path=ini_path, database_url=database_url)
+    from alembic import command
+
     command.stamp(config, revision)
@@ -1,17 +1,19 @@
 -- schema.sql
+-- STRICT is stripped by load_schema_sql() on SQLite older than 3.37.
 CREATE TABLE IF NOT EXISTS events (
-    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    id INTEGER PRIMARY KEY,
     timestamp TEXT NOT NULL,
     event_type TEXT NOT NULL,
     path TEXT NOT NULL,
     directory TEXT NOT NULL,
     volume_id TEXT NOT NULL,
-    process_id TEXT
-);
+    process_id TEXT,
+    timestamp_us INTEGER
+) STRICT;
 
 CREATE INDEX IF NOT EXISTS idx_events_path ON events (path);
-CREATE INDEX IF NOT EXISTS idx_events_volume ON events (volume_id);
-CREATE INDEX IF NOT EXISTS idx_events_timestamp ON events (timestamp);
+CREATE INDEX IF NOT EXISTS idx_events_volume_ts ON events (volume_id, timestamp_us DESC);
+CREATE INDEX IF NOT EXISTS idx_events_timestamp_us ON events (timestamp_us);
 CREATE INDEX IF NOT EXISTS idx_events_volume_path ON events (volume_id, path);
 
 CREATE TABLE IF NOT EXISTS volumes (
@@ -49,7 +51,7 @@ CREATE TABLE IF NOT EXISTS volumes (
     lsblk_json TEXT,
     identity_refreshed_at TEXT,
     events_since_refresh INTEGER NOT NULL DEFAULT 0
-);
+) STRICT;
 
 CREATE TABLE IF NOT EXISTS files (
     volume_id TEXT NOT NULL,
@@ -61,13 +63,26 @@ CREATE TABLE IF NOT EXISTS files (
     last_event_timestamp TEXT,
     last_event_type TEXT,
     is_deleted INTEGER NOT NULL DEFAULT 0,
+    basename TEXT GENERATED ALWAYS AS (
+        substr(path, length(rtrim(path, replace(path, '/', ''))) + 1)
+    ) VIRTUAL,
     PRIMARY KEY (volume_id, path)
-);
+) WITHOUT ROWID, STRICT;
+
+-- Covers the search --dirs GROUP BY (directory, volume_id) rollup.
+CREATE INDEX IF NOT EXISTS idx_files_directory_rollup
+    ON files (directory, volume_id, is_deleted, last_event_timestamp);
+CREATE INDEX IF NOT EXISTS idx_files_recent ON files (last_event_timestamp DESC, volume_id, path);
 
-CREATE INDEX IF NOT EXISTS idx_files_directory ON files (directory);
-CREATE INDEX IF NOT EXISTS idx_files_last_event_timestamp ON files (last_event_timestamp);
+CREATE INDEX IF NOT EXISTS idx_volumes_recent ON volumes (last_event_timestamp DESC, volume_id);
 
-CREATE INDEX IF NOT EXISTS idx_volumes_last_event_timestamp ON volumes (last_event_timestamp);
+-- Short-lived copies of get_mount_info() payloads keyed by directory.
+CREATE TABLE IF NOT EXISTS mount_cache (
+    directory TEXT PRIMARY KEY,
+    payload_json TEXT NOT NULL,
+    refreshed_at REAL NOT NULL,
+    device_id INTEGER
+) STRICT;
 
 CREATE TABLE IF NOT EXISTS jobs (
     job_id TEXT PRIMARY KEY,
@@ -81,8 +96,23 @@ CREATE TABLE IF NOT EXISTS jobs (
     error_message TEXT,
     started_at TEXT NOT NULL,
     updated_at TEXT NOT NULL,
-    completed_at TEXT
-);
+    completed_at TEXT,
+    is_final INTEGER GENERATED ALWAYS AS (
+        status IN ('complete', 'failed', 'interrupted', 'cancelled', 'removed', 'stopped', 'stale')
+    ) VIRTUAL
+) STRICT;
 
-CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs (status);
+-- Finished jobs accumulate forever; only rows without completed_at are probed.
+CREATE INDEX IF NOT EXISTS idx_jobs_active ON jobs (job_type, started_at) WHERE completed_at IS NULL;
 CREATE INDEX IF NOT EXISTS idx_jobs_volume ON jobs (volume_id);
+-- Serves the progress monitor's per-batch polls without touching the table.
+CREATE INDEX IF NOT EXISTS idx_jobs_initial_scan_progress
+    ON jobs (job_type, started_at, owner_pid, completed_at, status)
+    WHERE job_type = 'initial_scan';
+
+CREATE TABLE IF NOT EXISTS deferred_indexes (
+    name TEXT PRIMARY KEY,
+    tbl_name TEXT NOT NULL,
+    sql TEXT NOT NULL,
+    deferred_at TEXT NOT NULL
+);
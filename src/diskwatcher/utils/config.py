@@ -5,8 +5,10 @@ from __future__ import annotations
 import json
 import os
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Callable, Dict, Iterable, Optional
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, Mapping, Optional
 
 
 CONFIG_ENV_VAR = "DISKWATCHER_CONFIG_DIR"
@@ -40,8 +42,8 @@ def config_path() -> Path:
     return config_dir() / CONFIG_FILENAME
 
 
-def _load_user_config() -> Dict[str, Any]:
-    path = config_path()
+def _load_user_config(path: Optional[Path] = None) -> Dict[str, Any]:
+    path = path or config_path()
     if not path.exists():
         return {}
 
@@ -60,6 +62,7 @@ def _write_user_config(data: Dict[str, Any]) -> None:
     path = config_path()
     path.parent.mkdir(parents=True, exist_ok=True)
     path.write_text(json.dumps(data, indent=2, sort_keys=True))
+    _cached_user_values.cache_clear()
 
 
 def _parse_bool(value: str) -> bool:
@@ -212,6 +215,9 @@ OPTIONS: Dict[str, Option] = {
 }
 
 
+_NO_USER_VALUES: Mapping[str, Any] = MappingProxyType({})
+
+
 def _get_option(key: str) -> Option:
     try:
         return OPTIONS[key]
@@ -219,8 +225,20 @@ def _get_option(key: str) -> Option:
         raise ConfigError(f"Unknown config key '{key}'") from exc
 
 
-def _validated_user_values() -> Dict[str, Any]:
-    raw = _load_user_config()
+def _validated_user_values() -> Mapping[str, Any]:
+    path = config_path()
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return _NO_USER_VALUES
+    # Keyed on mtime/size so edits made outside this process are still seen.
+    # The cached dict is shared, so callers get a read-only view, not a copy.
+    return MappingProxyType(_cached_user_values(path, stat.st_mtime_ns, stat.st_size))
+
+
+@lru_cache(maxsize=8)
+def _cached_user_values(path: Path, mtime_ns: int, size: int) -> Dict[str, Any]:
+    raw = _load_user_config(path)
     validated: Dict[str, Any] = {}
     for key, value in raw.items():
         if key not in OPTIONS:
@@ -245,8 +263,8 @@ def list_config() -> Dict[str, Dict[str, Any]]:
             source = "default"
 
         result[key] = {
-            "value": value,
-            "default": option.default,
+            "value": _copy_value(value),
+            "default": _copy_value(option.default),
             "description": option.description,
             "type": option.value_type,
             "choices": tuple(option.choices) if option.choices else None,
@@ -259,7 +277,13 @@ def list_config() -> Dict[str, Dict[str, Any]]:
 def get_value(key: str) -> Any:
     option = _get_option(key)
     user_values = _validated_user_values()
-    return user_values.get(key, option.default)
+    return _copy_value(user_values.get(key, option.default))
+
+
+def _copy_value(value: Any) -> Any:
+    # Cached user values and option defaults are shared between calls; hand
+    # out copies of lists so callers cannot mutate them.
+    return list(value) if isinstance(value, list) else value
 
 
 def set_value(key: str, raw_value: str) -> Any:
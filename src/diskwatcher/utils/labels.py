@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import re
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
 
 LABEL_EXPORT_COLUMNS: List[str] = [
@@ -79,10 +79,9 @@ def derive_human_id(record: Dict[str, Any]) -> str:
     return token
 
 
-def build_label_rows(records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    """Return label-friendly rows for each volume record."""
+def iter_label_rows(records: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    """Yield a label-friendly row for each volume record."""
 
-    rows: List[Dict[str, Any]] = []
     for idx, record in enumerate(records, start=1):
         stable_index = record.get("label_index") or idx
         row: Dict[str, Any] = {
@@ -91,8 +90,13 @@ def build_label_rows(records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         }
         for column in LABEL_EXPORT_COLUMNS:
             row[column] = record.get(column)
-        rows.append(row)
-    return rows
+        yield row
+
+
+def build_label_rows(records: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Return label-friendly rows for each volume record."""
+
+    return list(iter_label_rows(records))
 
 
-__all__ = ["LABEL_EXPORT_COLUMNS", "derive_human_id", "build_label_rows"]
+__all__ = ["LABEL_EXPORT_COLUMNS", "derive_human_id", "build_label_rows", "iter_label_rows"]
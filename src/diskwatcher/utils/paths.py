@@ -0,0 +1,46 @@
+"""Path normalisation helpers shared by the CLI and the watcher manager."""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from pathlib import Path
+from typing import Union
+
+
+def resolve_path(path: Union[str, Path]) -> Path:
+    """Return ``path`` expanded and resolved, memoising absolute inputs.
+
+    ``Path.resolve`` issues an ``lstat`` per path component; start-up hands the
+    same roots through the CLI, the manager and each watcher thread, so the
+    lookups are cached rather than repeated at every layer. Relative inputs
+    depend on the working directory and are resolved afresh every time. A
+    cached symlink keeps its old target if it is retargeted later, so callers
+    that re-read their roots call ``clear_resolve_cache()`` first. Paths that
+    vanish mid-resolution are returned unresolved.
+    """
+
+    candidate = Path(path).expanduser()
+    if not candidate.is_absolute():
+        return _resolve_uncached(candidate)
+    return _resolve(str(candidate))
+
+
+def clear_resolve_cache() -> None:
+    """Forget memoised resolutions so retargeted symlinks are followed anew."""
+
+    _resolve.cache_clear()
+
+
+@lru_cache(maxsize=256)
+def _resolve(raw: str) -> Path:
+    return _resolve_uncached(Path(raw))
+
+
+def _resolve_uncached(candidate: Path) -> Path:
+    try:
+        return candidate.resolve()
+    except FileNotFoundError:
+        return candidate
+
+
+__all__ = ["clear_resolve_cache", "resolve_path"]
@@ -13,37 +13,14 @@ from flask import Flask, jsonify, render_template, request
 from diskwatcher.db import (
     fetch_jobs,
     fetch_volume_metadata,
+    fetch_volume_overview,
     init_db,
     init_db_readonly,
     query_events,
-    summarize_by_volume,
 )
 from diskwatcher.utils.labels import build_label_rows
 
 
-def _combine_volume_data(
-    aggregates: list[dict[str, Any]],
-    metadata: list[dict[str, Any]],
-) -> list[dict[str, Any]]:
-    meta_by_id = {row["volume_id"]: row for row in metadata}
-    combined: list[dict[str, Any]] = []
-    seen: set[str] = set()
-
-    for agg in aggregates:
-        volume_id = agg["volume_id"]
-        meta = meta_by_id.get(volume_id, {})
-        combined.append({**meta, **agg})
-        seen.add(volume_id)
-
-    for meta in metadata:
-        volume_id = meta["volume_id"]
-        if volume_id in seen:
-            continue
-        combined.append(meta)
-
-    return combined
-
-
 def _normalize_jobs(jobs: list[dict[str, Any]]) -> list[dict[str, Any]]:
     normalized: list[dict[str, Any]] = []
     for job in jobs:
@@ -81,13 +58,11 @@ def _snapshot(limit: int = 25) -> Tuple[list[dict[str, Any]], list[dict[str, Any
     try:
         with _open_catalog() as conn:
             events = query_events(conn, limit=limit)
-            aggregates = summarize_by_volume(conn)
-            volume_meta = fetch_volume_metadata(conn)
+            combined = fetch_volume_overview(conn)
             jobs = fetch_jobs(conn)
     except sqlite3.OperationalError:
         return [], [], []
 
-    combined = _combine_volume_data(aggregates, volume_meta)
     normalized_jobs = _normalize_jobs(jobs)
     return events, combined, normalized_jobs
 
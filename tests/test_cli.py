@@ -2,6 +2,8 @@ import json
 import os
 import subprocess
 import sys
+import threading
+import time
 from pathlib import Path
 from typing import Optional
 
@@ -11,7 +13,7 @@ import diskwatcher.db.connection as db_connection
 import diskwatcher.core.cli as cli_module
 from diskwatcher.core.cli import app
 from diskwatcher.db import init_db, log_event
-from diskwatcher.db.jobs import create_job
+from diskwatcher.db.jobs import create_job, update_job
 from diskwatcher.utils import config as config_utils
 import alembic.command
 import sqlite3
@@ -154,6 +156,39 @@ def test_config_set_and_show(tmp_path):
     assert Path(paths["config_dir"]).resolve() == config_dir.resolve()
 
 
+def test_config_reads_are_cached_until_the_file_changes(monkeypatch, tmp_path):
+    monkeypatch.setenv(config_utils.CONFIG_ENV_VAR, str(tmp_path / "config"))
+    config_utils.set_value("run.max_scan_workers", "3")
+
+    loads = []
+    original_load = config_utils._load_user_config
+
+    def counting_load(path=None):
+        loads.append(path)
+        return original_load(path)
+
+    monkeypatch.setattr(config_utils, "_load_user_config", counting_load)
+
+    assert config_utils.get_value("run.max_scan_workers") == 3
+    assert config_utils.get_value("log.level") == "info"
+    assert len(loads) == 1
+
+    config_utils.set_value("run.max_scan_workers", "5")
+    assert config_utils.get_value("run.max_scan_workers") == 5
+
+
+def test_list_config_hands_out_copies_of_cached_lists(monkeypatch, tmp_path):
+    monkeypatch.setenv(config_utils.CONFIG_ENV_VAR, str(tmp_path / "config"))
+    config_utils.set_value("run.exclude_patterns", '["*.tmp"]')
+
+    options = config_utils.list_config()
+    options["run.exclude_patterns"]["value"].append("*.bak")
+    options["run.auto_discover_roots"]["default"].append("/mnt")
+
+    assert config_utils.get_value("run.exclude_patterns") == ["*.tmp"]
+    assert config_utils.list_config()["run.auto_discover_roots"]["default"] == []
+
+
 def test_config_set_rejects_unknown_keys(tmp_path):
     result = _run_cli(["config", "set", "unknown.key", "value"], home=tmp_path)
     assert result.returncode != 0
@@ -167,6 +202,30 @@ def test_config_show_text_includes_paths(tmp_path):
     assert "database file" in result.stdout
 
 
+def test_run_scan_only_skips_monitor_without_tty(monkeypatch, tmp_path):
+    _patch_db(monkeypatch, tmp_path)
+    monkeypatch.setattr(
+        "diskwatcher.core.manager.get_mount_info",
+        _mock_mount_info("vol-scan"),
+        raising=False,
+    )
+    monitors = []
+    monkeypatch.setattr(
+        cli_module,
+        "_monitor_initial_scan_batches",
+        lambda *args, **kwargs: monitors.append(args),
+    )
+    watched = tmp_path / "watched"
+    watched.mkdir()
+    (watched / "file.txt").write_text("data")
+
+    result = CliRunner().invoke(app, ["run", "--scan-only", str(watched)])
+
+    assert result.exit_code == 0, result.output
+    assert "Initial scan results:" in result.output
+    assert monitors == []
+
+
 def test_status_shows_recent_events(monkeypatch, tmp_path):
     _patch_db(monkeypatch, tmp_path)
     mount_factory = _mock_mount_info("vol-1")
@@ -214,6 +273,197 @@ def test_status_shows_recent_events(monkeypatch, tmp_path):
     assert "source=stored" in result.output
 
 
+def test_status_reuses_cached_mount_lookups(monkeypatch, tmp_path):
+    _patch_db(monkeypatch, tmp_path)
+    mount_factory = _mock_mount_info("vol-cache")
+    lookups = []
+
+    def counting_mount_info(directory):
+        lookups.append(directory)
+        return mount_factory(directory)
+
+    monkeypatch.setattr(cli_module, "get_mount_info", counting_mount_info)
+
+    with init_db() as conn:
+        log_event(
+            conn,
+            event_type="created",
+            path=str(tmp_path / "file.txt"),
+            directory=str(tmp_path),
+            volume_id="vol-cache",
+        )
+
+    runner = CliRunner()
+    assert runner.invoke(app, ["status"]).exit_code == 0
+    assert runner.invoke(app, ["status"]).exit_code == 0
+    assert lookups == [str(tmp_path)]
+
+    monkeypatch.setattr(cli_module, "_MOUNT_CACHE_TTL_SECONDS", 0.0)
+    assert runner.invoke(app, ["status"]).exit_code == 0
+    assert lookups == [str(tmp_path), str(tmp_path)]
+
+
+def test_status_ignores_cached_mount_from_another_device(monkeypatch, tmp_path):
+    _patch_db(monkeypatch, tmp_path)
+    mount_factory = _mock_mount_info("vol-swap")
+    lookups = []
+
+    def counting_mount_info(directory):
+        lookups.append(directory)
+        return mount_factory(directory)
+
+    monkeypatch.setattr(cli_module, "get_mount_info", counting_mount_info)
+
+    with init_db() as conn:
+        log_event(
+            conn,
+            event_type="created",
+            path=str(tmp_path / "file.txt"),
+            directory=str(tmp_path),
+            volume_id="vol-swap",
+        )
+
+    runner = CliRunner()
+    assert runner.invoke(app, ["status"]).exit_code == 0
+    # Different media now mounted at the same path.
+    monkeypatch.setattr(cli_module, "_device_id", lambda directory: -1)
+    assert runner.invoke(app, ["status"]).exit_code == 0
+    assert runner.invoke(app, ["status"]).exit_code == 0
+    assert lookups == [str(tmp_path), str(tmp_path)]
+
+
+def test_attach_mount_details_looks_up_directories_concurrently(monkeypatch):
+    barrier = threading.Barrier(2, timeout=5)
+    mount_factory = _mock_mount_info("vol-pool")
+
+    def blocking_mount_info(directory):
+        barrier.wait()
+        return mount_factory(directory)
+
+    monkeypatch.setattr(cli_module, "get_mount_info", blocking_mount_info)
+    volumes = [
+        {"volume_id": "a", "directory": "/mnt/a"},
+        {"volume_id": "b", "directory": "/mnt/b"},
+        {"volume_id": "a2", "directory": "/mnt/a"},
+    ]
+
+    enriched = cli_module._attach_mount_details(volumes)
+
+    assert [row["mount_metadata"]["directory"] for row in enriched] == [
+        "/mnt/a",
+        "/mnt/b",
+        "/mnt/a",
+    ]
+
+
+def test_json_bytes_prefers_orjson_and_falls_back(monkeypatch):
+    payload = {"volumes": [{"volume_id": "vol-1", "count": 3}]}
+    calls = []
+
+    class FakeOrjson:
+        OPT_NON_STR_KEYS = 1
+        OPT_INDENT_2 = 2
+
+        @staticmethod
+        def dumps(value, option=0):
+            calls.append(option)
+            if value.get("huge"):
+                raise TypeError("Integer exceeds 64-bit range")
+            return json.dumps(value, indent=2 if option & 2 else None).encode()
+
+    monkeypatch.setitem(sys.modules, "orjson", FakeOrjson)
+    cli_module._get_orjson.cache_clear()
+    try:
+        assert cli_module._json_bytes(payload) == json.dumps(payload, indent=2).encode()
+        assert cli_module._json_bytes(payload, indent=False) == json.dumps(payload).encode()
+        assert calls == [3, 1]
+        assert cli_module._json_bytes({"huge": 2**70}) == json.dumps(
+            {"huge": 2**70}, indent=2
+        ).encode()
+    finally:
+        cli_module._get_orjson.cache_clear()
+
+
+def test_json_bytes_fallback_writes_raw_utf8(monkeypatch):
+    monkeypatch.setattr(cli_module, "_get_orjson", lambda: None)
+    payload = {"path": "/media/Über.txt"}
+
+    assert cli_module._json_bytes(payload, indent=False) == (
+        '{"path":"/media/Über.txt"}'.encode()
+    )
+    assert "Über".encode() in cli_module._json_bytes(payload)
+
+
+def test_emit_json_is_compact_unless_stdout_is_a_terminal(monkeypatch):
+    payload = {"volumes": [{"volume_id": "vol-1", "count": 3}]}
+    writes = []
+    monkeypatch.setattr(cli_module, "_get_orjson", lambda: None)
+    monkeypatch.setattr(
+        cli_module, "_write_stdout_bytes", lambda data: writes.append(bytes(data))
+    )
+
+    monkeypatch.setattr(cli_module, "_stdout_is_tty", lambda: False)
+    cli_module._emit_json(payload)
+    monkeypatch.setattr(cli_module, "_stdout_is_tty", lambda: True)
+    cli_module._emit_json(payload)
+    cli_module._emit_json(payload, indent=False)
+
+    assert writes == [
+        b'{"volumes":[{"volume_id":"vol-1","count":3}]}\n',
+        json.dumps(payload, indent=2).encode() + b"\n",
+        b'{"volumes":[{"volume_id":"vol-1","count":3}]}\n',
+    ]
+
+
+def test_attach_mount_details_skips_rows_with_stored_identity(monkeypatch):
+    lookups = []
+    mount_factory = _mock_mount_info("vol-live")
+
+    def counting_mount_info(directory):
+        lookups.append(directory)
+        return mount_factory(directory)
+
+    monkeypatch.setattr(cli_module, "get_mount_info", counting_mount_info)
+    stored = {"device": "/dev/stored", "source": "stored"}
+    volumes = [
+        {"volume_id": "a", "directory": "/mnt/a", "mount_metadata": stored},
+        {"volume_id": "b", "directory": "/mnt/b", "mount_metadata": None},
+    ]
+
+    enriched = cli_module._attach_mount_details(volumes)
+
+    assert lookups == ["/mnt/b"]
+    assert enriched[0]["mount_metadata"] is stored
+    assert enriched[1]["mount_metadata"]["device"] == "/dev/mock"
+
+
+def test_status_text_is_written_once(monkeypatch, tmp_path):
+    _patch_db(monkeypatch, tmp_path)
+    mount_factory = _mock_mount_info("vol-once")
+    monkeypatch.setattr(cli_module, "get_mount_info", mount_factory)
+
+    with init_db() as conn:
+        for name in ("a.txt", "b.txt"):
+            log_event(
+                conn,
+                event_type="created",
+                path=str(tmp_path / name),
+                directory=str(tmp_path),
+                volume_id="vol-once",
+                mount_metadata=mount_factory(str(tmp_path)),
+            )
+
+    echoed = []
+    monkeypatch.setattr(cli_module.typer, "echo", lambda message="", **_: echoed.append(message))
+
+    result = CliRunner().invoke(app, ["status"])
+
+    assert result.exit_code == 0
+    assert len(echoed) == 1
+    assert "Recent events:" in echoed[0]
+    assert "model=MockDrive" in echoed[0]
+
+
 def test_status_handles_empty_catalog(monkeypatch, tmp_path):
     _patch_db(monkeypatch, tmp_path)
 
@@ -541,6 +791,195 @@ def test_collect_initial_scan_progress(monkeypatch, tmp_path):
     assert progress["files_scanned"] == 1540
 
 
+def test_collect_initial_scan_progress_ignores_bad_payloads(monkeypatch, tmp_path):
+    _patch_db(monkeypatch, tmp_path)
+
+    with init_db() as conn:
+        for volume_id, progress in (("vol-a", {"files_scanned": 25.9}), ("vol-b", None)):
+            create_job(
+                conn,
+                job_type="initial_scan",
+                path=str(tmp_path / volume_id),
+                volume_id=volume_id,
+                status="running",
+                progress=progress,
+            )
+        conn.execute("UPDATE jobs SET progress_json = '{not json' WHERE volume_id = 'vol-b'")
+
+        progress = cli_module._collect_initial_scan_progress(
+            conn,
+            started_at="1970-01-01T00:00:00+00:00",
+        )
+
+    assert progress["total"] == 2
+    assert progress["completed"] == 0
+    assert progress["files_scanned"] == 25
+
+
+def test_jobs_is_final_matches_final_statuses(monkeypatch, tmp_path):
+    _patch_db(monkeypatch, tmp_path)
+    statuses = sorted(cli_module._INITIAL_SCAN_FINAL_STATUSES) + ["queued", "running"]
+
+    with init_db() as conn:
+        for status in statuses:
+            create_job(conn, job_type="initial_scan", volume_id=status, status=status)
+        flags = dict(conn.execute("SELECT volume_id, is_final FROM jobs").fetchall())
+
+    assert {status for status, final in flags.items() if final} == set(
+        cli_module._INITIAL_SCAN_FINAL_STATUSES
+    )
+
+
+def test_initial_scan_fingerprint_tracks_job_writes(monkeypatch, tmp_path):
+    _patch_db(monkeypatch, tmp_path)
+    started_at = "1970-01-01T00:00:00+00:00"
+
+    with init_db() as conn:
+        empty = cli_module._initial_scan_fingerprint(conn, started_at)
+        job_id = create_job(conn, job_type="initial_scan", volume_id="vol-a", status="running")
+        created = cli_module._initial_scan_fingerprint(conn, started_at)
+        assert cli_module._initial_scan_fingerprint(conn, started_at) == created
+        time.sleep(0.001)
+        update_job(conn, job_id, progress={"files_scanned": 5})
+        updated = cli_module._initial_scan_fingerprint(conn, started_at)
+
+    assert empty[2] == 0
+    assert created[2] == 1
+    assert updated != created
+
+
+def test_monitor_initial_scan_batches_reads_own_connection(monkeypatch, tmp_path, capsys):
+    db_root = _patch_db(monkeypatch, tmp_path)
+    db_path = db_root / "diskwatcher.db"
+
+    with init_db(db_path) as conn:
+        create_job(
+            conn,
+            job_type="initial_scan",
+            path=str(tmp_path / "disk-a"),
+            volume_id="vol-a",
+            status="running",
+            progress={"files_scanned": 7},
+        )
+
+    stop = threading.Event()
+    monitor = threading.Thread(
+        target=cli_module._monitor_initial_scan_batches,
+        args=(db_path, stop),
+        kwargs={"interval": 0.01},
+    )
+    monitor.start()
+    time.sleep(0.1)
+    stop.set()
+    monitor.join(timeout=5)
+
+    assert not monitor.is_alive()
+    assert "0/1 drives | files=7" in capsys.readouterr().err
+
+
+def test_monitor_initial_scan_batches_never_opens_transactions(monkeypatch, tmp_path):
+    db_root = _patch_db(monkeypatch, tmp_path)
+    db_path = db_root / "diskwatcher.db"
+    with init_db(db_path) as conn:
+        create_job(conn, job_type="initial_scan", volume_id="vol-a", status="running")
+
+    statements = []
+    opened = []
+    original_readonly = cli_module.init_db_readonly
+
+    def traced_readonly(*args, **kwargs):
+        conn = original_readonly(*args, **kwargs)
+        conn.set_trace_callback(statements.append)
+        opened.append(conn.isolation_level)
+        return conn
+
+    monkeypatch.setattr(cli_module, "init_db_readonly", traced_readonly)
+
+    stop = threading.Event()
+    monitor = threading.Thread(
+        target=cli_module._monitor_initial_scan_batches,
+        args=(db_path, stop),
+        kwargs={"interval": 0.01},
+    )
+    monitor.start()
+    time.sleep(0.1)
+    stop.set()
+    monitor.join(timeout=5)
+
+    assert opened == [None]
+    assert any(sql.lstrip().upper().startswith("SELECT") for sql in statements)
+    assert not any(
+        sql.lstrip().upper().startswith(("BEGIN", "COMMIT")) for sql in statements
+    )
+
+
+def test_monitor_initial_scan_batches_abort_skips_final_snapshot(monkeypatch, tmp_path):
+    db_root = _patch_db(monkeypatch, tmp_path)
+    db_path = db_root / "diskwatcher.db"
+    with init_db(db_path) as conn:
+        create_job(conn, job_type="initial_scan", volume_id="vol-a", status="running")
+
+    emits = []
+    original_emit = cli_module._InitialScanProgressRenderer.emit
+
+    def recording_emit(self, progress, *, final=False):
+        emits.append(final)
+        return original_emit(self, progress, final=final)
+
+    monkeypatch.setattr(cli_module._InitialScanProgressRenderer, "emit", recording_emit)
+
+    def run_monitor(abort):
+        emits.clear()
+        stop = threading.Event()
+        monitor = threading.Thread(
+            target=cli_module._monitor_initial_scan_batches,
+            args=(db_path, stop),
+            kwargs={"interval": 0.01, "abort_event": abort},
+        )
+        monitor.start()
+        deadline = time.monotonic() + 5
+        while not emits and time.monotonic() < deadline:
+            time.sleep(0.01)
+        abort.set()
+        stop.set()
+        monitor.join(timeout=5)
+        assert not monitor.is_alive()
+        return list(emits)
+
+    class _NeverSet:
+        def set(self):
+            pass
+
+        def is_set(self):
+            return False
+
+    assert run_monitor(_NeverSet())[-1] is True
+    assert True not in run_monitor(threading.Event())
+
+
+def test_render_initial_scan_line():
+    progress = {"total": 4, "completed": 2, "running": 2, "failed": 0, "files_scanned": 1500}
+
+    assert cli_module._render_initial_scan_line(progress, 5) == (
+        "initial scan / [############------------] 2/4 drives"
+        " | files=1,500 | active=2 | failed=0"
+    )
+    assert cli_module._render_initial_scan_line({**progress, "total": 0}, 3) == (
+        "initial scan \\ preparing jobs..."
+    )
+
+
+def test_line_buffered_stream_writes_through_per_line(tmp_path):
+    target = tmp_path / "progress.log"
+    with target.open("w") as handle:
+        assert not handle.line_buffering
+        stream = cli_module._line_buffered(handle)
+        stream.write("initial scan 1/2\n")
+        assert target.read_text() == "initial scan 1/2\n"
+        stream.close()
+        assert not handle.closed
+
+
 def test_render_initial_scan_target_line():
     line = cli_module._render_initial_scan_target_line(
         {"path": "/media/alex/DriveA", "uuid": "vol-drive-a"}
@@ -567,6 +1006,87 @@ def test_render_initial_scan_result_line():
     assert "elapsed=12.3s" in line
 
 
+def test_extract_mount_metadata_from_stored_columns():
+    assert cli_module._extract_mount_metadata({"volume_id": "vol-1"}) is None
+
+    stored = cli_module._extract_mount_metadata(
+        {"mount_device": "/dev/sdb1", "lsblk_model": "MockDrive", "lsblk_serial": None}
+    )
+    assert stored == {
+        "device": "/dev/sdb1",
+        "mount_point": None,
+        "uuid": None,
+        "label": None,
+        "volume_id": None,
+        "lsblk": {"MODEL": "MockDrive"},
+        "identity_refreshed_at": None,
+        "source": "stored",
+    }
+
+    parsed = cli_module._extract_mount_metadata(
+        {"lsblk_json": json.dumps({"SERIAL": "S1"}), "lsblk_model": "ignored"}
+    )
+    assert parsed["lsblk"] == {"SERIAL": "S1"}
+
+
+def test_merge_volume_row_fills_defaults_and_aliases():
+    legacy = cli_module._merge_volume_row(
+        {"volume_id": "vol-1", "directory": "/mnt", "total_events": 3, "created": 2},
+        None,
+    )
+    assert legacy["event_count"] == 3
+    assert legacy["created_count"] == 2
+    assert legacy["deleted_count"] == 0 and legacy["deleted"] == 0
+    assert legacy["usage_total_bytes"] is None
+    assert all(legacy[column] is None for column in cli_module._VOLUME_IDENTITY_COLUMNS)
+    assert legacy["mount_metadata"] is None
+
+    stored = {
+        "volume_id": "vol-2",
+        "directory": "/mnt/b",
+        "event_count": 5,
+        "created_count": 5,
+        "modified_count": 0,
+        "deleted_count": 0,
+        "usage_total_bytes": 1024,
+        "mount_device": "/dev/sdb1",
+    }
+    merged = cli_module._merge_volume_row(stored, stored)
+    assert merged["total_events"] == 5
+    assert merged["usage_total_bytes"] == 1024
+    assert merged["mount_metadata"]["device"] == "/dev/sdb1"
+
+
+def test_format_bytes_picks_binary_units():
+    assert cli_module._format_bytes(None) == "-"
+    assert cli_module._format_bytes(0) == "0 B"
+    assert cli_module._format_bytes(1023) == "1023 B"
+    assert cli_module._format_bytes(1024) == "1.0 KB"
+    assert cli_module._format_bytes(1536 * 1024) == "1.5 MB"
+    assert cli_module._format_bytes(2**40) == "1.0 TB"
+    assert cli_module._format_bytes(2**60) == "1024.0 PB"
+
+
+def test_mount_detail_lines_skip_empty_fields():
+    mount = {
+        "device": "/dev/sdb1",
+        "volume_id": "vol-a",
+        "uuid": "1234",
+        "lsblk": {"MODEL": "Disk", "SIZE": "1T", "PARTTYPENAME": "Linux"},
+        "source": "lsblk",
+    }
+
+    assert cli_module._mount_detail_lines(mount, volume_id="vol-a") == [
+        "  mount  : device=/dev/sdb1",
+        "  ids    : uuid=1234",
+        "  block  : model=Disk size=1T",
+        "  part   : name=Linux",
+        "  identity: source=lsblk",
+    ]
+    assert cli_module._mount_detail_lines(mount)[1] == "  ids    : volume=vol-a uuid=1234"
+    assert cli_module._mount_detail_lines({}) == []
+
+
 def test_search_files_default(monkeypatch, tmp_path):
     _patch_db(monkeypatch, tmp_path)
 
@@ -623,6 +1143,29 @@ def test_search_directories_json(monkeypatch, tmp_path):
     assert payload["directories"][0]["directory"].endswith("nested")
 
 
+def test_search_directories_uses_covering_index(monkeypatch, tmp_path):
+    _patch_db(monkeypatch, tmp_path)
+
+    with init_db() as conn:
+        conn.row_factory = sqlite3.Row
+        statements = []
+        conn.set_trace_callback(statements.append)
+        cli_module._search_directories(
+            conn,
+            "nested",
+            regex=False,
+            case_sensitive=True,
+            include_deleted=False,
+            limit=10,
+        )
+        conn.set_trace_callback(None)
+        plan = conn.execute(f"EXPLAIN QUERY PLAN {statements[-1]}").fetchall()
+
+    details = " | ".join(row["detail"] for row in plan)
+    assert "COVERING INDEX idx_files_directory_rollup" in details
+    assert "GROUP BY" not in details
+
+
 def test_search_regex(monkeypatch, tmp_path):
     _patch_db(monkeypatch, tmp_path)
 
@@ -739,6 +1282,107 @@ def test_search_ignore_case_short(monkeypatch, tmp_path):
     assert str(file_path) in ignore_case_result.output
 
 
+def test_search_ignore_case_treats_wildcards_literally(monkeypatch, tmp_path):
+    _patch_db(monkeypatch, tmp_path)
+
+    literal = tmp_path / "Run_50%.csv"
+    lookalike = tmp_path / "runx50abc.csv"
+
+    with init_db() as conn:
+        for path in (literal, lookalike):
+            path.write_text("data")
+            log_event(
+                conn,
+                event_type="created",
+                path=str(path),
+                directory=str(tmp_path),
+                volume_id="vol-search",
+            )
+
+    runner = CliRunner()
+    result = runner.invoke(app, ["search", "run_50%", "-i", "--json"])
+
+    assert result.exit_code == 0
+    paths = [row["path"] for row in _stdout_json(result.output)["files"]]
+    assert paths == [str(literal)]
+
+
+def test_search_ignore_case_folds_non_ascii_names(monkeypatch, tmp_path):
+    _patch_db(monkeypatch, tmp_path)
+
+    umlaut = tmp_path / "Über.txt"
+    other = tmp_path / "uber.txt"
+
+    with init_db() as conn:
+        for path in (umlaut, other):
+            path.write_text("data")
+            log_event(
+                conn,
+                event_type="created",
+                path=str(path),
+                directory=str(tmp_path),
+                volume_id="vol-search",
+            )
+
+    runner = CliRunner()
+    result = runner.invoke(app, ["search", "über", "-i", "--json"])
+
+    assert result.exit_code == 0
+    paths = [row["path"] for row in _stdout_json(result.output)["files"]]
+    assert paths == [str(umlaut)]
+
+
+def test_files_basename_column_matches_path_name(monkeypatch, tmp_path):
+    _patch_db(monkeypatch, tmp_path)
+
+    nested = tmp_path / "a b" / "c"
+    nested.mkdir(parents=True)
+    paths = [nested / "report.tar.gz", tmp_path / "ü.txt"]
+
+    with init_db() as conn:
+        for path in paths:
+            path.write_text("data")
+            log_event(
+                conn,
+                event_type="created",
+                path=str(path),
+                directory=str(path.parent),
+                volume_id="vol-search",
+            )
+        stored = dict(conn.execute("SELECT path, basename FROM files").fetchall())
+
+    assert stored == {str(path): path.name for path in paths}
+
+
+def test_search_regex_prefers_re2_and_shortcuts_literals(monkeypatch):
+    assert cli_module._is_literal_pattern("msfragger", case_sensitive=True)
+    assert not cli_module._is_literal_pattern(r"beta\d+", case_sensitive=True)
+    assert not cli_module._is_literal_pattern("ünïcode", case_sensitive=False)
+
+    compiled = []
+
+    class FakeRe2:
+        @staticmethod
+        def compile(pattern):
+            if "(?=" in pattern:
+                raise ValueError("lookarounds are not supported")
+            compiled.append(pattern)
+            return __import__("re").compile(pattern)
+
+    monkeypatch.setitem(sys.modules, "re2", FakeRe2)
+    cli_module._get_re2.cache_clear()
+    try:
+        search = cli_module._compile_search_regex(r"beta\d+", case_sensitive=False)
+        assert search("BETA001.log")
+        assert compiled == [r"(?i)beta\d+"]
+
+        fallback = cli_module._compile_search_regex(r"a(?=b)", case_sensitive=True)
+        assert fallback("ab") and not fallback("ac")
+        assert compiled == [r"(?i)beta\d+"]
+    finally:
+        cli_module._get_re2.cache_clear()
+
+
 def test_search_regex_basename(monkeypatch, tmp_path):
     _patch_db(monkeypatch, tmp_path)
 
@@ -848,6 +1492,79 @@ def test_stream_outputs_new_events(monkeypatch, tmp_path):
     assert payload["event_type"] == "created"
 
 
+def test_stream_writes_each_batch_once(monkeypatch, tmp_path):
+    _patch_db(monkeypatch, tmp_path)
+
+    with init_db() as conn:
+        for index in range(3):
+            log_event(
+                conn,
+                event_type="created",
+                path=str(tmp_path / f"file{index}.txt"),
+                directory=str(tmp_path),
+                volume_id="vol-stream",
+            )
+
+    writes = []
+    # The stream reuses its buffer between batches, so snapshot each write.
+    monkeypatch.setattr(
+        cli_module, "_write_stdout_bytes", lambda data: writes.append(bytes(data))
+    )
+
+    result = CliRunner().invoke(
+        app,
+        ["stream", "--limit", "5", "--interval", "0", "--max-iterations", "2"],
+    )
+
+    assert result.exit_code == 0
+    assert len(writes) == 1
+    lines = writes[0].decode().splitlines()
+    assert [json.loads(line)["path"] for line in lines] == [
+        str(tmp_path / f"file{index}.txt") for index in range(3)
+    ]
+    assert writes[0].endswith(b"\n")
+
+
+def test_stream_skips_events_query_while_catalog_is_idle(monkeypatch, tmp_path):
+    _patch_db(monkeypatch, tmp_path)
+    with init_db():
+        pass
+
+    queries = []
+    real_query = cli_module.query_events_since
+    monkeypatch.setattr(
+        cli_module,
+        "query_events_since",
+        lambda conn, **kwargs: queries.append(kwargs) or real_query(conn, **kwargs),
+    )
+    sleeps = []
+
+    def fake_sleep(seconds):
+        sleeps.append(seconds)
+        if len(sleeps) == 2:
+            with init_db() as writer:
+                log_event(
+                    writer,
+                    event_type="created",
+                    path=str(tmp_path / "late.txt"),
+                    directory=str(tmp_path),
+                    volume_id="vol-stream",
+                )
+
+    monkeypatch.setattr(cli_module.time, "sleep", fake_sleep)
+    result = CliRunner().invoke(
+        app,
+        ["stream", "--interval", "5", "--max-iterations", "4"],
+    )
+
+    assert result.exit_code == 0
+    assert sleeps == [5, 5, 5]
+    # The first poll and the one after the commit query; idle polls do not.
+    assert len(queries) == 2
+    lines = [line for line in result.output.splitlines() if line.strip()]
+    assert [json.loads(line)["path"] for line in lines] == [str(tmp_path / "late.txt")]
+
+
 def test_stream_handles_empty_catalog(monkeypatch, tmp_path):
     _patch_db(monkeypatch, tmp_path)
 
@@ -925,14 +1642,204 @@ def test_dev_vacuum_and_integrity(monkeypatch, tmp_path):
     runner = CliRunner()
     result_vacuum = runner.invoke(
         app,
-        ["dev", "vacuum", "--url", f"sqlite:///{db_path}"],
+        ["dev", "vacuum", "--url", f"sqlite:///{db_path}", "--force"],
     )
     assert result_vacuum.exit_code == 0
     assert "Vacuumed catalog" in result_vacuum.output
 
-    result_integrity = runner.invoke(
+    result_quick = runner.invoke(
         app,
         ["dev", "integrity", "--url", f"sqlite:///{db_path}"],
     )
+    assert result_quick.exit_code == 0
+    assert "Catalog quick_check: ok" in result_quick.output
+
+    result_integrity = runner.invoke(
+        app,
+        ["dev", "integrity", "--url", f"sqlite:///{db_path}", "--full"],
+    )
     assert result_integrity.exit_code == 0
     assert "Catalog integrity_check" in result_integrity.output
+
+    result_optimize = runner.invoke(
+        app,
+        ["dev", "optimize", "--url", f"sqlite:///{db_path}"],
+    )
+    assert result_optimize.exit_code == 0
+    assert "Optimized catalog" in result_optimize.output
+
+
+def test_dev_vacuum_converts_then_trims_incrementally(monkeypatch, tmp_path):
+    _patch_db(monkeypatch, tmp_path)
+    db_path = tmp_path / "cat.db"
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE sample(payload TEXT)")
+    conn.executemany("INSERT INTO sample VALUES (?)", [("x" * 1000,)] * 200)
+    conn.commit()
+    conn.close()
+    url = f"sqlite:///{db_path}"
+    runner = CliRunner()
+
+    result = runner.invoke(app, ["dev", "vacuum", "--url", url])
+    assert result.exit_code == 0
+    assert "Skipping VACUUM: only 0.0% of pages are free" in result.output
+
+    result = runner.invoke(app, ["dev", "vacuum", "--url", url, "--force"])
+    assert result.exit_code == 0
+    assert "converted to auto_vacuum=INCREMENTAL" in result.output
+
+    conn = sqlite3.connect(db_path)
+    assert conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    conn.execute("DELETE FROM sample")
+    conn.commit()
+    free_before = conn.execute("PRAGMA freelist_count").fetchone()[0]
+    conn.close()
+    assert free_before > 10
+
+    result = runner.invoke(app, ["dev", "vacuum", "--url", url, "--pages", "10"])
+    assert result.exit_code == 0
+    assert "(incremental)" in result.output
+    assert "Reclaimed 40.0 KB (10 pages)" in result.output
+
+    conn = sqlite3.connect(db_path)
+    assert conn.execute("PRAGMA freelist_count").fetchone()[0] == free_before - 10
+    conn.close()
+
+    result = runner.invoke(app, ["dev", "vacuum", "--url", url, "--full"])
+    assert result.exit_code == 0
+    assert "(full)" in result.output
+
+
+def test_dev_vacuum_into_leaves_source_untouched(monkeypatch, tmp_path):
+    _patch_db(monkeypatch, tmp_path)
+    db_path = tmp_path / "cat.db"
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE sample(id INTEGER)")
+    conn.execute("INSERT INTO sample VALUES (1)")
+    conn.commit()
+    conn.close()
+    snapshot = tmp_path / "snapshot.db"
+    args = ["dev", "vacuum", "--url", f"sqlite:///{db_path}", "--into", str(snapshot)]
+
+    result = CliRunner().invoke(app, args)
+    assert result.exit_code == 0
+    assert f"{db_path} into {snapshot}" in result.output
+
+    conn = sqlite3.connect(snapshot)
+    assert conn.execute("SELECT id FROM sample").fetchall() == [(1,)]
+    conn.close()
+    conn = sqlite3.connect(db_path)
+    assert conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 0
+    conn.close()
+
+    result = CliRunner().invoke(app, args)
+    assert result.exit_code != 0
+
+
+def test_dev_commands_share_one_connection_per_catalog(monkeypatch, tmp_path):
+    _patch_db(monkeypatch, tmp_path)
+    db_path = tmp_path / "cat.db"
+    sqlite3.connect(db_path).close()
+    monkeypatch.setattr(cli_module, "_MAINTENANCE_CONNECTIONS", {})
+    opened = []
+    real_open = cli_module._open_tuned
+    monkeypatch.setattr(
+        cli_module, "_open_tuned", lambda path: opened.append(path) or real_open(path)
+    )
+    url = f"sqlite:///{db_path}"
+    runner = CliRunner()
+
+    for command in ("integrity", "optimize", "vacuum", "maintenance"):
+        result = runner.invoke(app, ["dev", command, "--url", url])
+        assert result.exit_code == 0
+
+    assert opened == [db_path.resolve()]
+
+
+def test_dev_integrity_skips_optimize_when_check_fails(monkeypatch, tmp_path):
+    _patch_db(monkeypatch, tmp_path)
+    db_path = tmp_path / "cat.db"
+    sqlite3.connect(db_path).close()
+    monkeypatch.setattr(cli_module, "_MAINTENANCE_CONNECTIONS", {})
+    monkeypatch.setattr(cli_module, "_echo_check", lambda conn, check: False)
+    optimized = []
+    monkeypatch.setattr(cli_module, "optimize_connection", optimized.append)
+
+    result = CliRunner().invoke(
+        app, ["dev", "integrity", "--url", f"sqlite:///{db_path}"]
+    )
+
+    assert result.exit_code == 1
+    assert optimized == []
+
+
+def test_dev_integrity_applies_busy_timeout(monkeypatch, tmp_path):
+    _patch_db(monkeypatch, tmp_path)
+    db_path = tmp_path / "cat.db"
+    sqlite3.connect(db_path).close()
+    monkeypatch.setattr(cli_module, "_MAINTENANCE_CONNECTIONS", {})
+
+    result = CliRunner().invoke(
+        app,
+        ["dev", "integrity", "--url", f"sqlite:///{db_path}", "--timeout-ms", "1234"],
+    )
+
+    assert result.exit_code == 0
+    conn = cli_module._MAINTENANCE_CONNECTIONS[db_path.resolve()]
+    assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 1234
+
+
+def test_dev_maintenance_checks_vacuums_and_optimizes(monkeypatch, tmp_path):
+    _patch_db(monkeypatch, tmp_path)
+    db_path = tmp_path / "cat.db"
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE sample(id INTEGER)")
+    conn.commit()
+    conn.close()
+    monkeypatch.setattr(cli_module, "_MAINTENANCE_CONNECTIONS", {})
+
+    result = CliRunner().invoke(
+        app, ["dev", "maintenance", "--url", f"sqlite:///{db_path}", "--force"]
+    )
+
+    assert result.exit_code == 0
+    assert "Catalog quick_check: ok" in result.output
+    assert "converted to auto_vacuum=INCREMENTAL" in result.output
+    conn = sqlite3.connect(db_path)
+    assert conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+    conn.close()
+
+
+def test_echo_check_reports_every_problem(monkeypatch):
+    source = sqlite3.connect(":memory:")
+    problems = [f"page {index} is never used" for index in range(250)]
+
+    class _Conn:
+        def execute(self, sql):
+            assert sql == "PRAGMA integrity_check"
+            payload = json.dumps(problems)
+            return source.execute("SELECT value FROM json_each(?)", (payload,))
+
+    echoed = []
+    monkeypatch.setattr(cli_module.typer, "echo", echoed.append)
+
+    assert cli_module._echo_check(_Conn(), "integrity_check") is False
+    assert echoed[0] == "Catalog integrity_check: problems found"
+    assert "\n".join(echoed[1:]).splitlines() == [f"  {p}" for p in problems]
+
+
+def test_log_tails_recent_lines(monkeypatch, tmp_path):
+    log_path = tmp_path / "diskwatcher.log"
+    log_path.write_text("".join(f"line {idx}\n" for idx in range(500)))
+    monkeypatch.setattr("diskwatcher.core.cli.active_log_file", lambda: log_path)
+    monkeypatch.setattr("diskwatcher.core.cli._LOG_TAIL_BLOCK_SIZE", 16)
+
+    runner = CliRunner()
+    result = runner.invoke(app, ["log", "--tail", "3"])
+    assert result.exit_code == 0, result.stdout
+    assert result.stdout == "line 497\nline 498\nline 499\n"
+
+    result = runner.invoke(app, ["log", "--tail", "0"])
+    assert result.exit_code == 0, result.stdout
+    assert result.stdout == log_path.read_text()
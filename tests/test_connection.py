@@ -2,7 +2,7 @@ import sqlite3
 
 import pytest
 
-from diskwatcher.db import init_db, init_db_readonly
+from diskwatcher.db import init_db, init_db_readonly, read_snapshot
 
 
 def test_init_db_readonly_does_not_create_missing_paths(tmp_path):
@@ -24,3 +24,38 @@ def test_init_db_readonly_disallows_writes(tmp_path):
         conn.execute("SELECT name FROM sqlite_master").fetchall()
         with pytest.raises(sqlite3.OperationalError):
             conn.execute("CREATE TABLE ro_test (id INTEGER)")
+
+
+def test_init_db_applies_performance_pragmas(tmp_path):
+    with init_db(path=tmp_path / "diskwatcher.db") as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+        assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2
+        assert conn.execute("PRAGMA cache_size").fetchone()[0] == -65536
+
+
+def test_init_db_query_only_keeps_schema_but_rejects_writes(tmp_path):
+    with init_db(path=tmp_path / "diskwatcher.db", query_only=True) as conn:
+        assert conn.execute("PRAGMA query_only").fetchone()[0] == 1
+        assert conn.execute("SELECT COUNT(*) FROM volumes").fetchone()[0] == 0
+        with pytest.raises(sqlite3.OperationalError):
+            conn.execute("DELETE FROM volumes")
+
+
+def test_read_snapshot_sees_one_consistent_state(tmp_path):
+    db_path = tmp_path / "diskwatcher.db"
+    reader = init_db(path=db_path)
+    writer = init_db(path=db_path)
+    writer.execute("CREATE TABLE counter (value INTEGER)")
+    writer.execute("INSERT INTO counter VALUES (1)")
+
+    with read_snapshot(reader):
+        assert reader.in_transaction
+        assert reader.execute("SELECT COUNT(*) FROM counter").fetchone()[0] == 1
+        writer.execute("INSERT INTO counter VALUES (2)")
+        assert reader.execute("SELECT COUNT(*) FROM counter").fetchone()[0] == 1
+
+    assert not reader.in_transaction
+    assert reader.execute("SELECT COUNT(*) FROM counter").fetchone()[0] == 2
+    reader.close()
+    writer.close()
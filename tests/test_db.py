@@ -2,8 +2,13 @@ import json
 import pytest
 import sqlite3
 from datetime import datetime
-from diskwatcher.db import create_schema, log_event, query_events
-from diskwatcher.db.events import fetch_volume_metadata, summarize_by_volume
+from diskwatcher.db import create_schema, log_event, log_events, query_events
+from diskwatcher.db.events import (
+    fetch_volume_metadata,
+    fetch_volume_overview,
+    summarize_by_volume,
+)
+from diskwatcher.db.maintenance import drop_hot_indexes, rebuild_hot_indexes
 
 
 @pytest.fixture
@@ -80,6 +85,28 @@ def test_summarize_by_volume(db_conn):
     assert row["deleted"] == 1
 
 
+def test_fetch_volume_overview_merges_metadata_and_aggregates(db_conn):
+    for event_type in ("created", "modified", "deleted"):
+        log_event(
+            db_conn,
+            event_type=event_type,
+            path="/tmp/overview",
+            directory="/tmp",
+            volume_id="vol-overview",
+            process_id="123",
+            timestamp="2025-01-01T00:00:00Z",
+            mount_metadata={"device": "/dev/mock", "label": "Overview"},
+        )
+
+    overview = fetch_volume_overview(db_conn)
+    metadata = fetch_volume_metadata(db_conn)
+    summary = summarize_by_volume(db_conn)
+
+    assert len(overview) == 1
+    assert overview[0] == {**metadata[0], **summary[0]}
+    assert overview[0]["mount_label"] == "Overview"
+
+
 def test_volume_identity_persisted(db_conn):
     mount_metadata = {
         "device": "/dev/mock",
@@ -219,3 +246,138 @@ def test_create_schema_fallback_sets_baseline_revision():
         assert version[0] == "0002_volume_and_file_metadata"
     finally:
         conn.close()
+
+
+def test_hot_indexes_deferred_and_rebuilt(db_conn):
+    for idx in range(3):
+        log_event(
+            db_conn,
+            event_type="created",
+            path=f"/tmp/file{idx}.txt",
+            directory="/tmp",
+            volume_id="vol",
+            timestamp="2025-01-01T12:00:00Z",
+        )
+
+    def _index_names():
+        return {
+            row[0]
+            for row in db_conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index' AND sql IS NOT NULL"
+            )
+        }
+
+    before = _index_names()
+    assert drop_hot_indexes(db_conn, min_rows=10) == []
+
+    dropped = drop_hot_indexes(db_conn, min_rows=3)
+    assert "idx_events_path" in dropped
+    assert "idx_files_directory_rollup" in dropped
+    assert not set(dropped) & _index_names()
+    stored = {row[0] for row in db_conn.execute("SELECT name FROM deferred_indexes")}
+    assert stored == set(dropped)
+
+    rebuilt = rebuild_hot_indexes(db_conn)
+    assert sorted(rebuilt) == sorted(dropped)
+    assert _index_names() == before
+    assert db_conn.execute("SELECT COUNT(*) FROM deferred_indexes").fetchone()[0] == 0
+
+
+def test_hot_indexes_keep_unique_indexes_and_rebuild_idempotently(db_conn):
+    for idx in range(3):
+        log_event(
+            db_conn,
+            event_type="created",
+            path=f"/tmp/file{idx}.txt",
+            directory="/tmp",
+            volume_id="vol",
+            timestamp="2025-01-01T12:00:00Z",
+        )
+    db_conn.execute(
+        "CREATE UNIQUE INDEX idx_files_unique_path ON files (volume_id, path)"
+    )
+
+    dropped = drop_hot_indexes(db_conn, min_rows=3)
+    assert dropped
+    assert "idx_files_unique_path" not in dropped
+
+    # A unique index recorded earlier and still present must not abort the
+    # rebuild part-way through.
+    unique_sql = db_conn.execute(
+        "SELECT sql FROM sqlite_master WHERE name = 'idx_files_unique_path'"
+    ).fetchone()[0]
+    db_conn.execute(
+        "INSERT INTO deferred_indexes (name, tbl_name, sql, deferred_at) "
+        "VALUES ('idx_files_unique_path', 'files', ?, '2025-01-01T00:00:00Z')",
+        (unique_sql,),
+    )
+
+    rebuilt = rebuild_hot_indexes(db_conn)
+    assert sorted(rebuilt) == sorted([*dropped, "idx_files_unique_path"])
+    assert db_conn.execute("SELECT COUNT(*) FROM deferred_indexes").fetchone()[0] == 0
+
+
+def test_query_events_filters_by_volume(db_conn):
+    for idx, volume in enumerate(["vol-a", "vol-b", "vol-a"]):
+        log_event(
+            db_conn,
+            event_type="created",
+            path=f"/tmp/{volume}/file{idx}.txt",
+            directory=f"/tmp/{volume}",
+            volume_id=volume,
+            timestamp=f"2025-01-01T12:00:0{idx}Z",
+        )
+
+    events = query_events(db_conn, volume_id="vol-a")
+    assert [event["path"] for event in events] == [
+        "/tmp/vol-a/file2.txt",
+        "/tmp/vol-a/file0.txt",
+    ]
+
+
+def test_events_store_epoch_microseconds(db_conn):
+    log_event(
+        db_conn,
+        event_type="created",
+        path="/tmp/later.txt",
+        directory="/tmp",
+        volume_id="vol",
+        timestamp="2025-01-01T12:00:00.000001Z",
+    )
+    log_event(
+        db_conn,
+        event_type="created",
+        path="/tmp/earlier.txt",
+        directory="/tmp",
+        volume_id="vol",
+        # Same wall-clock text but an hour earlier once the offset is applied.
+        timestamp="2025-01-01T12:30:00+01:00",
+    )
+
+    events = query_events(db_conn)
+    assert [event["path"] for event in events] == ["/tmp/later.txt", "/tmp/earlier.txt"]
+    assert events[0]["timestamp_us"] == 1735732800000001
+    assert events[1]["timestamp_us"] == 1735731000000000
+
+
+def test_log_events_batches_rows(db_conn, tmp_path):
+    files = []
+    for idx in range(3):
+        target = tmp_path / f"file{idx}.txt"
+        target.write_text("x" * idx)
+        files.append(target)
+
+    written = log_events(
+        db_conn,
+        [("existing", str(path), None) for path in files],
+        directory=str(tmp_path),
+        volume_id="vol",
+        process_id="1",
+    )
+
+    assert written == 3
+    assert {event["path"] for event in query_events(db_conn)} == {str(path) for path in files}
+    volume = fetch_volume_metadata(db_conn)[0]
+    assert volume["event_count"] == 3
+    file_rows = db_conn.execute("SELECT COUNT(*) FROM files").fetchone()[0]
+    assert file_rows == 3
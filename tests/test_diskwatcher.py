@@ -119,6 +119,23 @@ def test_file_create_triggers_event_manualthread(tmp_path, caplog):
     assert "File created" in caplog.text
 
 
+def test_watcher_stops_without_waiting_for_heartbeat(tmp_path):
+    watcher = DiskWatcher(str(tmp_path), log_to_db=False)
+    stop_event = threading.Event()
+    thread = threading.Thread(
+        target=watcher.start, kwargs={"stop_event": stop_event}, daemon=True
+    )
+    thread.start()
+    time.sleep(0.2)
+
+    started = time.monotonic()
+    stop_event.set()
+    thread.join(timeout=5)
+
+    assert not thread.is_alive()
+    assert time.monotonic() - started < 0.9
+
+
 def test_watcher_falls_back_to_polling_on_enospc(monkeypatch, tmp_path, temp_db, caplog):
     calls = {"observer": 0, "polling": 0}
 
@@ -304,7 +321,9 @@ def test_manager_status_reflects_scan_stats(tmp_path, monkeypatch):
     initial_status = manager.status()
     assert initial_status[0]["scan"]["status"] == "pending"
 
+    assert not manager.job_state_changed.is_set()
     manager.run_initial_scans(parallel=False)
+    assert manager.job_state_changed.is_set()
 
     updated_status = manager.status()
     scan_info = updated_status[0]["scan"]
@@ -674,3 +693,23 @@ def test_disk_watcher_backoff_retries_until_complete(monkeypatch, temp_db):
     # Advance time to trigger retry (400.0)
     watcher._refresh_mount_metadata()
     assert call_count == 2
+
+
+def test_manager_add_directories_bulk_deduplicates(tmp_path):
+    conn = sqlite3.connect(":memory:", check_same_thread=False)
+    create_schema(conn)
+    manager = DiskWatcherManager(conn=conn)
+    first = tmp_path / "disk_a"
+    second = tmp_path / "disk_b"
+    first.mkdir()
+    second.mkdir()
+
+    existing = manager.add_directory(first, uuid="vol-a")
+    threads = manager.add_directories_bulk(
+        [(first, "vol-a"), (second, "vol-b"), (second / ".", "vol-b")]
+    )
+
+    assert threads[0] is existing
+    assert threads[1] is threads[2]
+    assert manager.current_paths() == [first.resolve(), second.resolve()]
+    conn.close()
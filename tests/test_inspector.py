@@ -7,6 +7,13 @@ from diskwatcher.core.inspector import get_mount_points, suggest_directories
 logger = logging.getLogger(__name__)
 
 
+@pytest.fixture(autouse=True)
+def clear_suggestion_cache():
+    suggest_directories.cache_clear()
+    yield
+    suggest_directories.cache_clear()
+
+
 @pytest.fixture
 def fake_directories(tmp_path):
     """Create a fake directory structure for testing suggest_directories."""
@@ -52,3 +59,13 @@ def test_suggest_directories(mock_exists, mock_get_mounts, fake_directories):
     assert fake_directories[0] in suggested  # /mnt
     assert fake_directories[1] in suggested  # /media
     assert len(suggested) == 2  # Ensure both directories are found
+
+
+@patch("diskwatcher.core.inspector.get_mount_points")
+def test_suggest_directories_is_cached(mock_get_mounts):
+    mock_get_mounts.return_value = []
+    first = suggest_directories()
+    second = suggest_directories()
+
+    assert first is second
+    assert mock_get_mounts.call_count == 1
@@ -30,3 +30,22 @@ def test_job_lifecycle(tmp_path):
     assert record["completed_at"] is not None
 
     conn.close()
+
+
+def test_start_many_queues_jobs_together(tmp_path):
+    conn = sqlite3.connect(str(tmp_path / "jobs.db"))
+    create_schema(conn)
+
+    handles = JobHandle.start_many(
+        conn,
+        job_type="initial_scan",
+        targets=[("/media/a", "vol-a"), ("/media/b", "vol-b")],
+    )
+
+    assert len({handle.job_id for handle in handles}) == 2
+    jobs = fetch_jobs(conn)
+    assert sorted(job["volume_id"] for job in jobs) == ["vol-a", "vol-b"]
+    assert {job["status"] for job in jobs} == {"queued"}
+    assert JobHandle.start_many(conn, job_type="watcher", targets=[]) == []
+
+    conn.close()
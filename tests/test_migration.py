@@ -1,6 +1,21 @@
+import sqlite3
+import threading
 from pathlib import Path
 
-from diskwatcher.db.migration import build_alembic_config
+import pytest
+
+from alembic import command
+from alembic.script import ScriptDirectory
+
+import diskwatcher.db.migration as migration_module
+from diskwatcher.db.bootstrap import bootstrap_if_empty
+from diskwatcher.db.migration import (
+    HEAD_REVISION,
+    SCHEMA_VERSION,
+    build_alembic_config,
+    optimize_database,
+    upgrade,
+)
 
 
 def test_build_alembic_config_sets_database_url(tmp_path):
@@ -17,3 +32,253 @@ script_location = migrations
 
     assert config.get_main_option("sqlalchemy.url") == "sqlite:///tmp/catalog.db"
     assert config.get_main_option("script_location") == "migrations"
+
+
+def _schema_shape(db_path):
+    conn = sqlite3.connect(str(db_path))
+    try:
+        tables = {}
+        for (name,) in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%'"
+        ):
+            tables[name] = sorted(
+                row[1] for row in conn.execute(f"PRAGMA table_info({name})")
+            )
+        indexes = sorted(
+            row[0]
+            for row in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index' AND sql IS NOT NULL"
+            )
+        )
+        version = conn.execute("SELECT version_num FROM alembic_version").fetchall()
+    finally:
+        conn.close()
+    return tables, indexes, version
+
+
+def test_head_revision_matches_script_directory():
+    config = build_alembic_config()
+    assert ScriptDirectory.from_config(config).get_current_head() == HEAD_REVISION
+
+
+def test_bootstrap_matches_full_migration_chain(tmp_path):
+    bootstrapped = tmp_path / "bootstrap.db"
+    migrated = tmp_path / "migrated.db"
+
+    upgrade(database_url=f"sqlite:///{bootstrapped}")
+    command.upgrade(build_alembic_config(database_url=f"sqlite:///{migrated}"), "head")
+
+    assert _schema_shape(bootstrapped) == _schema_shape(migrated)
+
+
+def test_bootstrap_skips_existing_catalog(tmp_path):
+    db_path = tmp_path / "catalog.db"
+    conn = sqlite3.connect(str(db_path))
+    conn.execute("CREATE TABLE unrelated (id INTEGER)")
+    conn.commit()
+    conn.close()
+
+    assert bootstrap_if_empty(db_path, HEAD_REVISION) is False
+
+
+@pytest.mark.skipif(
+    sqlite3.sqlite_version_info < (3, 37, 0), reason="STRICT tables need SQLite 3.37+"
+)
+def test_catalog_tables_are_strict(tmp_path):
+    bootstrapped = tmp_path / "bootstrap.db"
+    migrated = tmp_path / "migrated.db"
+
+    upgrade(database_url=f"sqlite:///{bootstrapped}")
+    command.upgrade(build_alembic_config(database_url=f"sqlite:///{migrated}"), "head")
+
+    for db_path in (bootstrapped, migrated):
+        conn = sqlite3.connect(str(db_path))
+        try:
+            strict = {
+                row[1]: row[5]
+                for row in conn.execute("PRAGMA table_list")
+                if row[1] in ("events", "volumes", "files", "jobs")
+            }
+            assert strict == {"events": 1, "volumes": 1, "files": 1, "jobs": 1}
+            with pytest.raises(sqlite3.IntegrityError):
+                conn.execute(
+                    "INSERT INTO files (volume_id, path, directory, size_bytes) "
+                    "VALUES ('vol', '/a', '/', 'large')"
+                )
+        finally:
+            conn.close()
+
+
+def _user_version(db_path):
+    conn = sqlite3.connect(str(db_path))
+    try:
+        return conn.execute("PRAGMA user_version").fetchone()[0]
+    finally:
+        conn.close()
+
+
+def test_user_version_tracks_head_revision(tmp_path):
+    bootstrapped = tmp_path / "bootstrap.db"
+    migrated = tmp_path / "migrated.db"
+    config = build_alembic_config(database_url=f"sqlite:///{migrated}")
+
+    upgrade(database_url=f"sqlite:///{bootstrapped}")
+    command.upgrade(config, "head")
+    assert _user_version(bootstrapped) == SCHEMA_VERSION
+    assert _user_version(migrated) == SCHEMA_VERSION
+
+    command.downgrade(config, "-1")
+    assert _user_version(migrated) == 0
+
+
+def test_upgrade_skips_alembic_when_user_version_current(tmp_path, monkeypatch):
+    db_path = tmp_path / "catalog.db"
+    upgrade(database_url=f"sqlite:///{db_path}")
+
+    def fail(*_args, **_kwargs):
+        raise AssertionError("alembic should not be consulted")
+
+    monkeypatch.setattr(migration_module, "build_alembic_config", fail)
+    upgrade(database_url=f"sqlite:///{db_path}")
+
+
+@pytest.mark.skipif(
+    sqlite3.sqlite_version_info < (3, 37, 0), reason="STRICT tables need SQLite 3.37+"
+)
+def test_strict_rewrite_nulls_non_integer_values_instead_of_zeroing(tmp_path):
+    db_path = tmp_path / "catalog.db"
+    config = build_alembic_config(database_url=f"sqlite:///{db_path}")
+    command.upgrade(config, "0013_files_without_rowid")
+
+    conn = sqlite3.connect(str(db_path))
+    conn.executemany(
+        "INSERT INTO files (volume_id, path, directory, size_bytes) "
+        "VALUES ('vol', ?, '/tmp', ?)",
+        [("/tmp/a", 7), ("/tmp/b", "large"), ("/tmp/c", 2.5)],
+    )
+    conn.commit()
+    conn.close()
+
+    command.upgrade(config, "0014_strict_tables")
+
+    conn = sqlite3.connect(str(db_path))
+    try:
+        rows = conn.execute(
+            "SELECT path, size_bytes FROM files ORDER BY path"
+        ).fetchall()
+    finally:
+        conn.close()
+
+    assert rows == [("/tmp/a", 7), ("/tmp/b", None), ("/tmp/c", None)]
+
+
+@pytest.mark.skipif(
+    sqlite3.sqlite_version_info < (3, 37, 0), reason="STRICT tables need SQLite 3.37+"
+)
+def test_strict_rewrite_refuses_non_integer_values_in_required_columns(tmp_path):
+    db_path = tmp_path / "catalog.db"
+    config = build_alembic_config(database_url=f"sqlite:///{db_path}")
+    command.upgrade(config, "0013_files_without_rowid")
+
+    conn = sqlite3.connect(str(db_path))
+    conn.execute(
+        "INSERT INTO files (volume_id, path, directory, is_deleted) "
+        "VALUES ('vol', '/tmp/a', '/tmp', 'maybe')"
+    )
+    conn.commit()
+    conn.close()
+
+    with pytest.raises(RuntimeError, match="files.is_deleted holds 1 non-integer"):
+        command.upgrade(config, "0014_strict_tables")
+
+
+def test_events_rewrite_preserves_rows(tmp_path):
+    db_path = tmp_path / "catalog.db"
+    config = build_alembic_config(database_url=f"sqlite:///{db_path}")
+    command.upgrade(config, "0010_events_volume_timestamp")
+
+    conn = sqlite3.connect(str(db_path))
+    conn.executemany(
+        "INSERT INTO events (timestamp, event_type, path, directory, volume_id) "
+        "VALUES (?, 'created', ?, '/tmp', 'vol')",
+        [("2025-01-01T00:00:00Z", "/tmp/a"), ("2025-01-02T00:00:00Z", "/tmp/b")],
+    )
+    conn.commit()
+    conn.close()
+
+    command.upgrade(config, "0011_events_rowid_primary_key")
+
+    conn = sqlite3.connect(str(db_path))
+    try:
+        table_sql = conn.execute(
+            "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'events'"
+        ).fetchone()[0]
+        rows = conn.execute("SELECT id, path FROM events ORDER BY id").fetchall()
+        indexes = {
+            row[0]
+            for row in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'events'"
+            )
+        }
+    finally:
+        conn.close()
+
+    assert "AUTOINCREMENT" not in table_sql.upper()
+    assert rows == [(1, "/tmp/a"), (2, "/tmp/b")]
+    assert {"idx_events_path", "idx_events_volume_ts", "idx_events_volume_path"} <= indexes
+
+    command.upgrade(config, "0012_events_timestamp_us")
+
+    conn = sqlite3.connect(str(db_path))
+    try:
+        backfilled = conn.execute("SELECT timestamp_us FROM events ORDER BY id").fetchall()
+    finally:
+        conn.close()
+
+    assert backfilled == [(1735689600000000,), (1735776000000000,)]
+
+
+def test_build_alembic_config_carries_execution_options(tmp_path):
+    config = build_alembic_config(
+        database_url=f"sqlite:///{tmp_path / 'catalog.db'}",
+        execution_options={"compiled_cache": {}},
+    )
+
+    assert config.attributes["execution_options"] == {"compiled_cache": {}}
+
+
+def test_optimize_database_runs_on_existing_catalog(monkeypatch, tmp_path):
+    db_path = tmp_path / "catalog.db"
+    optimize_database(f"sqlite:///{db_path}")
+    assert not db_path.exists()
+
+    limits = []
+    real_optimize = migration_module.optimize_connection
+
+    def _traced_optimize(conn):
+        real_optimize(conn)
+        limits.append(conn.execute("PRAGMA analysis_limit").fetchone()[0])
+
+    monkeypatch.setattr(migration_module, "optimize_connection", _traced_optimize)
+    upgrade(database_url=f"sqlite:///{db_path}")
+    optimize_database(f"sqlite:///{db_path}")
+    assert limits == [400]
+
+
+@pytest.mark.skipif(migration_module.fcntl is None, reason="flock unavailable")
+def test_upgrade_waits_for_migration_lock(tmp_path):
+    db_path = tmp_path / "catalog.db"
+    finished = threading.Event()
+
+    def _run_upgrade():
+        upgrade(database_url=f"sqlite:///{db_path}")
+        finished.set()
+
+    with migration_module._migration_lock(db_path):
+        worker = threading.Thread(target=_run_upgrade)
+        worker.start()
+        assert not finished.wait(0.3)
+
+    worker.join(timeout=30)
+    assert finished.is_set()
+    assert _schema_shape(db_path)[2] == [(HEAD_REVISION,)]
@@ -0,0 +1,50 @@
+from pathlib import Path
+
+from diskwatcher.utils import paths
+from diskwatcher.utils.paths import resolve_path
+
+
+def test_resolve_path_follows_symlinks_once(tmp_path, monkeypatch):
+    target = tmp_path / "disk"
+    target.mkdir()
+    link = tmp_path / "link"
+    link.symlink_to(target)
+    expected = target.resolve()
+
+    calls = []
+    original_resolve = Path.resolve
+
+    def counting_resolve(self, *args, **kwargs):
+        calls.append(self)
+        return original_resolve(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "resolve", counting_resolve)
+    paths._resolve.cache_clear()
+
+    assert resolve_path(link) == expected
+    assert resolve_path(str(link)) == expected
+    assert len(calls) == 1
+
+
+def test_resolve_path_tracks_working_directory_and_retargeted_links(
+    tmp_path, monkeypatch
+):
+    first = tmp_path / "first"
+    second = tmp_path / "second"
+    (first / "data").mkdir(parents=True)
+    (second / "data").mkdir(parents=True)
+    paths._resolve.cache_clear()
+
+    monkeypatch.chdir(first)
+    assert resolve_path("data") == (first / "data").resolve()
+    monkeypatch.chdir(second)
+    assert resolve_path("data") == (second / "data").resolve()
+
+    link = tmp_path / "link"
+    link.symlink_to(first)
+    assert resolve_path(link) == first.resolve()
+    link.unlink()
+    link.symlink_to(second)
+    assert resolve_path(link) == first.resolve()
+    paths.clear_resolve_cache()
+    assert resolve_path(link) == second.resolve()